@@ -1,15 +1,47 @@
 """ML Pipeline module for WinMix TipsterHub.
 
 This module contains machine learning pipeline components including
-the ensemble predictor system.
-"""
-
-from .ensemble_predictor import EnsemblePredictor, create_ensemble_predictor
+the auto reinforcement loop for model fine-tuning and the ensemble
+predictor system.
 
-__all__ = ["EnsemblePredictor", "create_ensemble_predictor"]
-"""
-ML Pipeline: Auto Reinforcement Loop for Model Fine-tuning
+Submodules and the names exported here are imported on first use, so
+importing the package (e.g. to run a small CLI such as
+``python -m ml_pipeline.manage_patterns``) does not load NumPy, pandas,
+scikit-learn or the Supabase SDK.
 """
 
+import importlib
+from typing import Any
+
 __version__ = "1.0.0"
-"""ML Pipeline module for WinMix TipsterHub."""
+
+# Exported name -> submodule defining it
+_LAZY_EXPORTS = {
+    "EnsembleBatchResult": "ensemble_results",
+    "EnsembleOrchestrator": "ensemble_orchestrator",
+    "EnsemblePredictor": "ensemble_predictor",
+    "EnsembleResult": "ensemble_results",
+    "create_ensemble_predictor": "ensemble_predictor",
+}
+
+__all__ = [
+    "EnsembleBatchResult",
+    "EnsembleOrchestrator",
+    "EnsemblePredictor",
+    "EnsembleResult",
+    "create_ensemble_predictor",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported names from their submodule on first access."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include the lazily imported exports."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,199 @@
+"""
+Model artifacts with memory-mapped numeric arrays
+
+Models are pickled with protocol 5, and every contiguous array of at least
+``mmap_threshold`` bytes is written out of band, uncompressed and 64-byte
+aligned, after the pickle stream:
+
+    MAGIC | pickle stream | array 1 | array 2 | ... | JSON footer | footer length
+
+``load_artifact`` maps the file once and rebuilds those arrays as views of the
+mapping instead of copies, so loading costs the (small) pickle stream only.
+With ``mmap_mode="r"`` every process loading the same artifact shares one
+page-cached copy of its arrays; ``"c"`` maps copy-on-write for callers that
+update the model in place (fine-tuning), which gets private copies of the
+pages it writes and leaves the file untouched. Arrays smaller than a page are
+kept in the pickle stream, since a mapping cannot share less than a page.
+
+Files without the magic prefix are loaded with joblib, so artifacts written
+before this format keep working.
+"""
+
+import json
+import logging
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_MAGIC = b"MLPART\x00\x01"
+FORMAT_VERSION = 1
+
+# Arrays below one page stay in the pickle stream
+DEFAULT_MMAP_THRESHOLD = mmap.PAGESIZE
+ALIGNMENT = 64
+
+MMAP_MODES = (None, "r", "c")
+_ACCESS = {"r": mmap.ACCESS_READ, "c": mmap.ACCESS_COPY}
+_FOOTER_LENGTH = struct.Struct("<Q")
+
+
+def save_artifact(model: Any, path: Union[str, Path], mmap_threshold: int = DEFAULT_MMAP_THRESHOLD) -> Dict[str, int]:
+    """
+    Write a model artifact atomically.
+
+    The file is written next to ``path`` and renamed over it, so processes
+    that still map the previous artifact keep a consistent (old) file.
+
+    Args:
+        model: Object to store (typically a fitted estimator)
+        path: Destination file
+        mmap_threshold: Minimum size in bytes of the arrays stored for mapping
+
+    Returns:
+        Dictionary with the artifact ``size``, the number of ``mapped_arrays``
+        and their ``mapped_bytes``
+    """
+    path = Path(path)
+    buffers: List[pickle.PickleBuffer] = []
+
+    def out_of_band(buffer: pickle.PickleBuffer) -> bool:
+        # Returning False stores the buffer out of band
+        if buffer.raw().nbytes < mmap_threshold:
+            return True
+        buffers.append(buffer)
+        return False
+
+    stream = pickle.dumps(model, protocol=5, buffer_callback=out_of_band)
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(ARTIFACT_MAGIC)
+            f.write(stream)
+            spans = []
+            for buffer in buffers:
+                raw = buffer.raw()
+                f.write(b"\0" * (-f.tell() % ALIGNMENT))
+                spans.append([f.tell(), raw.nbytes])
+                f.write(raw)
+            footer = json.dumps({
+                "format_version": FORMAT_VERSION,
+                "stream": [len(ARTIFACT_MAGIC), len(stream)],
+                "buffers": spans,
+            }).encode()
+            f.write(footer)
+            f.write(_FOOTER_LENGTH.pack(len(footer)))
+            size = f.tell()
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    mapped_bytes = sum(span[1] for span in spans)
+    logger.debug(f"Wrote {path} ({size} bytes, {len(spans)} mapped arrays, {mapped_bytes} mapped bytes)")
+    return {"size": size, "mapped_arrays": len(spans), "mapped_bytes": mapped_bytes}
+
+
+def is_artifact(path: Union[str, Path]) -> bool:
+    """Whether ``path`` is in the artifact format (and not a joblib/pickle file)."""
+    with open(path, "rb") as f:
+        return f.read(len(ARTIFACT_MAGIC)) == ARTIFACT_MAGIC
+
+
+def _read_footer(data: Union[mmap.mmap, bytearray]) -> Dict[str, Any]:
+    """Parse and check the footer of an artifact held in ``data``."""
+    end = len(data) - _FOOTER_LENGTH.size
+    if end < len(ARTIFACT_MAGIC):
+        raise ValueError("Truncated model artifact")
+    (length,) = _FOOTER_LENGTH.unpack(data[end:])
+    if length > end - len(ARTIFACT_MAGIC):
+        raise ValueError("Corrupt model artifact footer")
+    try:
+        footer = json.loads(bytes(data[end - length:end]))
+        version = footer["format_version"]
+        spans = [footer["stream"], *footer["buffers"]]
+    except (UnicodeDecodeError, ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Corrupt model artifact footer: {e}") from e
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported model artifact version: {version}")
+    if any(offset + size > end - length for offset, size in spans):
+        raise ValueError("Truncated model artifact")
+    return footer
+
+
+def load_artifact(path: Union[str, Path], mmap_mode: Optional[str] = "r") -> Any:
+    """
+    Load a model artifact.
+
+    Args:
+        path: Artifact file
+        mmap_mode: ``"r"`` maps the arrays read-only (shared between
+            processes), ``"c"`` maps them copy-on-write (writable, private
+            once written) and None reads the file into memory
+
+    Returns:
+        The stored object
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If mmap_mode is not supported or the artifact is corrupt
+    """
+    if mmap_mode not in MMAP_MODES:
+        raise ValueError(f"mmap_mode must be one of {MMAP_MODES}, got {mmap_mode!r}")
+
+    if not is_artifact(path):
+        import joblib
+
+        logger.debug(f"{path} is not in the artifact format; loading with joblib")
+        return joblib.load(path, mmap_mode=mmap_mode)
+
+    with open(path, "rb") as f:
+        if mmap_mode is None:
+            data = bytearray(os.fstat(f.fileno()).st_size)
+            f.readinto(data)
+        else:
+            # The mapping stays valid after the file is closed
+            data = mmap.mmap(f.fileno(), 0, access=_ACCESS[mmap_mode])
+
+    footer = _read_footer(data)
+    view = memoryview(data)
+    offset, size = footer["stream"]
+    buffers = [view[start:start + length] for start, length in footer["buffers"]]
+    # Loaded arrays reference the mapping, which is unmapped once they are freed
+    return pickle.loads(view[offset:offset + size], buffers=buffers)
+
+
+def artifact_info(path: Union[str, Path]) -> Dict[str, int]:
+    """
+    Describe a model artifact without loading it.
+
+    Args:
+        path: Artifact file
+
+    Returns:
+        Dictionary with ``format_version``, ``size``, ``mapped_arrays`` and
+        ``mapped_bytes``
+
+    Raises:
+        ValueError: If the file is not in the artifact format
+    """
+    if not is_artifact(path):
+        raise ValueError(f"{path} is not a model artifact")
+    with open(path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        footer = _read_footer(data)
+        return {
+            "format_version": footer["format_version"],
+            "size": len(data),
+            "mapped_arrays": len(footer["buffers"]),
+            "mapped_bytes": sum(length for _, length in footer["buffers"]),
+        }
+    finally:
+        data.close()
@@ -3,14 +3,15 @@
 Auto Reinforcement Loop - Automatic model fine-tuning based on prediction errors
 """
 
-import json
 import logging
+import multiprocessing
 import os
-import subprocess
+import signal
 import sys
 import traceback
 import uuid
 from datetime import datetime
+from multiprocessing.connection import Connection
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -18,9 +19,13 @@ from .config import (
     DEFAULT_FINE_TUNE_EPOCHS,
     DEFAULT_LEARNING_RATE,
     DEFAULT_LOOKBACK_DAYS,
+    ISOLATE_TRAINING,
     MIN_ERROR_SAMPLES_FOR_RETRAINING,
+    MODELS_DIR,
     RETRAINED_MODELS_DIR,
     TEMP_DIR,
+    TRAINING_TIMEOUT_SECONDS,
+    ensure_directories,
 )
 from .data_loader import prepare_retraining_data
 from .supabase_client import (
@@ -32,12 +37,8 @@ from .supabase_client import (
     update_retraining_run,
     upload_file_to_storage,
 )
+from .train_model import TrainingResult, train
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
@@ -46,92 +47,170 @@ class RetrainingError(Exception):
     pass
 
 
-def parse_training_output(output: str) -> Dict:
+def find_latest_model() -> Optional[str]:
     """
-    Parse training output to extract metrics
+    Find the most recently trained model to fine-tune
+    
+    Looks at retrained models and at models saved by train_model.py
+    (``<model_type>_<YYYYmmdd>_<HHMMSS>.pkl``) in the models directory.
+    ``train`` checks the model against the config before fine-tuning it and
+    trains a new model if its type or features no longer match.
     
-    Args:
-        output: Training script output
-        
     Returns:
-        Dictionary with metrics
+        Path to the newest model file or None if there is none
     """
+    candidates = list(RETRAINED_MODELS_DIR.rglob("*.pkl"))
+    candidates += list(MODELS_DIR.glob("*_[0-9]*_[0-9]*.pkl"))
+    if not candidates:
+        return None
+    return str(max(candidates, key=lambda path: path.stat().st_mtime))
+
+
+# Isolated runs fork where available so the child reuses the parent's imports;
+# elsewhere (macOS, Windows) fork is unsafe or missing and spawn is used
+ISOLATION_CONTEXT = multiprocessing.get_context(
+    "fork" if sys.platform.startswith("linux") else "spawn"
+)
+
+
+def _start_process_group(pid: int) -> None:
+    """Make ``pid`` the leader of a new process group (no-op where unsupported)."""
+    if hasattr(os, "setpgid"):
+        try:
+            os.setpgid(pid, pid)
+        except OSError:
+            # The child already did it, or has exited
+            pass
+
+
+def _signal_process_group(process: multiprocessing.Process, signum: int) -> None:
+    """Send ``signum`` to the isolated child and every process it started.
+
+    Worker pools of a hyperparameter search or cross-validation run in the
+    child's process group, so signalling the group stops them too instead of
+    orphaning them. Without process groups only the child is signalled.
+    """
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(process.pid, signum)
+            return
+        except (ProcessLookupError, PermissionError):
+            pass
+    if process.is_alive():
+        if signum == signal.SIGTERM:
+            process.terminate()
+        else:
+            process.kill()
+
+
+def _train_in_child(connection: Connection, kwargs: Dict) -> None:
+    """Run ``train`` in an isolated process and send the outcome to the parent."""
+    # Before any worker pool starts, so the pool joins the child's group
+    _start_process_group(0)
     try:
-        # Try to parse JSON output from the training script
-        lines = output.strip().split("\n")
-        for line in lines:
-            if line.strip().startswith("{"):
-                try:
-                    data = json.loads(line)
-                    if "metrics" in data:
-                        return data
-                except json.JSONDecodeError:
-                    pass
-        
-        # If no JSON found, return empty metrics
-        return {"metrics": {}}
+        connection.send(("ok", train(**kwargs)))
     except Exception as e:
-        logger.warning(f"Failed to parse training output: {e}")
-        return {"metrics": {}}
+        connection.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        connection.close()
+
+
+def _train_isolated(kwargs: Dict, timeout: float) -> Optional[TrainingResult]:
+    """
+    Run ``train`` in a child process, killing it after ``timeout`` seconds.
+
+    The child is started from ``ISOLATION_CONTEXT``. It is not daemonic, so
+    training can start its own worker pools (hyperparameter search,
+    cross-validation). It leads its own process group, and when it overruns
+    the parent terminates the whole group, pool workers included.
+    """
+    receiver, sender = ISOLATION_CONTEXT.Pipe(duplex=False)
+    process = ISOLATION_CONTEXT.Process(target=_train_in_child, args=(sender, kwargs))
+    process.start()
+    # Also set from the parent so the group exists before a timeout can fire
+    _start_process_group(process.pid)
+    sender.close()
+
+    try:
+        if not receiver.poll(timeout):
+            logger.error(f"Training timed out after {timeout}s")
+            _signal_process_group(process, signal.SIGTERM)
+            return None
+        status, payload = receiver.recv()
+    except EOFError:
+        process.join()
+        logger.error(f"Training process exited with code {process.exitcode} without a result")
+        return None
+    finally:
+        process.join(timeout=5)
+        if process.is_alive():
+            _signal_process_group(process, getattr(signal, "SIGKILL", signal.SIGTERM))
+            process.join()
+        receiver.close()
 
+    if status != "ok":
+        logger.error(f"Training failed: {payload}")
+        return None
+    return payload
 
-def run_training(dataset_path: str, output_dir: str, fine_tune: bool = True, epochs: int = 5) -> Optional[Dict]:
+
+def run_training(
+    dataset_path: str,
+    output_dir: str,
+    fine_tune: bool = True,
+    epochs: int = 5,
+    model_path: Optional[str] = None,
+    config: str = "model_config.yaml",
+    isolate: bool = False,
+    timeout: float = TRAINING_TIMEOUT_SECONDS,
+    skip_if_up_to_date: bool = False,
+) -> Optional[TrainingResult]:
     """
-    Run the training script
+    Run model training
+    
+    Training runs in this process by default, so it shares the already
+    imported libraries and loaded state. With ``isolate`` it runs in a child
+    process that is killed after ``timeout`` seconds.
     
     Args:
         dataset_path: Path to the fine-tuning dataset
         output_dir: Directory to save the trained model
         fine_tune: Whether to fine-tune or train from scratch
-        epochs: Number of training epochs
+        epochs: Fine-tuning epochs (see ``ModelTrainer.fine_tune``)
+        model_path: Existing model to continue training when fine-tuning
+        config: Path to the model configuration YAML
+        isolate: Run training in a separate process
+        timeout: Seconds before an isolated run is killed
+        skip_if_up_to_date: Reuse ``model_path`` without training if an
+            earlier run produced it from the same dataset (see ``train``)
         
     Returns:
-        Training output parsed as dictionary or None if failed
+        TrainingResult or None if training failed
     """
-    try:
-        # Determine the script path
-        script_path = Path(__file__).parent / "train_model.py"
-        
-        # Build command
-        cmd = [
-            sys.executable,
-            str(script_path),
-            "--dataset", dataset_path,
-            "--output_dir", output_dir,
-            "--fine_tune", str(fine_tune),
-            "--epochs", str(epochs),
-            "--learning_rate", str(DEFAULT_LEARNING_RATE),
-        ]
-        
-        logger.info(f"Running training: {' '.join(cmd)}")
-        
-        # Run training
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5 minutes timeout
-        )
-        
-        if result.returncode != 0:
-            logger.error(f"Training failed with return code {result.returncode}")
-            logger.error(f"STDOUT: {result.stdout}")
-            logger.error(f"STDERR: {result.stderr}")
-            return None
-        
+    kwargs = {
+        "dataset": dataset_path,
+        "config": config,
+        "output_dir": output_dir,
+        "fine_tune": fine_tune,
+        "epochs": epochs,
+        "learning_rate": DEFAULT_LEARNING_RATE,
+        "model_path": model_path if fine_tune else None,
+        "skip_if_up_to_date": skip_if_up_to_date,
+    }
+    logger.info(f"Running training{' in an isolated process' if isolate else ''}: {kwargs}")
+
+    if isolate:
+        result = _train_isolated(kwargs, timeout)
+    else:
+        try:
+            result = train(**kwargs)
+        except Exception as e:
+            logger.error(f"Training failed: {e}")
+            result = None
+
+    if result is not None:
         logger.info("Training completed successfully")
-        logger.info(f"STDOUT: {result.stdout}")
-        
-        # Parse output
-        output = parse_training_output(result.stdout)
-        return output
-        
-    except subprocess.TimeoutExpired:
-        logger.error("Training script timed out")
-        return None
-    except Exception as e:
-        logger.error(f"Failed to run training: {e}")
-        return None
+    return result
 
 
 def upload_logs_to_storage(logs_content: str, run_id: str) -> str:
@@ -193,7 +272,12 @@ def process_manual_requests() -> Optional[str]:
     return request_id
 
 
-def run_auto_reinforcement(lookback_days: int = DEFAULT_LOOKBACK_DAYS, source: str = "auto_daily", request_id: Optional[str] = None) -> bool:
+def run_auto_reinforcement(
+    lookback_days: int = DEFAULT_LOOKBACK_DAYS,
+    source: str = "auto_daily",
+    request_id: Optional[str] = None,
+    isolate_training: bool = ISOLATE_TRAINING,
+) -> bool:
     """
     Run the auto reinforcement loop
     
@@ -201,6 +285,7 @@ def run_auto_reinforcement(lookback_days: int = DEFAULT_LOOKBACK_DAYS, source: s
         lookback_days: Number of days to look back for errors
         source: Source of the retraining trigger
         request_id: Optional request ID if triggered by manual request
+        isolate_training: Train in a separate process with a timeout
         
     Returns:
         True if successful, False otherwise
@@ -306,37 +391,49 @@ def run_auto_reinforcement(lookback_days: int = DEFAULT_LOOKBACK_DAYS, source: s
         output_dir = str(RETRAINED_MODELS_DIR / run_id)
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         
+        # Continue from the newest model so the run only costs the new error samples;
+        # if that model was itself fine-tuned on this same dataset, it is reused as is
+        base_model_path = find_latest_model()
+        
         # Run training
-        logger.info("Running model fine-tuning...")
-        training_output = run_training(
+        logger.info(f"Running model fine-tuning from {base_model_path or 'scratch'}...")
+        training_result = run_training(
             dataset_path,
             output_dir,
             fine_tune=True,
             epochs=DEFAULT_FINE_TUNE_EPOCHS,
+            model_path=base_model_path,
+            isolate=isolate_training,
+            skip_if_up_to_date=True,
         )
         
-        if training_output is None:
-            raise RetrainingError("Training script failed")
+        if training_result is None:
+            raise RetrainingError("Training failed")
         
-        logger.info(f"Training output: {training_output}")
+        logger.info(f"Training result: {training_result.to_dict()}")
         
         # Extract metrics
-        metrics = training_output.get("metrics", {})
-        model_path = training_output.get("model_path", "")
+        metrics = training_result.metrics
+        model_path = training_result.model_path
+        cache_hit = training_result.cache_hit
         
         logger.info(f"Training metrics: {metrics}")
-        logger.info(f"Model saved to: {model_path}")
+        if cache_hit:
+            logger.info(f"Inputs unchanged; reused cached model: {model_path}")
+        else:
+            logger.info(f"Model saved to: {model_path}")
         
         # Log training success
         insert_system_log(
             component="auto_reinforcement",
             status="info",
-            message="Training completed successfully",
+            message="Training skipped: reused cached model" if cache_hit else "Training completed successfully",
             details={
                 "run_id": run_id,
                 "metrics": metrics,
                 "model_path": model_path,
                 "dataset_size": error_count,
+                "cache_hit": cache_hit,
             }
         )
         
@@ -402,6 +499,12 @@ def run_auto_reinforcement(lookback_days: int = DEFAULT_LOOKBACK_DAYS, source: s
 
 def main():
     """Main entry point for auto reinforcement"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    ensure_directories()
+    
     try:
         # First, check if there are any manual retraining requests to process
         manual_request_id = process_manual_requests()
@@ -0,0 +1 @@
+"""Micro-benchmarks for ML Pipeline components"""
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Artifact load benchmark - load time and memory of model artifacts across workers
+
+Each model is fitted on synthetic data and written both as a plain joblib
+pickle and as a memory-mapped artifact. For every format a group of worker
+processes loads the file at the same time; each reports its load time and,
+once all workers hold the model, how much private memory the load added and
+its proportional set size (PSS: shared pages are split between the processes
+mapping them). Memory columns need Linux (``/proc/self/smaps_rollup``).
+
+Usage:
+    python -m ml_pipeline.benchmarks.artifact_load --workers 4 --models RandomForest HistGradientBoosting
+"""
+
+import argparse
+import multiprocessing
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..artifacts import load_artifact, save_artifact
+
+# Models (module:class, hyperparameters) fitted on the synthetic 3-class data
+MODELS = {
+    "RandomForest": ("sklearn.ensemble:RandomForestClassifier", {"n_estimators": 200}),
+    "HistGradientBoosting": (
+        "sklearn.ensemble:HistGradientBoostingClassifier",
+        {"max_iter": 300, "max_leaf_nodes": 127, "early_stopping": False},
+    ),
+    "LogisticRegression": ("sklearn.linear_model:LogisticRegression", {"max_iter": 20}),
+}
+N_ROWS = 20_000
+N_FEATURES = 50
+
+FORMATS = ("joblib", "artifact r", "artifact c")
+
+_SMAPS = Path("/proc/self/smaps_rollup")
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark model artifact loading across worker processes")
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes loading the model concurrently")
+    parser.add_argument("--models", nargs="+", default=list(MODELS), choices=list(MODELS), help="Models to benchmark")
+    return parser.parse_args()
+
+
+def memory_kb() -> Optional[Dict[str, int]]:
+    """Private and proportional memory of this process in kB (None off Linux)."""
+    if not _SMAPS.exists():
+        return None
+    fields = {}
+    for line in _SMAPS.read_text().splitlines()[1:]:
+        name, value = line.split(":", 1)
+        fields[name] = int(value.split()[0])
+    return {"private": fields["Private_Clean"] + fields["Private_Dirty"], "pss": fields["Pss"]}
+
+
+def _worker(path: str, fmt: str, module: str, barrier, results) -> None:
+    """Load the model, wait for the other workers and report time and memory."""
+    import importlib
+
+    import joblib
+
+    # Import time is not load time
+    importlib.import_module(module)
+    before = memory_kb()
+    start = time.perf_counter()
+    if fmt == "joblib":
+        model = joblib.load(path)
+    else:
+        model = load_artifact(path, mmap_mode=fmt.split()[1])
+    load_ms = (time.perf_counter() - start) * 1000
+
+    # Touch every mapped page, as serving predictions would
+    model.predict(np.zeros((1, N_FEATURES)))
+    barrier.wait()
+    after = memory_kb()
+    result = {"load_ms": load_ms}
+    if before and after:
+        result.update({name: (after[name] - before[name]) / 1024 for name in ("private", "pss")})
+    results.put(result)
+    barrier.wait()
+
+
+def run_workers(path: str, fmt: str, module: str, n_workers: int) -> List[Dict[str, float]]:
+    """Load one file in n_workers fresh processes at the same time."""
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(n_workers)
+    results = context.Queue()
+    workers = [
+        context.Process(target=_worker, args=(path, fmt, module, barrier, results)) for _ in range(n_workers)
+    ]
+    for worker in workers:
+        worker.start()
+    collected = [results.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+    return collected
+
+
+def fit_model(name: str):
+    """Fit a benchmark model on synthetic data."""
+    import importlib
+
+    target, params = MODELS[name]
+    module, cls = target.split(":")
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((N_ROWS, N_FEATURES))
+    y = np.digitize(X[:, 0] + X[:, 1] + rng.standard_normal(N_ROWS), [-0.5, 0.5])
+    return getattr(importlib.import_module(module), cls)(**params).fit(X, y)
+
+
+def main() -> int:
+    """Run the benchmark and print a small report."""
+    import joblib
+
+    args = parse_arguments()
+
+    print(f"{args.workers} workers per format; memory is the increase per worker after loading")
+    print()
+    print(f"{'model':<22} {'format':<12} {'file MB':>8} {'load ms':>8} {'private MB':>11} {'PSS MB':>8}")
+    print("-" * 74)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name in args.models:
+            model = fit_model(name)
+            paths = {"joblib": Path(tmpdir) / f"{name}.joblib", "artifact": Path(tmpdir) / f"{name}.pkl"}
+            joblib.dump(model, paths["joblib"])
+            save_artifact(model, paths["artifact"])
+            del model
+
+            for fmt in FORMATS:
+                path = paths[fmt.split()[0]]
+                results = run_workers(str(path), fmt, MODELS[name][0].split(":")[0], args.workers)
+                load_ms = statistics.median(result["load_ms"] for result in results)
+                private = pss = "-"
+                if "pss" in results[0]:
+                    private = f"{statistics.median(result['private'] for result in results):.1f}"
+                    pss = f"{statistics.median(result['pss'] for result in results):.1f}"
+                print(
+                    f"{name:<22} {fmt:<12} {path.stat().st_size / 2 ** 20:>8.1f} {load_ms:>8.1f} "
+                    f"{private:>11} {pss:>8}"
+                )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
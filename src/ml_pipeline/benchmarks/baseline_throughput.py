@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Baseline model throughput benchmark - rows/second of BaselineScorelineModel scoring
+
+Compares the per-row reference path with the vectorized predict_proba_array
+from 1e3 to 1e7 rows. The per-row path is only timed up to --max_reference_rows
+because it takes minutes beyond that.
+
+Usage:
+    python -m ml_pipeline.benchmarks.baseline_throughput --sizes 1000 100000 10000000
+"""
+
+import argparse
+import sys
+import time
+from typing import Callable
+
+import numpy as np
+
+from models.baseline_model_artifact import BaselineScorelineModel
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark BaselineScorelineModel throughput")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000, 1_000_000, 10_000_000],
+        help="Row counts to score",
+    )
+    parser.add_argument("--features", type=int, default=4, help="Features per row")
+    parser.add_argument("--max_reference_rows", type=int, default=100_000, help="Largest size timed per row")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best is reported)")
+    return parser.parse_args()
+
+
+def best_seconds(func: Callable[[], object], repeat: int) -> float:
+    """Return the best wall time of ``repeat`` calls."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def reference_proba(model: BaselineScorelineModel, rows: list) -> list:
+    """The original per-row, per-class scoring loop."""
+    probabilities = []
+    for row in rows:
+        class_scores = [model._score(row, idx) for idx in range(len(model.classes_))]
+        total = sum(class_scores)
+        probabilities.append([score / total for score in class_scores])
+    return probabilities
+
+
+def main() -> int:
+    """Run the benchmark and print a small report."""
+    args = parse_arguments()
+    model = BaselineScorelineModel()
+    rng = np.random.default_rng(0)
+
+    print(f"{'rows':>10} {'per-row rows/s':>16} {'vectorized rows/s':>19} {'speedup':>9} {'identical':>10}")
+    print("-" * 68)
+    for n_rows in args.sizes:
+        features = rng.standard_normal((n_rows, args.features))
+        vectorized = best_seconds(lambda: model.predict_proba_array(features), args.repeat)
+
+        reference_rate = speedup = identical = "-"
+        if n_rows <= args.max_reference_rows:
+            rows = features.tolist()
+            reference = best_seconds(lambda: reference_proba(model, rows), 1)
+            reference_rate = f"{n_rows / reference:,.0f}"
+            speedup = f"{reference / vectorized:.1f}x"
+            identical = str(np.array_equal(np.array(reference_proba(model, rows)), model.predict_proba_array(features)))
+
+        print(f"{n_rows:>10} {reference_rate:>16} {n_rows / vectorized:>19,.0f} {speedup:>9} {identical:>10}")
+        del features
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
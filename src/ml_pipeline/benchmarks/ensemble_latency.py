@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Ensemble latency benchmark - per-call cost of the EnsemblePredictor entry points
+
+The first row is the original per-call path, which rebuilt and normalized a
+dict of weights on every call; it is the reference for the entry points that
+use the precompiled weight tables.
+
+Usage:
+    python -m ml_pipeline.benchmarks.ensemble_latency --calls 200000
+"""
+
+import argparse
+import logging
+import sys
+import timeit
+
+import numpy as np
+
+from ..ensemble_predictor import EnsemblePredictor
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark EnsemblePredictor per-call latency")
+    parser.add_argument("--calls", type=int, default=200000, help="Calls per scalar measurement")
+    parser.add_argument("--batch_size", type=int, default=100000, help="Rows per batch measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions (best is reported)")
+    return parser.parse_args()
+
+
+def best_per_call_us(func, calls: int, repeat: int) -> float:
+    """Return the best observed per-call time in microseconds."""
+    return min(timeit.repeat(func, number=calls, repeat=repeat)) / calls * 1e6
+
+
+def reference_predict(
+    weights: dict,
+    full_time_prediction=None,
+    full_time_confidence=None,
+    half_time_prediction=None,
+    half_time_confidence=None,
+    pattern_prediction=None,
+    pattern_confidence=None,
+) -> dict:
+    """The original predict: weights normalized through dicts on every call."""
+    models = []
+    if full_time_prediction is not None and full_time_confidence is not None:
+        models.append(("full_time", full_time_prediction, full_time_confidence, "ft"))
+    if half_time_prediction is not None and half_time_confidence is not None:
+        models.append(("half_time", half_time_prediction, half_time_confidence, "ht"))
+    if pattern_prediction is not None and pattern_confidence is not None:
+        models.append(("pattern", pattern_prediction, pattern_confidence, "pt"))
+    if not models:
+        raise ValueError("At least one sub-model prediction must be provided")
+
+    total_weight = sum(weights[weight_key] for _, _, _, weight_key in models)
+    if total_weight == 0:
+        raise ValueError("Total weight of active models is zero")
+    normalized_weights = {}
+    for _, _, _, weight_key in models:
+        normalized_weights[weight_key] = weights[weight_key] / total_weight
+
+    scores = {"HOME": 0.0, "DRAW": 0.0, "AWAY": 0.0}
+    votes = {}
+    for model_name, prediction, confidence, weight_key in models:
+        if not (0.0 <= confidence <= 1.0):
+            raise ValueError(f"{model_name} confidence must be in range [0, 1], got {confidence}")
+        outcome = prediction.upper()
+        outcome = {"HOME_WIN": "HOME", "AWAY_WIN": "AWAY"}.get(outcome, outcome)
+        if outcome not in scores:
+            raise ValueError(f"Invalid outcome: {prediction}")
+        scores[outcome] += confidence * normalized_weights[weight_key]
+        votes[model_name] = {"prediction": prediction, "confidence": confidence}
+
+    winner, final_confidence = max(scores.items(), key=lambda x: x[1])
+    sorted_scores = sorted(scores.values(), reverse=True)
+    conflict_margin = sorted_scores[0] - sorted_scores[1]
+    return {
+        "weights_used": {key: normalized_weights.get(key, 0.0) for key in ("ft", "ht", "pt")},
+        "votes": votes,
+        "scores": scores,
+        "winner": {"HOME": "home_win", "DRAW": "draw", "AWAY": "away_win"}[winner],
+        "final_confidence": round(final_confidence, 4),
+        "conflict_detected": conflict_margin < EnsemblePredictor.CONFLICT_THRESHOLD,
+        "conflict_margin": round(conflict_margin, 4),
+    }
+
+
+def main() -> int:
+    """Run the benchmark and print a small report."""
+    args = parse_arguments()
+    # Measure the prediction work, not the log handlers
+    logging.disable(logging.INFO)
+
+    predictor = EnsemblePredictor()
+    cached_predictor = EnsemblePredictor(cache_size=1024)
+
+    weights = dict(predictor.weights)
+    results = {
+        "reference (dict weights per call)": best_per_call_us(
+            lambda: reference_predict(weights, "HOME", 0.8, "DRAW", 0.6, "home_win", 0.7),
+            args.calls, args.repeat,
+        ),
+        "predict (labels, validated)": best_per_call_us(
+            lambda: predictor.predict("HOME", 0.8, "DRAW", 0.6, "home_win", 0.7),
+            args.calls, args.repeat,
+        ),
+        "predict (FT only)": best_per_call_us(
+            lambda: predictor.predict(full_time_prediction="AWAY", full_time_confidence=0.55),
+            args.calls, args.repeat,
+        ),
+        "predict (cache hit)": best_per_call_us(
+            lambda: cached_predictor.predict("HOME", 0.8, "DRAW", 0.6, "home_win", 0.7),
+            args.calls, args.repeat,
+        ),
+        "predict_trusted (codes)": best_per_call_us(
+            lambda: predictor.predict_trusted((0, 1, 0), (0.8, 0.6, 0.7)),
+            args.calls, args.repeat,
+        ),
+    }
+
+    rng = np.random.default_rng(0)
+    labels = np.array(["HOME", "DRAW", "AWAY"], dtype=object)
+    columns = {}
+    for model_name in ("full_time", "half_time", "pattern"):
+        columns[f"{model_name}_prediction"] = labels[rng.integers(0, 3, args.batch_size)]
+        columns[f"{model_name}_confidence"] = rng.random(args.batch_size)
+    batch_seconds = min(timeit.repeat(lambda: predictor.predict_batch(**columns), number=1, repeat=args.repeat))
+    results[f"predict_batch (per row, n={args.batch_size})"] = batch_seconds / args.batch_size * 1e6
+
+    reference = results["reference (dict weights per call)"]
+    expected = reference_predict(weights, "HOME", 0.8, "DRAW", 0.6, "home_win", 0.7)
+    result = predictor.predict("HOME", 0.8, "DRAW", 0.6, "home_win", 0.7)
+    identical = all(
+        result[name] == expected[name]
+        for name in ("winner", "final_confidence", "conflict_detected", "conflict_margin")
+    )
+
+    print(f"{'entry point':<45} {'us/call':>10} {'speedup':>9}")
+    print("-" * 66)
+    for name, micros in results.items():
+        print(f"{name:<45} {micros:>10.3f} {reference / micros:>8.1f}x")
+    print()
+    print(f"predict matches the reference: {identical}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Ensemble memory benchmark - bytes retained per stored prediction
+
+Compares holding many results as historical nested dicts, as slotted
+EnsembleResult objects and as one columnar EnsembleBatchResult.
+
+Usage:
+    python -m ml_pipeline.benchmarks.ensemble_memory --results 100000
+"""
+
+import argparse
+import gc
+import logging
+import sys
+import tracemalloc
+from typing import Any, Callable
+
+import numpy as np
+
+from ..ensemble_predictor import EnsemblePredictor
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark EnsemblePredictor result memory")
+    parser.add_argument("--results", type=int, default=100000, help="Number of results to retain")
+    return parser.parse_args()
+
+
+def retained_bytes(build: Callable[[], Any]) -> int:
+    """Return the bytes still allocated after ``build`` while its result is alive."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return current
+
+
+def main() -> int:
+    """Run the benchmark and print a small report."""
+    args = parse_arguments()
+    logging.disable(logging.INFO)
+
+    predictor = EnsemblePredictor()
+    rng = np.random.default_rng(0)
+    codes = rng.integers(0, 3, (args.results, 3)).tolist()
+    confidences = rng.random((args.results, 3)).tolist()
+    labels = np.array(["HOME", "DRAW", "AWAY"], dtype=object)
+    columns = {}
+    for col, model_name in enumerate(("full_time", "half_time", "pattern")):
+        columns[f"{model_name}_prediction"] = labels[np.array(codes)[:, col]]
+        columns[f"{model_name}_confidence"] = np.array(confidences)[:, col]
+
+    results = {
+        "nested dicts (to_dict)": retained_bytes(
+            lambda: [predictor.predict_trusted(c, p).to_dict() for c, p in zip(codes, confidences)]
+        ),
+        "EnsembleResult (slots)": retained_bytes(
+            lambda: [predictor.predict_trusted(c, p) for c, p in zip(codes, confidences)]
+        ),
+        "EnsembleBatchResult (columnar)": retained_bytes(lambda: predictor.predict_batch(**columns)),
+    }
+
+    print(f"{'representation':<35} {'bytes/result':>14}")
+    print("-" * 50)
+    for name, total in results.items():
+        print(f"{name:<35} {total / args.results:>14.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark - cold-start cost of each ml_pipeline entry point
+
+Every measurement runs in a fresh interpreter, so nothing is shared with
+earlier runs beyond the OS file cache. The bare interpreter start-up is
+measured the same way and reported separately, leaving the package's own
+import cost in the "import ms" column. The last column lists the heavy
+third-party libraries each import pulled in.
+
+Usage:
+    python -m ml_pipeline.benchmarks.import_time --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Modules run as CLIs or imported by cron jobs
+ENTRY_POINTS = (
+    "ml_pipeline",
+    "ml_pipeline.config",
+    "ml_pipeline.manage_patterns",
+    "ml_pipeline.rare_pattern_finder",
+    "ml_pipeline.ensemble_tuner",
+    "ml_pipeline.train_model",
+    "ml_pipeline.auto_reinforcement",
+)
+
+# Third-party libraries worth reporting when an import loads them
+HEAVY_MODULES = ("numpy", "pandas", "scipy", "sklearn", "joblib", "yaml", "supabase", "aiohttp")
+
+_PROBE = (
+    "import importlib, json, sys\n"
+    "module = sys.argv[1]\n"
+    "if module:\n"
+    "    importlib.import_module(module)\n"
+    "print(json.dumps(sorted(name for name in sys.argv[2:] if name in sys.modules)))\n"
+)
+
+# Directory containing the ml_pipeline package
+SRC_DIR = Path(__file__).resolve().parents[2]
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark cold-start import time of ml_pipeline entry points")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per entry point (best is reported)")
+    parser.add_argument("--modules", nargs="+", default=list(ENTRY_POINTS), help="Modules to import")
+    return parser.parse_args()
+
+
+def time_import(module: str, repeat: int) -> Dict[str, object]:
+    """
+    Import a module in fresh interpreters.
+
+    Args:
+        module: Module to import ("" for the bare interpreter)
+        repeat: Number of interpreters to start
+
+    Returns:
+        Dictionary with the best and median wall time in ms and the heavy
+        modules loaded by the import
+    """
+    timings: List[float] = []
+    loaded: List[str] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-c", _PROBE, module, *HEAVY_MODULES],
+            cwd=SRC_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+        loaded = json.loads(completed.stdout)
+    return {"best_ms": min(timings), "median_ms": statistics.median(timings), "loaded": loaded}
+
+
+def main() -> int:
+    """Run the benchmark and print a small report."""
+    args = parse_arguments()
+
+    interpreter = time_import("", args.repeat)
+    print(f"interpreter start-up: {interpreter['best_ms']:.1f} ms (best of {args.repeat})")
+    print()
+    print(f"{'entry point':<35} {'best ms':>9} {'median ms':>10} {'import ms':>10}  heavy modules")
+    print("-" * 100)
+    for module in args.modules:
+        try:
+            result = time_import(module, args.repeat)
+        except subprocess.CalledProcessError as e:
+            print(f"{module:<35} failed: {e.stderr.strip().splitlines()[-1] if e.stderr else e}")
+            continue
+        own_ms = result["best_ms"] - interpreter["best_ms"]
+        print(
+            f"{module:<35} {result['best_ms']:>9.1f} {result['median_ms']:>10.1f} {own_ms:>10.1f}  "
+            f"{', '.join(result['loaded']) or '-'}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
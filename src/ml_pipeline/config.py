@@ -20,18 +20,35 @@ MIN_ERROR_SAMPLES_FOR_RETRAINING = 10
 ERROR_CONFIDENCE_THRESHOLD = 0.7
 DEFAULT_FINE_TUNE_EPOCHS = 5
 DEFAULT_LEARNING_RATE = 0.001
+TRAINING_TIMEOUT_SECONDS = 300
 
 # Paths
 ML_PIPELINE_DIR = Path(__file__).parent
 PROJECT_ROOT = ML_PIPELINE_DIR.parent
 MODELS_DIR = PROJECT_ROOT / "models"
 RETRAINED_MODELS_DIR = MODELS_DIR / "retrained"
+TRAINING_CACHE_DIR = MODELS_DIR / "cache"
 TEMP_DIR = Path("/tmp")
+# Local copy of the evaluation log, updated with the rows appended since the last sync;
+# set to an empty string on ephemeral runners to read the log from Storage into memory
+_evaluation_log_cache_dir = os.getenv("EVALUATION_LOG_CACHE_DIR", str(PROJECT_ROOT / ".cache" / "evaluation_log"))
+EVALUATION_LOG_CACHE_DIR = Path(_evaluation_log_cache_dir) if _evaluation_log_cache_dir else None
 
-# Create directories if they don't exist
-MODELS_DIR.mkdir(parents=True, exist_ok=True)
-RETRAINED_MODELS_DIR.mkdir(parents=True, exist_ok=True)
+# Storage downloads
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Downloads parsed in memory spill to an (always deleted) temp file above this size
+DOWNLOAD_SPILL_BYTES = 64 * 1024 * 1024
 
 # Environment
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+# Run training in a separate, killable process instead of in-process
+ISOLATE_TRAINING = os.getenv("ISOLATE_TRAINING", "false").lower() == "true"
+
+
+def ensure_directories() -> None:
+    """Create the model output directories if they don't exist."""
+    # Called by the entry points that write models rather than at import,
+    # so reading this module stays free of filesystem side effects
+    MODELS_DIR.mkdir(parents=True, exist_ok=True)
+    RETRAINED_MODELS_DIR.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,149 @@
+"""
+Stratified k-fold cross-validation for ModelTrainer with folds fitted in parallel
+
+Every fold is fitted in its own worker process. X, y and the fold assignment
+are shared read-only with the workers through memory-mapped files (see
+``shared_arrays``), and the final model is refit on all data in the parent
+process while the folds run, so on a machine with more than ``n_folds`` cores
+the wall time stays close to a single fit. The refit gets the same share of
+the cores as each fold worker, so it does not oversubscribe the machine.
+"""
+
+import logging
+import pickle
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import StratifiedKFold
+
+from .shared_arrays import (
+    cap_estimator_threads,
+    float_matrix,
+    get_shared_arrays,
+    limit_threads,
+    resolve_workers,
+    shared_array_executor,
+    worker_threads,
+)
+from .train_model import ModelTrainer, compute_metrics
+
+logger = logging.getLogger(__name__)
+
+
+def _evaluate_fold(task: Tuple[int, bytes, Optional[list], np.ndarray, bool, int, Optional[float]]) -> Dict[str, Any]:
+    """Fit a copy of the model on all folds but one and score it on the held-out fold."""
+    fold, model_bytes, columns, classes, fine_tune, epochs, learning_rate = task
+    shared = get_shared_arrays()
+    start = time.perf_counter()
+
+    test_mask = shared["folds"] == fold
+    X_train, X_test = shared["X"][~test_mask], shared["X"][test_mask]
+    if columns is not None:
+        # Keep feature names so models fitted on DataFrames do not warn
+        X_train = pd.DataFrame(X_train, columns=columns)
+        X_test = pd.DataFrame(X_test, columns=columns)
+    y_train, y_test = classes[shared["y"][~test_mask]], classes[shared["y"][test_mask]]
+
+    trainer = ModelTrainer()
+    trainer.model = cap_estimator_threads(pickle.loads(model_bytes))
+    trainer.fit_model(X_train, y_train, fine_tune=fine_tune, epochs=epochs, learning_rate=learning_rate)
+
+    return {
+        "fold": fold,
+        "train_size": int(len(y_train)),
+        "test_size": int(len(y_test)),
+        "metrics": compute_metrics(y_test, trainer.model.predict(X_test)),
+        "fit_seconds": round(time.perf_counter() - start, 4),
+    }
+
+
+def summarize_folds(fold_results: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """
+    Aggregate per-fold metrics.
+
+    Args:
+        fold_results: Results of ``_evaluate_fold``, one per fold
+
+    Returns:
+        Dictionary with the ``mean`` and (population) ``std`` of every metric
+    """
+    names = list(fold_results[0]["metrics"])
+    values = np.array([[result["metrics"][name] for name in names] for result in fold_results])
+    return {
+        "mean": dict(zip(names, values.mean(axis=0).tolist())),
+        "std": dict(zip(names, values.std(axis=0).tolist())),
+    }
+
+
+def cross_validate(
+    model: Any,
+    X: Any,
+    y: Any,
+    n_folds: int = 5,
+    random_seed: int = 42,
+    fine_tune: bool = False,
+    epochs: int = 1,
+    learning_rate: Optional[float] = None,
+    n_jobs: Optional[int] = None,
+    refit: Optional[Callable[[], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Evaluate a model with stratified k-fold cross-validation.
+
+    Each fold fits a copy of ``model`` as it is when this function is called,
+    so the caller may refit the original in ``refit`` while the folds run.
+
+    Args:
+        model: Estimator to evaluate (fitted when fine-tuning)
+        X: Feature matrix (numeric)
+        y: Target vector
+        n_folds: Number of folds (at least 2)
+        random_seed: Seed for shuffling samples into folds
+        fine_tune: Fine-tune copies of the model instead of fitting from scratch
+        epochs: Fine-tuning epochs on each training split (see
+            ``ModelTrainer.fine_tune`` for their per-estimator meaning)
+        learning_rate: Optional step size when fine-tuning
+        n_jobs: Worker processes (default: all cores; 1 runs in-process)
+        refit: Optional callback run in the calling process while the folds
+            run, with the thread budget of one fold worker
+
+    Returns:
+        Dictionary with n_folds, per-fold results and the mean and std of
+        every metric
+
+    Raises:
+        ValueError: If n_folds is below 2 or exceeds the size of every class
+    """
+    if n_folds < 2:
+        raise ValueError(f"n_folds must be at least 2, got {n_folds}")
+
+    classes, y_codes = np.unique(np.asarray(y), return_inverse=True)
+    folds = np.empty(len(y_codes), dtype=np.int32)
+    splitter = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=random_seed)
+    for fold, (_, test_index) in enumerate(splitter.split(np.zeros(len(y_codes)), y_codes)):
+        folds[test_index] = fold
+
+    arrays = {"X": float_matrix(X), "y": y_codes, "folds": folds}
+    columns = list(X.columns) if isinstance(X, pd.DataFrame) else None
+    # Snapshot the model now; tasks are pickled lazily and ``refit`` mutates it
+    model_bytes = pickle.dumps(model)
+    n_workers = resolve_workers(n_jobs, n_folds)
+
+    logger.info(f"Cross-validating {type(model).__name__} with {n_folds} folds on {n_workers} worker(s)")
+    with shared_array_executor(arrays, n_workers) as executor:
+        futures = [
+            executor.submit(
+                _evaluate_fold, (fold, model_bytes, columns, classes, fine_tune, epochs, learning_rate)
+            )
+            for fold in range(n_folds)
+        ]
+        if refit is not None:
+            # In-process folds have already run; pool workers are still busy
+            with limit_threads(worker_threads(n_workers), model) if n_workers > 1 else nullcontext():
+                refit()
+        fold_results = [future.result() for future in futures]
+
+    return {"n_folds": n_folds, "folds": fold_results, **summarize_folds(fold_results)}
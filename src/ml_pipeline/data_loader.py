@@ -1,8 +1,19 @@
 """
 Data loader for ML Pipeline - handles evaluation log retrieval and dataset preparation
+
+The evaluation log only grows, so it is kept in a local cache
+(``EVALUATION_LOG_CACHE_DIR``) next to a watermark of what the copy holds: the
+ETag, size and line count of the log when it was last synced. A sync with an
+unchanged ETag downloads nothing; a longer log is fetched from the cached size
+on with a Range request and appended, after checking that the last
+``SYNC_OVERLAP_BYTES`` bytes of the copy are unchanged in Storage. A shorter
+or rewritten log is downloaded again in full.
 """
 
+import json
 import logging
+import os
+import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Tuple
@@ -11,31 +22,203 @@ import pandas as pd
 
 from .config import (
     DEFAULT_LOOKBACK_DAYS,
+    DOWNLOAD_SPILL_BYTES,
     ERROR_CONFIDENCE_THRESHOLD,
+    EVALUATION_LOG_CACHE_DIR,
     EVALUATION_LOG_PATH,
     STORAGE_BUCKET,
     TEMP_DIR,
 )
-from .supabase_client import download_file_from_storage
+from .supabase_client import download_range_from_storage, get_storage_file_info, stream_file_from_storage
+
+try:
+    import fcntl
+except ImportError:  # Windows: syncs are not serialized between processes
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
+# Tail of the cached log downloaded again to detect a rewritten log
+SYNC_OVERLAP_BYTES = 4096
+
+
+def _read_watermark(watermark_path: Path, log_path: Path) -> Optional[dict]:
+    """Return the watermark of the cached log, or None if it does not describe the copy on disk."""
+    try:
+        watermark = json.loads(watermark_path.read_text())
+        if watermark["size"] == log_path.stat().st_size:
+            return watermark
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_watermark(watermark_path: Path, etag: Optional[str], size: int, lines: int) -> None:
+    """Atomically record what the cached log holds."""
+    tmp_path = watermark_path.with_name(watermark_path.name + ".tmp")
+    tmp_path.write_text(json.dumps({
+        "etag": etag,
+        "size": size,
+        "lines": lines,
+        "synced_at": datetime.now().isoformat(),
+    }))
+    os.replace(tmp_path, watermark_path)
+
+
+def _append_new_bytes(log_path: Path, cached_size: int) -> Optional[bytes]:
+    """
+    Append the bytes added to the remote log since it was cached.
+
+    Returns:
+        The appended bytes, or None if the cached tail no longer matches the
+        remote log (which was then rewritten rather than appended to)
+    """
+    overlap = min(SYNC_OVERLAP_BYTES, cached_size)
+    data = download_range_from_storage(STORAGE_BUCKET, EVALUATION_LOG_PATH, cached_size - overlap)
+
+    with open(log_path, "rb+") as f:
+        f.seek(cached_size - overlap)
+        if len(data) < overlap or f.read(overlap) != data[:overlap]:
+            return None
+        appended = data[overlap:]
+        f.write(appended)
+    return appended
+
+
+def sync_evaluation_log(cache_dir: Path = EVALUATION_LOG_CACHE_DIR) -> Path:
+    """
+    Bring the cached copy of the evaluation log up to date with Storage
+    
+    Concurrent syncs of the same cache are serialized with a file lock.
+    
+    Args:
+        cache_dir: Directory of the cached log and its watermark
+        
+    Returns:
+        Path to the cached evaluation log
+        
+    Raises:
+        FileNotFoundError: If the log does not exist in Storage
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    log_path = cache_dir / Path(EVALUATION_LOG_PATH).name
+    watermark_path = log_path.with_name(log_path.name + ".watermark.json")
+
+    with open(log_path.with_name(log_path.name + ".lock"), "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+
+        watermark = _read_watermark(watermark_path, log_path)
+        remote = get_storage_file_info(STORAGE_BUCKET, EVALUATION_LOG_PATH)
+        if remote is None:
+            raise FileNotFoundError(f"{EVALUATION_LOG_PATH} not found in {STORAGE_BUCKET}")
+
+        if watermark is not None:
+            if remote["etag"] and remote["etag"] == watermark["etag"]:
+                logger.info(f"Evaluation log unchanged since last sync ({watermark['size']} bytes)")
+                return log_path
+
+            if remote["size"] is not None and remote["size"] >= watermark["size"]:
+                appended = _append_new_bytes(log_path, watermark["size"])
+                if appended is not None:
+                    size = watermark["size"] + len(appended)
+                    # The ETag only describes the copy if the log did not grow again meanwhile
+                    etag = remote["etag"] if size == remote["size"] else None
+                    _write_watermark(watermark_path, etag, size, watermark["lines"] + appended.count(b"\n"))
+                    logger.info(f"Appended {len(appended)} new bytes to the cached evaluation log")
+                    return log_path
+            logger.warning("Evaluation log was rewritten in Storage; downloading it again")
+
+        part_path = log_path.with_name(log_path.name + ".part")
+        size = lines = 0
+        try:
+            with open(part_path, "wb") as f:
+                for chunk in stream_file_from_storage(STORAGE_BUCKET, EVALUATION_LOG_PATH):
+                    f.write(chunk)
+                    size += len(chunk)
+                    lines += chunk.count(b"\n")
+            os.replace(part_path, log_path)
+        finally:
+            part_path.unlink(missing_ok=True)
+
+        etag = remote["etag"] if size == remote["size"] else None
+        _write_watermark(watermark_path, etag, size, lines)
+        logger.info(f"Downloaded the full evaluation log ({size} bytes)")
+        return log_path
+
+
+def read_csv_from_storage(
+    bucket: str,
+    path: str,
+    spill_threshold: int = DOWNLOAD_SPILL_BYTES,
+    **read_csv_kwargs,
+) -> pd.DataFrame:
+    """
+    Download a CSV from Supabase Storage and parse it without a named temp file
+    
+    Each downloaded chunk is copied into a buffer that stays in memory up to
+    ``spill_threshold`` bytes and rolls over to an anonymous temp file in
+    ``TEMP_DIR`` beyond that, so parsing holds the raw CSV once next to the
+    DataFrame. The buffer is closed, and any temp file deleted, once parsed
+    or on failure.
+    
+    Args:
+        bucket: Storage bucket name
+        path: Path to the CSV in the bucket
+        spill_threshold: Largest download kept in memory, in bytes
+        **read_csv_kwargs: Passed to ``pd.read_csv``
+        
+    Returns:
+        Parsed DataFrame
+    """
+    with tempfile.SpooledTemporaryFile(max_size=spill_threshold, dir=TEMP_DIR) as buffer:
+        size = 0
+        for chunk in stream_file_from_storage(bucket, path):
+            buffer.write(chunk)
+            size += len(chunk)
+        if size > spill_threshold:
+            logger.info(f"Download of {path} ({size} bytes) spilled to a temp file")
+        buffer.seek(0)
+        return pd.read_csv(buffer, **read_csv_kwargs)
+
 
-def load_evaluation_log(lookback_days: int = DEFAULT_LOOKBACK_DAYS) -> Optional[pd.DataFrame]:
+def load_evaluation_log(
+    lookback_days: int = DEFAULT_LOOKBACK_DAYS,
+    cache_dir: Optional[Path] = EVALUATION_LOG_CACHE_DIR,
+) -> Optional[pd.DataFrame]:
     """
     Load evaluation log from Supabase Storage
     
+    Only the rows appended since the last run are downloaded (see
+    ``sync_evaluation_log``); if Storage cannot be reached, the last
+    complete cached copy is used as is. Without a cache directory the log
+    is parsed straight from the download (see ``read_csv_from_storage``).
+    
     Args:
         lookback_days: Number of days to look back in evaluation log
+        cache_dir: Directory of the cached log, or None to keep no local copy
         
     Returns:
         DataFrame with evaluation log or None if failed
     """
     try:
-        temp_path = TEMP_DIR / f"evaluation_log_{datetime.now().isoformat()}.csv"
-        download_file_from_storage(STORAGE_BUCKET, EVALUATION_LOG_PATH, str(temp_path))
+        if cache_dir is None:
+            df = read_csv_from_storage(STORAGE_BUCKET, EVALUATION_LOG_PATH)
+            logger.info(f"Loaded evaluation log with {len(df)} records")
+            return df
+        
+        try:
+            log_path = sync_evaluation_log(cache_dir)
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            log_path = cache_dir / Path(EVALUATION_LOG_PATH).name
+            watermark_path = log_path.with_name(log_path.name + ".watermark.json")
+            if _read_watermark(watermark_path, log_path) is None:
+                raise
+            logger.warning(f"Failed to sync evaluation log ({str(e)}); using the cached copy")
         
-        df = pd.read_csv(temp_path)
+        df = pd.read_csv(log_path)
         logger.info(f"Loaded evaluation log with {len(df)} records")
         
         return df
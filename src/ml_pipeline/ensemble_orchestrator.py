@@ -0,0 +1,175 @@
+"""Concurrent sub-model fan-out for the ensemble predictor.
+
+The FT, HT and pattern models are independent computations. Instead of
+calling them one after another before ``EnsemblePredictor.predict``, the
+orchestrator runs them concurrently under a per-request deadline:
+
+- Every registered sub-model callable is invoked at the same time
+- Models that miss the deadline (or raise) are treated as null, so the
+  predictor's dynamic re-weighting applies
+- Per-sub-model latency is reported with each result
+
+Prediction latency is therefore bounded by the deadline rather than by the
+sum of all sub-model latencies.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from .ensemble_predictor import EnsemblePredictor
+
+logger = logging.getLogger(__name__)
+
+# A sub-model returns (predicted outcome, confidence) or None when it has no opinion
+SubModelFn = Callable[..., Optional[Tuple[str, float]]]
+
+
+class EnsembleOrchestrator:
+    """Runs sub-models concurrently under a deadline and feeds the ensemble."""
+
+    # Default per-request deadline in seconds
+    DEFAULT_DEADLINE = 0.5
+
+    def __init__(
+        self,
+        predictor: EnsemblePredictor,
+        sub_models: Mapping[str, SubModelFn],
+        deadline: float = DEFAULT_DEADLINE,
+        max_workers: Optional[int] = None,
+    ):
+        """Initialize the orchestrator.
+
+        Args:
+            predictor: Ensemble predictor that combines the votes
+            sub_models: Mapping of registered sub-model name to callable. Plain
+                    callables run on a thread pool; coroutine functions are
+                    awaited directly by ``apredict``.
+            deadline: Per-request deadline in seconds
+            max_workers: Thread pool size (default: 4 workers per sub-model, so
+                    stragglers past the deadline do not starve new requests)
+
+        Raises:
+            ValueError: If a sub-model is not registered with the predictor
+        """
+        registered = {name for name, _ in predictor.get_sub_models()}
+        unknown = set(sub_models) - registered
+        if unknown:
+            raise ValueError(f"Sub-models not registered with the predictor: {sorted(unknown)}")
+
+        self.predictor = predictor
+        self.sub_models = dict(sub_models)
+        self.deadline = deadline
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or 4 * len(self.sub_models),
+            thread_name_prefix="ensemble-submodel",
+        )
+
+    @staticmethod
+    def _timed_call(fn: SubModelFn, args: Tuple, kwargs: Dict) -> Tuple[Optional[Tuple[str, float]], float]:
+        """Call a sub-model and return (vote, elapsed seconds)."""
+        start = time.perf_counter()
+        vote = fn(*args, **kwargs)
+        return vote, time.perf_counter() - start
+
+    def predict(self, *args: Any, deadline: Optional[float] = None, **kwargs: Any) -> Dict:
+        """Run all sub-models concurrently and combine the votes that arrive in time.
+
+        Args:
+            *args: Positional arguments passed to every sub-model
+            deadline: Optional override of the per-request deadline in seconds
+            **kwargs: Keyword arguments passed to every sub-model
+
+        Returns:
+            Ensemble result dict (see ``EnsemblePredictor.predict``) with extra keys:
+                - latency_ms: Latency of each sub-model that finished in time
+                - timed_out: Sub-models that missed the deadline
+                - failed: Sub-models that raised an exception
+
+        Raises:
+            ValueError: If no sub-model produced a vote in time
+        """
+        timeout = self.deadline if deadline is None else deadline
+        futures = {
+            self._executor.submit(self._timed_call, fn, args, kwargs): name
+            for name, fn in self.sub_models.items()
+        }
+        done, not_done = wait(futures, timeout=timeout)
+        for future in not_done:
+            future.cancel()
+
+        outcomes = {}
+        for future in done:
+            try:
+                outcomes[futures[future]] = future.result()
+            except Exception as e:
+                outcomes[futures[future]] = e
+
+        return self._combine(outcomes, [futures[future] for future in not_done], timeout)
+
+    async def apredict(self, *args: Any, deadline: Optional[float] = None, **kwargs: Any) -> Dict:
+        """Async variant of ``predict`` for use inside an event loop.
+
+        Coroutine sub-models are awaited directly; plain callables run on the
+        orchestrator's thread pool. Arguments and return value match ``predict``.
+        """
+        timeout = self.deadline if deadline is None else deadline
+        loop = asyncio.get_running_loop()
+
+        async def run(fn: SubModelFn) -> Tuple[Optional[Tuple[str, float]], float]:
+            if inspect.iscoroutinefunction(fn):
+                start = time.perf_counter()
+                vote = await fn(*args, **kwargs)
+                return vote, time.perf_counter() - start
+            return await loop.run_in_executor(self._executor, self._timed_call, fn, args, kwargs)
+
+        tasks = {asyncio.ensure_future(run(fn)): name for name, fn in self.sub_models.items()}
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+
+        outcomes = {}
+        for task in done:
+            error = task.exception()
+            outcomes[tasks[task]] = error if error is not None else task.result()
+
+        return self._combine(outcomes, [tasks[task] for task in pending], timeout)
+
+    def _combine(self, outcomes: Dict[str, Any], timed_out: List[str], timeout: float) -> Dict:
+        """Feed the collected votes into the predictor and attach timing details."""
+        votes = {}
+        latency_ms = {}
+        failed = []
+        for name, outcome in outcomes.items():
+            if isinstance(outcome, BaseException):
+                logger.warning(f"Sub-model {name} failed: {outcome}")
+                failed.append(name)
+                continue
+            vote, elapsed = outcome
+            latency_ms[name] = round(elapsed * 1000.0, 3)
+            if vote is not None:
+                votes[name] = vote
+
+        if timed_out:
+            logger.warning(f"Sub-models missed the {timeout}s deadline: {sorted(timed_out)}")
+
+        result = self.predictor.predict_models(votes)
+        return {
+            **result,
+            "latency_ms": latency_ms,
+            "timed_out": sorted(timed_out),
+            "failed": sorted(failed),
+        }
+
+    def close(self) -> None:
+        """Shut down the worker pool without waiting for stragglers."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> "EnsembleOrchestrator":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -1,23 +1,56 @@
 """Ensemble Predictor for combining multiple sub-model predictions.
 
 This module implements a weighted voting system that aggregates predictions
-from three sub-models:
+from a registry of named sub-models. By default there are three:
 - Full-time Model (FT): Primary model with highest weight
 - Half-time Model (HT): Intermediate predictions
 - Pattern-based Model (PT): Pattern recognition model
 
+Further signals (e.g. market odds) are added with ``register_sub_model``.
+
 Key features:
 - Configurable weights (default: FT=0.5, HT=0.3, PT=0.2)
 - Dynamic re-weighting when sub-models return null
 - Conflict detection when top 2 outcomes have similar scores
 - Deterministic output for reproducibility
+- Columnar batch scoring (``predict_batch``) matching the scalar path exactly
+- Probability-vector blending (``predict_proba_batch``) for full HOME/DRAW/AWAY distributions
+- Online weight adaptation (Hedge) from settled results via ``observe_result``
+- Optional bounded LRU/TTL result cache keyed on quantized inputs and weight version
+- Compact slotted cache entries and columnar batch results (see ``ensemble_results``)
 """
 
-from typing import Dict, Optional, Tuple, List
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+import json
 import logging
+import math
+import threading
+import time
+
+import numpy as np
+
+from .ensemble_results import OUTCOMES, EnsembleBatchResult, EnsembleResult
 
 logger = logging.getLogger(__name__)
 
+_OUTCOME_CODES = {"HOME": 0, "HOME_WIN": 0, "DRAW": 1, "AWAY": 2, "AWAY_WIN": 2}
+
+
+def _round_array(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """Round like Python's built-in ``round`` but vectorized.
+
+    ``np.round`` scales by ``10**ndigits`` before rounding, which can pick the
+    other neighbour when the scaled value lands on a half. Those rare
+    near-ties are re-rounded with ``round`` so results match the scalar path.
+    """
+    rounded = np.round(values, ndigits)
+    scaled = values * (10 ** ndigits)
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        rounded[near_tie] = [round(float(v), ndigits) for v in values[near_tie]]
+    return rounded
+
 
 class EnsemblePredictor:
     """Ensemble predictor implementing weighted voting logic."""
@@ -29,27 +62,85 @@ class EnsemblePredictor:
         "pt": 0.2,  # Pattern model
     }
     
-    # Conflict threshold: if top 2 scores differ by less than this, flag as conflict
+    # Default conflict threshold: if top 2 scores differ by less than this, flag as conflict
     CONFLICT_THRESHOLD = 0.1
     
     # Valid outcomes
     VALID_OUTCOMES = {"HOME", "DRAW", "AWAY", "home_win", "draw", "away_win"}
     
-    def __init__(self, weights: Optional[Dict[str, float]] = None):
+    # Default sub-model registry in voting order: (name, weight key)
+    SUB_MODELS = (("full_time", "ft"), ("half_time", "ht"), ("pattern", "pt"))
+    
+    # Presence combinations are precompiled eagerly up to this many sub-models
+    MAX_PRECOMPILED_SUB_MODELS = 8
+    
+    # Online learning: Hedge step size and the floor that keeps a model recoverable
+    DEFAULT_LEARNING_RATE = 0.05
+    MIN_ONLINE_WEIGHT = 1e-3
+    
+    # Result cache: confidences are rounded to this many decimals to form the key
+    CACHE_PRECISION = 6
+    
+    def __init__(
+        self,
+        weights: Optional[Dict[str, float]] = None,
+        sub_models: Optional[Sequence[Tuple[str, str]]] = None,
+        learning_rate: float = DEFAULT_LEARNING_RATE,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None,
+        conflict_threshold: Optional[float] = None,
+    ):
         """Initialize ensemble predictor with optional custom weights.
         
         Args:
-            weights: Optional dict with keys 'ft', 'ht', 'pt' for model weights.
+            weights: Optional dict mapping each sub-model weight key to its weight.
                     If not provided, uses DEFAULT_WEIGHTS.
+            sub_models: Optional (name, weight key) pairs in voting order.
+                    If not provided, uses SUB_MODELS (ft, ht, pt).
+            learning_rate: Hedge step size used by ``observe_result``
+            cache_size: Maximum number of cached results (0 disables the cache)
+            cache_ttl: Optional lifetime of cached results in seconds
+            conflict_threshold: Margin between the top two scores below which a
+                    prediction is flagged as a conflict (default: CONFLICT_THRESHOLD)
         """
+        # Result cache (LRU order, entries are (expires_at, result))
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._cache: "OrderedDict[Tuple, Tuple[Optional[float], EnsembleResult]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        self._config_version = 0
+        
+        self.sub_models: List[Tuple[str, str]] = list(sub_models or self.SUB_MODELS)
+        self.conflict_threshold = self._checked_threshold(
+            self.CONFLICT_THRESHOLD if conflict_threshold is None else conflict_threshold
+        )
         self.weights = weights if weights else self.DEFAULT_WEIGHTS.copy()
         self._validate_weights()
+        self._compile_weights()
+        
+        # Online learner state
+        self.learning_rate = learning_rate
+        self.observations = 0
+        self.cumulative_loss: Dict[str, float] = {key: 0.0 for _, key in self.sub_models}
+    
+    @staticmethod
+    def _checked_threshold(conflict_threshold: float) -> float:
+        """Return the conflict threshold as a float, rejecting negative values."""
+        conflict_threshold = float(conflict_threshold)
+        if not conflict_threshold >= 0:
+            raise ValueError(f"Conflict threshold must be non-negative, got {conflict_threshold}")
+        return conflict_threshold
     
     def _validate_weights(self) -> None:
         """Validate that weights are positive and sum close to 1.0."""
-        required_keys = {"ft", "ht", "pt"}
+        names = [name for name, _ in self.sub_models]
+        required_keys = [key for _, key in self.sub_models]
+        if len(set(names)) != len(names) or len(set(required_keys)) != len(required_keys):
+            raise ValueError("Sub-model names and weight keys must be unique")
+        
         if not all(key in self.weights for key in required_keys):
-            raise ValueError(f"Weights must contain keys: {required_keys}")
+            raise ValueError(f"Weights must contain keys: {set(required_keys)}")
         
         if any(w < 0 for w in self.weights.values()):
             raise ValueError("All weights must be non-negative")
@@ -58,6 +149,92 @@ class EnsemblePredictor:
         if not (0.99 <= total <= 1.01):
             logger.warning(f"Weights sum to {total}, not 1.0. Will normalize during prediction.")
     
+    def _compile_weights(self, eager: bool = True) -> None:
+        """Build the dense weight vector and the normalized-weight table.
+        
+        The table maps a presence bitmask (bit i set when ``sub_models[i]`` is
+        active) to the weights re-normalized over the active models, with zeros
+        for inactive ones, or None when the active weights sum to zero. All
+        combinations are precompiled for small registries; larger registries
+        (and online updates, with ``eager=False``) fill the table lazily as
+        combinations are seen.
+        """
+        self._weight_keys = tuple(key for _, key in self.sub_models)
+        self._model_index = {name: col for col, (name, _) in enumerate(self.sub_models)}
+        self._weight_vector = np.array([self.weights[key] for key in self._weight_keys], dtype=np.float64)
+        self._weight_table: Dict[int, Optional[Tuple[float, ...]]] = {0: None}
+        
+        # Any weight change invalidates cached results
+        self._config_version += 1
+        self.clear_cache()
+        
+        if eager and len(self.sub_models) <= self.MAX_PRECOMPILED_SUB_MODELS:
+            for presence in range(1, 1 << len(self.sub_models)):
+                self._normalized_weights(presence)
+    
+    def _normalized_weights(self, presence: int) -> Optional[Tuple[float, ...]]:
+        """Return normalized weights for a presence bitmask, compiling on first use."""
+        try:
+            return self._weight_table[presence]
+        except KeyError:
+            pass
+        
+        # Accumulate left to right (not sum(), which compensates on 3.12+) so the
+        # batch path can reproduce the same total with plain array additions
+        keys = self._weight_keys
+        total_weight = 0.0
+        for i, key in enumerate(keys):
+            if presence >> i & 1:
+                total_weight += self.weights[key]
+        if total_weight == 0:
+            row = None
+        else:
+            row = tuple(
+                self.weights[key] / total_weight if presence >> i & 1 else 0.0
+                for i, key in enumerate(keys)
+            )
+        self._weight_table[presence] = row
+        return row
+    
+    def register_sub_model(self, name: str, key: str, weight: float) -> None:
+        """Add a named sub-model to the ensemble.
+        
+        The new model votes after the existing ones. Weights are not rescaled;
+        they are normalized over the active models at prediction time.
+        
+        Args:
+            name: Sub-model name used for votes and batch columns (e.g. 'market_odds')
+            key: Short weight key (e.g. 'mo')
+            weight: Non-negative voting weight
+        
+        Raises:
+            ValueError: If the name or key is already registered or the weight is invalid
+        """
+        if name in self._model_index or key in self._weight_keys:
+            raise ValueError(f"Sub-model already registered: {name} ({key})")
+        
+        old_weights = self.weights.copy()
+        self.sub_models.append((name, key))
+        self.weights = {**self.weights, key: weight}
+        try:
+            self._validate_weights()
+        except ValueError:
+            self.sub_models.pop()
+            self.weights = old_weights
+            raise
+        
+        self._compile_weights()
+        self.cumulative_loss.setdefault(key, 0.0)
+        logger.info(f"Registered sub-model {name} ({key}) with weight {weight}")
+    
+    def get_sub_models(self) -> List[Tuple[str, str]]:
+        """Get the registered sub-models in voting order.
+        
+        Returns:
+            List of (name, weight key) pairs
+        """
+        return list(self.sub_models)
+    
     def _normalize_outcome(self, outcome: str) -> str:
         """Normalize outcome to standard format (HOME, DRAW, AWAY)."""
         outcome_upper = outcome.upper()
@@ -70,6 +247,13 @@ class EnsemblePredictor:
         else:
             raise ValueError(f"Invalid outcome: {outcome}")
     
+    def _outcome_code(self, outcome: str) -> int:
+        """Map an outcome label to its index in ``OUTCOMES``."""
+        code = _OUTCOME_CODES.get(outcome.upper())
+        if code is None:
+            raise ValueError(f"Invalid outcome: {outcome}")
+        return code
+    
     def _normalize_outcome_for_output(self, outcome: str) -> str:
         """Normalize outcome to database format (home_win, draw, away_win)."""
         if outcome == "HOME":
@@ -88,7 +272,7 @@ class EnsemblePredictor:
         half_time_confidence: Optional[float] = None,
         pattern_prediction: Optional[str] = None,
         pattern_confidence: Optional[float] = None,
-    ) -> Dict:
+    ) -> Dict[str, Any]:
         """Calculate ensemble prediction from sub-model predictions.
         
         Args:
@@ -100,7 +284,7 @@ class EnsemblePredictor:
             pattern_confidence: PT model's confidence (0-1 range)
         
         Returns:
-            Dict containing:
+            Plain (JSON-serializable) dict with keys:
                 - weights_used: Normalized weights used for each model
                 - votes: Individual model predictions and confidences
                 - scores: Aggregated scores for each outcome (HOME, DRAW, AWAY)
@@ -112,88 +296,504 @@ class EnsemblePredictor:
         Raises:
             ValueError: If all models return None or invalid inputs
         """
-        # Collect valid models
+        predictions = {}
+        if full_time_prediction is not None:
+            predictions["full_time"] = (full_time_prediction, full_time_confidence)
+        if half_time_prediction is not None:
+            predictions["half_time"] = (half_time_prediction, half_time_confidence)
+        if pattern_prediction is not None:
+            predictions["pattern"] = (pattern_prediction, pattern_confidence)
+        return self.predict_models(predictions)
+    
+    def predict_models(self, predictions: Mapping[str, Tuple[Optional[str], Optional[float]]]) -> Dict[str, Any]:
+        """Calculate ensemble prediction from any registered sub-models.
+        
+        Args:
+            predictions: Mapping of sub-model name to (predicted outcome, confidence).
+                    Missing names or None values mark the sub-model as inactive.
+        
+        Returns:
+            Plain dict with the same keys as ``predict``
+        
+        Raises:
+            ValueError: If all models return None, a name is unknown or inputs are invalid
+        """
+        return self._predict_result(predictions).to_dict()
+    
+    def _predict_result(self, predictions: Mapping[str, Tuple[Optional[str], Optional[float]]]) -> EnsembleResult:
+        """Compute (or fetch from the cache) the slotted result behind ``predict_models``."""
+        # Collect valid models and the presence bitmask of their combination
         models = []
-        if full_time_prediction is not None and full_time_confidence is not None:
-            models.append(("full_time", full_time_prediction, full_time_confidence, "ft"))
-        if half_time_prediction is not None and half_time_confidence is not None:
-            models.append(("half_time", half_time_prediction, half_time_confidence, "ht"))
-        if pattern_prediction is not None and pattern_confidence is not None:
-            models.append(("pattern", pattern_prediction, pattern_confidence, "pt"))
+        presence = 0
+        for model_name, (prediction, confidence) in predictions.items():
+            col = self._model_index.get(model_name)
+            if col is None:
+                raise ValueError(f"Unknown sub-model: {model_name}")
+            if prediction is not None and confidence is not None:
+                # Validate confidence is in range
+                if not (0.0 <= confidence <= 1.0):
+                    raise ValueError(f"{model_name} confidence must be in range [0, 1], got {confidence}")
+                models.append((model_name, prediction, confidence, col))
+                presence |= 1 << col
         
         if not models:
             raise ValueError("At least one sub-model prediction must be provided")
         
-        # Calculate total weight of active models
-        total_weight = sum(self.weights[weight_key] for _, _, _, weight_key in models)
+        # Votes are aggregated in registry order regardless of mapping order
+        models.sort(key=lambda model: model[3])
         
-        if total_weight == 0:
-            raise ValueError("Total weight of active models is zero")
+        cache_key = None
+        if self.cache_size > 0:
+            cache_key = (self._config_version,) + tuple(
+                (col, prediction, round(confidence, self.CACHE_PRECISION))
+                for _, prediction, confidence, col in models
+            )
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
         
-        # Normalize weights for active models only
-        normalized_weights = {}
-        for _, _, _, weight_key in models:
-            normalized_weights[weight_key] = self.weights[weight_key] / total_weight
+        # Normalized weights for the active models come from the precompiled table
+        normalized_weights = self._normalized_weights(presence)
+        if normalized_weights is None:
+            raise ValueError("Total weight of active models is zero")
         
-        # Initialize scores for each outcome
-        scores = {"HOME": 0.0, "DRAW": 0.0, "AWAY": 0.0}
+        # Initialize scores for each outcome (HOME, DRAW, AWAY)
+        scores = [0.0, 0.0, 0.0]
         
         # Aggregate scores using weighted voting
-        votes = {}
-        for model_name, prediction, confidence, weight_key in models:
-            # Validate confidence is in range
-            if not (0.0 <= confidence <= 1.0):
-                raise ValueError(f"{model_name} confidence must be in range [0, 1], got {confidence}")
-            
-            # Normalize outcome
-            normalized_outcome = self._normalize_outcome(prediction)
-            
+        votes = []
+        for model_name, prediction, confidence, col in models:
             # Add weighted contribution to outcome score
-            weight = normalized_weights[weight_key]
-            scores[normalized_outcome] += confidence * weight
+            scores[self._outcome_code(prediction)] += confidence * normalized_weights[col]
             
             # Record vote
-            votes[model_name] = {
-                "prediction": prediction,
-                "confidence": confidence
+            votes.append((model_name, prediction, confidence))
+        
+        result = self._build_result(normalized_weights, tuple(votes), scores)
+        if cache_key is not None:
+            self._cache_put(cache_key, result)
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Ensemble prediction: {result.winner} "
+                f"(confidence: {result.final_confidence}, "
+                f"conflict: {result.conflict_detected})"
+            )
+        
+        return result
+    
+    def _cache_get(self, key: Tuple) -> Optional[EnsembleResult]:
+        """Return a cached result, or None on a miss.
+        
+        Results are immutable, so cached entries are shared rather than copied.
+        """
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                expires_at, result = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._cache.move_to_end(key)
+                    self._cache_stats["hits"] += 1
+                    return result
+                del self._cache[key]
+                self._cache_stats["expirations"] += 1
+            self._cache_stats["misses"] += 1
+            return None
+    
+    def _cache_put(self, key: Tuple, result: EnsembleResult) -> None:
+        """Store a result, evicting the least recently used entries."""
+        expires_at = time.monotonic() + self.cache_ttl if self.cache_ttl else None
+        with self._cache_lock:
+            self._cache[key] = (expires_at, result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+                self._cache_stats["evictions"] += 1
+    
+    def cache_info(self) -> Dict[str, Any]:
+        """Get result cache counters for sizing.
+        
+        Returns:
+            Dict with hits, misses, evictions, expirations, current size, limits
+            and the weight config version the cache is keyed on
+        """
+        with self._cache_lock:
+            lookups = self._cache_stats["hits"] + self._cache_stats["misses"]
+            return {
+                **self._cache_stats,
+                "size": len(self._cache),
+                "max_size": self.cache_size,
+                "ttl": self.cache_ttl,
+                "hit_rate": self._cache_stats["hits"] / lookups if lookups else 0.0,
+                "config_version": self._config_version,
             }
+    
+    def clear_cache(self) -> None:
+        """Drop all cached results (counters are kept)."""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def predict_trusted(
+        self,
+        codes: Sequence[Optional[int]],
+        confidences: Sequence[Optional[float]],
+    ) -> Dict[str, Any]:
+        """Low-latency variant of ``predict`` for pre-validated inputs.
         
-        # Determine winner (outcome with highest score)
-        winner_outcome = max(scores.items(), key=lambda x: x[1])
-        winner = winner_outcome[0]
-        final_confidence = winner_outcome[1]
+        Outcomes are passed as integer indices into ``OUTCOMES`` (0=HOME, 1=DRAW,
+        2=AWAY), one per registered sub-model in voting order, and a None code
+        marks a missing sub-model. Confidence ranges and outcome labels are not
+        checked and nothing is logged, so callers must guarantee at least one
+        active model with a non-zero weight.
+        
+        Args:
+            codes: Outcome code (or None) per registered sub-model
+            confidences: Confidence per registered sub-model
+        
+        Returns:
+            Plain dict with the same keys as ``predict``; votes record the
+            canonical outcome label for each code.
+        """
+        presence = 0
+        for col, code in enumerate(codes):
+            if code is not None:
+                presence |= 1 << col
+        normalized_weights = self._normalized_weights(presence)
+        
+        votes = []
+        scores = [0.0, 0.0, 0.0]
+        for col, code in enumerate(codes):
+            if code is not None:
+                scores[code] += confidences[col] * normalized_weights[col]
+                votes.append((self.sub_models[col][0], OUTCOMES[code], confidences[col]))
+        
+        return self._build_result(normalized_weights, tuple(votes), scores).to_dict()
+    
+    def _build_result(
+        self,
+        normalized_weights: Tuple[float, ...],
+        votes: Tuple[Tuple[str, str, float], ...],
+        scores: List[float],
+    ) -> EnsembleResult:
+        """Assemble the result from aggregated scores in ``OUTCOMES`` order."""
+        # Determine winner (first outcome with the highest score)
+        winner_code = max(range(3), key=scores.__getitem__)
+        final_confidence = scores[winner_code]
         
         # Check for conflict
-        sorted_scores = sorted(scores.values(), reverse=True)
-        conflict_margin = sorted_scores[0] - sorted_scores[1] if len(sorted_scores) > 1 else sorted_scores[0]
-        conflict_detected = conflict_margin < self.CONFLICT_THRESHOLD
-        
-        # Build complete weights_used dict (including zeros for inactive models)
-        weights_used = {
-            "ft": normalized_weights.get("ft", 0.0),
-            "ht": normalized_weights.get("ht", 0.0),
-            "pt": normalized_weights.get("pt", 0.0)
-        }
+        sorted_scores = sorted(scores, reverse=True)
+        conflict_margin = sorted_scores[0] - sorted_scores[1]
+        conflict_detected = conflict_margin < self.conflict_threshold
+        
+        # Weight keys and the normalized weight row are shared, not copied
+        return EnsembleResult(
+            self._weight_keys,
+            normalized_weights,
+            votes,
+            tuple(scores),
+            winner_code,
+            round(final_confidence, 4),
+            conflict_detected,
+            round(conflict_margin, 4),
+        )
+    
+    def predict_batch(self, data: Optional[Any] = None, **columns: Any) -> EnsembleBatchResult:
+        """Calculate ensemble predictions for many fixtures at once.
         
-        # Build result
-        result = {
-            "weights_used": weights_used,
-            "votes": votes,
-            "scores": scores,
-            "winner": self._normalize_outcome_for_output(winner),
-            "final_confidence": round(final_confidence, 4),
-            "conflict_detected": conflict_detected,
-            "conflict_margin": round(conflict_margin, 4)
+        Each registered sub-model reads two columns, ``<name>_prediction`` and
+        ``<name>_confidence`` (e.g. ``full_time_prediction``), passed as keyword
+        arguments or looked up in ``data`` (a DataFrame or any mapping of column
+        name to array). A sub-model is treated as missing for a fixture when its
+        prediction is None/NaN or its confidence is NaN, and the remaining
+        weights are re-normalized exactly as in ``predict``.
+        
+        Scoring uses the dense weight vector and a (fixtures x sub-models)
+        presence mask, so cost grows linearly with the number of sub-models.
+        
+        Args:
+            data: Optional DataFrame or mapping holding the prediction columns
+            **columns: Prediction and confidence arrays by column name
+        
+        Returns:
+            EnsembleBatchResult, a mapping of columns with one entry per fixture:
+                - weights_used: (n, k) normalized weights in sub-model order
+                - scores: (n, 3) aggregated scores in ``OUTCOMES`` order
+                - winner: Winning outcome in database format
+                - final_confidence: Confidence of winning outcome (rounded to 4 dp)
+                - conflict_detected: Whether the top 2 outcomes are close
+                - conflict_margin: Difference between top 2 scores (rounded to 4 dp)
+        
+        Raises:
+            ValueError: If a fixture has no sub-model predictions or inputs are invalid
+        """
+        codes, confidences, present = self.encode_batch(data, **columns)
+        n_rows, n_models = present.shape
+        
+        weights_used = self._batch_weights(present)
+        
+        # Weighted voting: each model adds confidence * weight to its predicted outcome
+        scores = np.zeros((n_rows, len(OUTCOMES)), dtype=np.float64)
+        rows = np.arange(n_rows)
+        for col in range(n_models):
+            scores[rows, codes[:, col]] += np.where(
+                present[:, col], confidences[:, col] * weights_used[:, col], 0.0
+            )
+        
+        result = EnsembleBatchResult(self._weight_keys, weights_used, scores, *self._summarize_scores(scores))
+        
+        logger.info(
+            f"Ensemble batch prediction: {n_rows} fixtures "
+            f"({int(result.conflict_detected.sum())} conflicts)"
+        )
+        
+        return result
+    
+    def predict_proba_batch(
+        self,
+        probabilities: Mapping[str, Any],
+        classes: Any,
+    ) -> EnsembleBatchResult:
+        """Blend full per-model outcome distributions for many fixtures at once.
+        
+        Each sub-model supplies an (n, 3) probability matrix, e.g. straight from
+        an sklearn ``predict_proba``. Rows containing NaN (or a None matrix) mark
+        the sub-model as missing for that fixture, and weights are re-normalized
+        over the remaining models with the same rules as ``predict_batch``. The
+        blend is a single weighted contraction over the (n, k, 3) stack.
+        
+        Args:
+            probabilities: Mapping of sub-model name to an (n, 3) probability matrix
+            classes: Column labels of the matrices, either one sequence (e.g. an
+                    estimator's ``classes_``, which sklearn sorts as away/draw/home)
+                    shared by all models or a mapping of sub-model name to labels.
+                    Required, as no column order can be assumed safely; pass
+                    ``OUTCOMES`` for matrices already in HOME/DRAW/AWAY order.
+        
+        Returns:
+            EnsembleBatchResult, a mapping of columns with one entry per fixture:
+                - weights_used: (n, k) normalized weights in sub-model order
+                - probabilities: (n, 3) blended distribution in ``OUTCOMES`` order
+                - winner: Most likely outcome in database format
+                - final_confidence: Blended probability of the winner (rounded to 4 dp)
+                - conflict_detected: Whether the top 2 outcomes are close
+                - conflict_margin: Difference between top 2 probabilities (rounded to 4 dp)
+        
+        Raises:
+            ValueError: If a fixture has no sub-model distribution, a matrix has
+                    no class labels or inputs are invalid
+        """
+        if classes is None:
+            raise ValueError("classes are required to map probability columns to outcomes")
+        unknown = probabilities.keys() - self._model_index.keys()
+        if unknown:
+            raise ValueError(f"Unknown sub-models: {sorted(unknown)}")
+        
+        shapes = {
+            np.shape(matrix)[0] for matrix in probabilities.values() if matrix is not None
         }
+        if not shapes:
+            raise ValueError("At least one sub-model prediction must be provided")
+        if len(shapes) > 1:
+            raise ValueError(f"All probability matrices must have the same number of rows, got {sorted(shapes)}")
+        n_rows = shapes.pop()
+        
+        n_models = len(self.sub_models)
+        stacked = np.zeros((n_rows, n_models, len(OUTCOMES)), dtype=np.float64)
+        present = np.zeros((n_rows, n_models), dtype=bool)
+        for col, (model_name, _) in enumerate(self.sub_models):
+            matrix = probabilities.get(model_name)
+            if matrix is None:
+                continue
+            
+            matrix = np.asarray(matrix, dtype=np.float64)
+            if matrix.ndim != 2 or matrix.shape[1] != len(OUTCOMES):
+                raise ValueError(f"{model_name} probabilities must have shape (n, 3), got {matrix.shape}")
+            
+            model_classes = classes.get(model_name) if isinstance(classes, Mapping) else classes
+            if model_classes is None:
+                raise ValueError(f"No classes given for the {model_name} probabilities")
+            matrix = matrix[:, self._class_order(model_classes)]
+            
+            mask = ~np.isnan(matrix).any(axis=1)
+            valid = matrix[mask]
+            if ((valid < 0.0) | (valid > 1.0)).any():
+                raise ValueError(f"{model_name} probabilities must be in range [0, 1]")
+            if not np.allclose(valid.sum(axis=1), 1.0, atol=1e-3):
+                raise ValueError(f"{model_name} probability rows must sum to 1")
+            
+            stacked[mask, col] = valid
+            present[:, col] = mask
+        
+        if not present.any(axis=1).all():
+            missing_rows = np.flatnonzero(~present.any(axis=1))
+            raise ValueError(
+                f"At least one sub-model prediction must be provided (missing for rows {missing_rows[:10].tolist()})"
+            )
+        
+        weights_used = self._batch_weights(present)
+        blended = np.einsum("nk,nkc->nc", weights_used, stacked)
+        
+        result = EnsembleBatchResult(
+            self._weight_keys, weights_used, blended, *self._summarize_scores(blended), score_key="probabilities"
+        )
         
         logger.info(
-            f"Ensemble prediction: {result['winner']} "
-            f"(confidence: {result['final_confidence']}, "
-            f"conflict: {conflict_detected})"
+            f"Ensemble probability blend: {n_rows} fixtures "
+            f"({int(result.conflict_detected.sum())} conflicts)"
         )
         
         return result
     
+    def encode_batch(
+        self, data: Optional[Any] = None, *, require_votes: bool = True, **columns: Any
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Encode ``<name>_prediction``/``<name>_confidence`` columns as arrays.
+        
+        This is the input validation and encoding of ``predict_batch``, for
+        callers that score the sub-model votes themselves (e.g. the weight
+        tuner). Columns are passed and looked up as in ``predict_batch``.
+        
+        Args:
+            data: Optional DataFrame or mapping holding the prediction columns
+            require_votes: Raise if a fixture has no sub-model prediction
+                (otherwise its row of the presence mask is all False)
+            **columns: Prediction and confidence arrays by column name
+        
+        Returns:
+            Tuple of (n, k) outcome codes, confidences (0 where missing) and
+            presence mask, in sub-model order
+        
+        Raises:
+            ValueError: If a fixture has no sub-model predictions (with
+                require_votes) or inputs are invalid
+        """
+        expected = [
+            column
+            for name, _ in self.sub_models
+            for column in (f"{name}_prediction", f"{name}_confidence")
+        ]
+        unknown = set(columns) - set(expected)
+        if unknown:
+            raise ValueError(f"Unknown input columns: {sorted(unknown)}")
+        if data is not None:
+            for column in expected:
+                if columns.get(column) is None and column in data:
+                    columns[column] = data[column]
+        
+        lengths = {len(value) for value in columns.values() if value is not None}
+        if not lengths:
+            raise ValueError("At least one sub-model prediction must be provided")
+        if len(lengths) > 1:
+            raise ValueError(f"All input columns must have the same length, got {sorted(lengths)}")
+        n_rows = lengths.pop()
+        
+        # Encode each sub-model as (outcome code, confidence, presence mask)
+        n_models = len(self.sub_models)
+        codes = np.zeros((n_rows, n_models), dtype=np.intp)
+        confidences = np.zeros((n_rows, n_models), dtype=np.float64)
+        present = np.zeros((n_rows, n_models), dtype=bool)
+        for col, (model_name, _) in enumerate(self.sub_models):
+            predictions = columns.get(f"{model_name}_prediction")
+            model_confidences = columns.get(f"{model_name}_confidence")
+            if predictions is None or model_confidences is None:
+                continue
+            
+            conf = np.asarray(model_confidences, dtype=np.float64)
+            mask = ~self._missing_mask(predictions) & ~np.isnan(conf)
+            
+            out_of_range = mask & ~((conf >= 0.0) & (conf <= 1.0))
+            if out_of_range.any():
+                bad_value = conf[np.argmax(out_of_range)]
+                raise ValueError(f"{model_name} confidence must be in range [0, 1], got {bad_value}")
+            
+            codes[:, col] = self._encode_outcomes(predictions, mask)
+            confidences[:, col] = np.where(mask, conf, 0.0)
+            present[:, col] = mask
+        
+        if require_votes and not present.any(axis=1).all():
+            missing_rows = np.flatnonzero(~present.any(axis=1))
+            raise ValueError(
+                f"At least one sub-model prediction must be provided (missing for rows {missing_rows[:10].tolist()})"
+            )
+        
+        return codes, confidences, present
+    
+    def _class_order(self, class_labels: Sequence[str]) -> np.ndarray:
+        """Return column indices that reorder ``class_labels`` into ``OUTCOMES`` order."""
+        codes = [self._outcome_code(str(label)) for label in class_labels]
+        if sorted(codes) != list(range(len(OUTCOMES))):
+            raise ValueError(f"Classes must cover each outcome exactly once, got {list(class_labels)}")
+        order = np.empty(len(OUTCOMES), dtype=np.intp)
+        order[codes] = np.arange(len(OUTCOMES))
+        return order
+    
+    def _batch_weights(self, present: np.ndarray) -> np.ndarray:
+        """Normalized weights per row for a (fixtures x sub-models) presence mask."""
+        # Total weight of active models, accumulated in sub-model order like the scalar path
+        total_weight = np.zeros(present.shape[0], dtype=np.float64)
+        for col in range(present.shape[1]):
+            total_weight += np.where(present[:, col], self._weight_vector[col], 0.0)
+        
+        if (total_weight == 0).any():
+            raise ValueError("Total weight of active models is zero")
+        
+        return np.where(present, self._weight_vector / total_weight[:, None], 0.0)
+    
+    def _summarize_scores(self, scores: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """Winner code, confidence, conflict flag and margin columns for (n, 3) scores."""
+        winner_index = np.argmax(scores, axis=1).astype(np.int8)
+        final_confidence = scores[np.arange(len(scores)), winner_index]
+        sorted_scores = np.sort(scores, axis=1)
+        conflict_margin = sorted_scores[:, -1] - sorted_scores[:, -2]
+        conflict_detected = conflict_margin < self.conflict_threshold
+        
+        return (
+            winner_index,
+            _round_array(final_confidence, 4),
+            conflict_detected,
+            _round_array(conflict_margin, 4),
+        )
+    
+    @staticmethod
+    def _missing_mask(values: Any) -> np.ndarray:
+        """Return a boolean mask of None/NaN entries in a label column."""
+        if hasattr(values, "isna"):
+            return np.asarray(values.isna(), dtype=bool)
+        array = np.asarray(values, dtype=object)
+        # NaN is the only value not equal to itself
+        return np.asarray((array == None) | (array != array), dtype=bool)  # noqa: E711
+    
+    def encode_outcomes(self, values: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """Encode a column of outcome labels (e.g. actual results) as ``OUTCOMES`` indices.
+        
+        Args:
+            values: Outcome labels in any accepted format; None/NaN marks a missing outcome
+        
+        Returns:
+            Tuple of outcome codes (0 where missing) and a mask of the rows with an outcome
+        
+        Raises:
+            ValueError: If a label is not a valid outcome
+        """
+        present = ~self._missing_mask(values)
+        return self._encode_outcomes(values, present), present
+    
+    def _encode_outcomes(self, values: Any, mask: np.ndarray) -> np.ndarray:
+        """Map outcome labels to indices into ``OUTCOMES`` for rows in ``mask``."""
+        array = np.asarray(values, dtype=object)
+        codes = np.zeros(len(array), dtype=np.intp)
+        if not mask.any():
+            return codes
+        
+        # Normalize each distinct label once instead of once per row
+        labels, inverse = np.unique(array[mask].astype(str), return_inverse=True)
+        label_codes = np.array(
+            [self._outcome_code(label) for label in labels],
+            dtype=np.intp,
+        )
+        codes[mask] = label_codes[inverse.ravel()]
+        return codes
+    
     def get_config(self) -> Dict[str, float]:
         """Get current weight configuration.
         
@@ -202,32 +802,170 @@ class EnsemblePredictor:
         """
         return self.weights.copy()
     
-    def update_config(self, new_weights: Dict[str, float]) -> None:
+    def update_config(self, new_weights: Dict[str, float], conflict_threshold: Optional[float] = None) -> None:
         """Update weight configuration.
         
         Args:
-            new_weights: New weights dict with keys 'ft', 'ht', 'pt'
+            new_weights: New weights dict with a key for every registered sub-model
+            conflict_threshold: Optional new conflict threshold (e.g. from ``ensemble_tuner``)
         
         Raises:
-            ValueError: If weights are invalid
+            ValueError: If weights or the threshold are invalid
         """
+        if conflict_threshold is not None:
+            conflict_threshold = self._checked_threshold(conflict_threshold)
         old_weights = self.weights.copy()
         self.weights = new_weights.copy()
         try:
             self._validate_weights()
-            logger.info(f"Updated weights from {old_weights} to {new_weights}")
+            # Recompiling also invalidates results cached under the old configuration
+            self._compile_weights()
+            if conflict_threshold is not None:
+                self.conflict_threshold = conflict_threshold
         except ValueError as e:
             self.weights = old_weights
             raise ValueError(f"Invalid weights: {e}")
+        logger.info(
+            f"Updated weights from {old_weights} to {new_weights} (conflict threshold {self.conflict_threshold})"
+        )
+    
+    def observe_result(
+        self,
+        actual_outcome: str,
+        predictions: Mapping[str, Tuple[Optional[str], Optional[float]]],
+    ) -> Dict[str, float]:
+        """Adapt weights to a settled result with a multiplicative (Hedge) update.
+        
+        Each sub-model that voted suffers the loss ``1 - p(actual)``, where
+        ``p`` is its confidence when it picked the actual outcome and the
+        remaining mass split over the other two outcomes otherwise. Active
+        weights are multiplied by ``exp(-learning_rate * loss)`` and rescaled to
+        their previous total, so models that did not vote keep their share.
+        Cost is linear in the number of active models.
+        
+        Args:
+            actual_outcome: Settled outcome (HOME/DRAW/AWAY or home_win/draw/away_win)
+            predictions: Sub-model votes as passed to ``predict_models``
+        
+        Returns:
+            Updated weights dict
+        
+        Raises:
+            ValueError: If the outcome, a sub-model name or a confidence is invalid
+        """
+        actual_code = self._outcome_code(actual_outcome)
+        
+        losses = {}
+        for model_name, (prediction, confidence) in predictions.items():
+            col = self._model_index.get(model_name)
+            if col is None:
+                raise ValueError(f"Unknown sub-model: {model_name}")
+            if prediction is None or confidence is None:
+                continue
+            if not (0.0 <= confidence <= 1.0):
+                raise ValueError(f"{model_name} confidence must be in range [0, 1], got {confidence}")
+            
+            if self._outcome_code(prediction) == actual_code:
+                p_actual = confidence
+            else:
+                p_actual = (1.0 - confidence) / 2.0
+            losses[self._weight_keys[col]] = 1.0 - p_actual
+        
+        if not losses:
+            return self.weights.copy()
+        
+        active_mass = sum(self.weights[key] for key in losses)
+        if active_mass == 0:
+            return self.weights.copy()
+        
+        updated = {
+            key: self.weights[key] * math.exp(-self.learning_rate * loss)
+            for key, loss in losses.items()
+        }
+        floor = self.MIN_ONLINE_WEIGHT * active_mass
+        updated = {key: max(weight, floor) for key, weight in updated.items()}
+        scale = active_mass / sum(updated.values())
+        
+        new_weights = self.weights.copy()
+        for key, weight in updated.items():
+            new_weights[key] = weight * scale
+            self.cumulative_loss[key] = self.cumulative_loss.get(key, 0.0) + losses[key]
+        self.weights = new_weights
+        self.observations += 1
+        self._compile_weights(eager=False)
+        
+        logger.debug(f"Online weight update #{self.observations}: {new_weights}")
+        return new_weights.copy()
+    
+    def get_state(self) -> Dict[str, Any]:
+        """Get the JSON-serializable state of the weights and online learner.
+        
+        Returns:
+            Dict with sub-models, weights, conflict threshold, learning rate and
+            learner counters
+        """
+        return {
+            "sub_models": [list(sub_model) for sub_model in self.sub_models],
+            "weights": self.weights.copy(),
+            "conflict_threshold": self.conflict_threshold,
+            "learning_rate": self.learning_rate,
+            "observations": self.observations,
+            "cumulative_loss": self.cumulative_loss.copy(),
+        }
+    
+    def restore_state(self, state: Mapping[str, Any]) -> None:
+        """Restore weights and online learner state saved by ``get_state``.
+        
+        Args:
+            state: State dict from ``get_state``
+        
+        Raises:
+            ValueError: If the state does not match the registered sub-models or is invalid
+        """
+        sub_models = [tuple(sub_model) for sub_model in state.get("sub_models", self.sub_models)]
+        if sub_models != self.sub_models:
+            raise ValueError(f"State sub-models {sub_models} do not match registry {self.sub_models}")
+        
+        self.update_config(dict(state["weights"]), state.get("conflict_threshold"))
+        self.learning_rate = float(state.get("learning_rate", self.learning_rate))
+        self.observations = int(state.get("observations", 0))
+        self.cumulative_loss = {key: 0.0 for key in self._weight_keys}
+        self.cumulative_loss.update(state.get("cumulative_loss", {}))
+    
+    def save_state(self, path: str) -> None:
+        """Persist ``get_state`` to a JSON file.
+        
+        Args:
+            path: Output file path
+        """
+        with open(path, "w") as f:
+            json.dump(self.get_state(), f, indent=2)
+        logger.info(f"Saved ensemble state to {path} ({self.observations} observations)")
+    
+    def load_state(self, path: str) -> None:
+        """Restore state from a JSON file written by ``save_state``.
+        
+        Args:
+            path: State file path
+        """
+        with open(path, "r") as f:
+            self.restore_state(json.load(f))
+        logger.info(f"Loaded ensemble state from {path} ({self.observations} observations)")
 
 
-def create_ensemble_predictor(weights: Optional[Dict[str, float]] = None) -> EnsemblePredictor:
+def create_ensemble_predictor(
+    weights: Optional[Dict[str, float]] = None,
+    sub_models: Optional[Sequence[Tuple[str, str]]] = None,
+    conflict_threshold: Optional[float] = None,
+) -> EnsemblePredictor:
     """Factory function to create an EnsemblePredictor instance.
     
     Args:
         weights: Optional custom weights dict
+        sub_models: Optional (name, weight key) registry
+        conflict_threshold: Optional conflict threshold (default: CONFLICT_THRESHOLD)
     
     Returns:
         EnsemblePredictor instance
     """
-    return EnsemblePredictor(weights=weights)
+    return EnsemblePredictor(weights=weights, sub_models=sub_models, conflict_threshold=conflict_threshold)
@@ -0,0 +1,268 @@
+"""Compact result types returned by the ensemble predictor.
+
+Scalar predictions used to be held as five nested dicts per result. Cached and
+backfilled results can number in the millions, so they are stored in slotted
+objects instead:
+
+- ``EnsembleResult``: one prediction; weights are shared with the predictor's
+  precompiled table and votes/scores are tuples. The predictor caches these
+  and converts them with ``to_dict`` at its scalar entry points, which keep
+  returning plain, JSON-serializable dicts
+- ``EnsembleBatchResult``: columnar NumPy arrays for batch output
+
+Both are read-only mappings with the same keys as the historical dict shape,
+which is only materialized on demand via ``to_dict``/``to_dicts``.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# Canonical outcome order used for score columns
+OUTCOMES = ("HOME", "DRAW", "AWAY")
+DB_OUTCOMES = ("home_win", "draw", "away_win")
+_OUTPUT_LABELS = np.array(DB_OUTCOMES, dtype=object)
+
+# Keys of the historical result dict, in order
+RESULT_KEYS = (
+    "weights_used",
+    "votes",
+    "scores",
+    "winner",
+    "final_confidence",
+    "conflict_detected",
+    "conflict_margin",
+)
+
+
+class EnsembleResult(Mapping):
+    """Single ensemble prediction stored in slots instead of nested dicts."""
+
+    __slots__ = (
+        "weight_keys",
+        "weights",
+        "votes",
+        "scores",
+        "winner_code",
+        "final_confidence",
+        "conflict_detected",
+        "conflict_margin",
+    )
+
+    def __init__(
+        self,
+        weight_keys: Tuple[str, ...],
+        weights: Tuple[float, ...],
+        votes: Tuple[Tuple[str, Any, float], ...],
+        scores: Tuple[float, ...],
+        winner_code: int,
+        final_confidence: float,
+        conflict_detected: bool,
+        conflict_margin: float,
+    ):
+        """Initialize a result.
+
+        Args:
+            weight_keys: Sub-model weight keys in voting order (shared)
+            weights: Normalized weights aligned with ``weight_keys`` (shared)
+            votes: (sub-model name, prediction, confidence) per active model
+            scores: Aggregated scores in ``OUTCOMES`` order
+            winner_code: Index of the winning outcome in ``OUTCOMES``
+            final_confidence: Score of the winning outcome (rounded)
+            conflict_detected: Whether the top 2 outcomes are close
+            conflict_margin: Difference between top 2 scores (rounded)
+        """
+        self.weight_keys = weight_keys
+        self.weights = weights
+        self.votes = votes
+        self.scores = scores
+        self.winner_code = winner_code
+        self.final_confidence = final_confidence
+        self.conflict_detected = conflict_detected
+        self.conflict_margin = conflict_margin
+
+    @property
+    def winner(self) -> str:
+        """Winning outcome in database format (home_win, draw, away_win)."""
+        return DB_OUTCOMES[self.winner_code]
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "weights_used":
+            return dict(zip(self.weight_keys, self.weights))
+        if key == "votes":
+            return {
+                name: {"prediction": prediction, "confidence": confidence}
+                for name, prediction, confidence in self.votes
+            }
+        if key == "scores":
+            return dict(zip(OUTCOMES, self.scores))
+        if key in RESULT_KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(RESULT_KEYS)
+
+    def __len__(self) -> int:
+        return len(RESULT_KEYS)
+
+    def __repr__(self) -> str:
+        return (
+            f"EnsembleResult(winner={self.winner!r}, final_confidence={self.final_confidence}, "
+            f"conflict_detected={self.conflict_detected}, conflict_margin={self.conflict_margin})"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the historical nested dict shape.
+
+        Returns:
+            Dict with weights_used, votes, scores, winner, final_confidence,
+            conflict_detected and conflict_margin
+        """
+        return {key: self[key] for key in RESULT_KEYS}
+
+
+class EnsembleBatchResult(Mapping):
+    """Columnar batch predictions backed by NumPy arrays."""
+
+    __slots__ = (
+        "weight_keys",
+        "weights_used",
+        "scores",
+        "winner_codes",
+        "final_confidence",
+        "conflict_detected",
+        "conflict_margin",
+        "score_key",
+    )
+
+    def __init__(
+        self,
+        weight_keys: Tuple[str, ...],
+        weights_used: np.ndarray,
+        scores: np.ndarray,
+        winner_codes: np.ndarray,
+        final_confidence: np.ndarray,
+        conflict_detected: np.ndarray,
+        conflict_margin: np.ndarray,
+        score_key: str = "scores",
+    ):
+        """Initialize a batch result.
+
+        Args:
+            weight_keys: Sub-model weight keys (column order of ``weights_used``)
+            weights_used: (n, k) normalized weights
+            scores: (n, 3) scores or probabilities in ``OUTCOMES`` order
+            winner_codes: (n,) indices of the winning outcome
+            final_confidence: (n,) rounded score of the winner
+            conflict_detected: (n,) conflict flags
+            conflict_margin: (n,) rounded difference between top 2 scores
+            score_key: Column name for ``scores`` ('scores' or 'probabilities')
+        """
+        self.weight_keys = weight_keys
+        self.weights_used = weights_used
+        self.scores = scores
+        self.winner_codes = winner_codes
+        self.final_confidence = final_confidence
+        self.conflict_detected = conflict_detected
+        self.conflict_margin = conflict_margin
+        self.score_key = score_key
+
+    @property
+    def winner(self) -> np.ndarray:
+        """Winning outcomes in database format as an object array."""
+        return _OUTPUT_LABELS[self.winner_codes]
+
+    def _columns(self) -> Tuple[str, ...]:
+        return (
+            "weights_used",
+            self.score_key,
+            "winner",
+            "final_confidence",
+            "conflict_detected",
+            "conflict_margin",
+        )
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        if key == self.score_key:
+            return self.scores
+        if key in self._columns():
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns())
+
+    def __len__(self) -> int:
+        """Number of columns (use ``n_rows`` for the number of fixtures)."""
+        return len(self._columns())
+
+    def __repr__(self) -> str:
+        return f"EnsembleBatchResult(n_rows={self.n_rows}, conflicts={int(self.conflict_detected.sum())})"
+
+    @property
+    def n_rows(self) -> int:
+        """Number of fixtures in the batch."""
+        return len(self.winner_codes)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the backing arrays in bytes."""
+        return sum(
+            array.nbytes
+            for array in (
+                self.weights_used,
+                self.scores,
+                self.winner_codes,
+                self.final_confidence,
+                self.conflict_detected,
+                self.conflict_margin,
+            )
+        )
+
+    def row(self, index: int) -> EnsembleResult:
+        """Materialize one fixture as an ``EnsembleResult`` (without votes)."""
+        return EnsembleResult(
+            self.weight_keys,
+            tuple(self.weights_used[index].tolist()),
+            (),
+            tuple(self.scores[index].tolist()),
+            int(self.winner_codes[index]),
+            float(self.final_confidence[index]),
+            bool(self.conflict_detected[index]),
+            float(self.conflict_margin[index]),
+        )
+
+    def rows(self) -> Iterator[EnsembleResult]:
+        """Iterate over fixtures as ``EnsembleResult`` objects."""
+        for index in range(self.n_rows):
+            yield self.row(index)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert every fixture to the historical nested dict shape."""
+        return [result.to_dict() for result in self.rows()]
+
+    def to_frame(self, index: Optional[Any] = None) -> Any:
+        """Convert to a pandas DataFrame with one row per fixture.
+
+        Args:
+            index: Optional index for the frame (e.g. fixture ids)
+
+        Returns:
+            DataFrame with winner, confidence, conflict, score and weight columns
+        """
+        import pandas as pd
+
+        frame = {
+            "winner": self.winner,
+            "final_confidence": self.final_confidence,
+            "conflict_detected": self.conflict_detected,
+            "conflict_margin": self.conflict_margin,
+        }
+        prefix = "score" if self.score_key == "scores" else "probability"
+        for col, outcome in enumerate(OUTCOMES):
+            frame[f"{prefix}_{outcome.lower()}"] = self.scores[:, col]
+        for col, key in enumerate(self.weight_keys):
+            frame[f"weight_{key}"] = self.weights_used[:, col]
+        return pd.DataFrame(frame, index=index)
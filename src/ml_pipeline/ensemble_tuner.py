@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Ensemble weight tuner - grid search of sub-model weights and conflict thresholds
+
+Evaluates every candidate weight vector on the settled fixtures of the
+evaluation log in one vectorized pass. Scores are computed as a
+(candidates x fixtures x outcomes) tensor in bounded candidate chunks instead
+of calling ``EnsemblePredictor.predict`` per fixture, and each candidate is
+reported with:
+
+- accuracy: Share of fixtures whose winner matches the actual outcome
+- log_loss: Log-loss of the blended outcome distribution
+- conflict_rate: Share of fixtures flagged as conflicts at the threshold
+- confident_accuracy: Accuracy over the fixtures that are not conflicts
+
+A vote with confidence ``c`` is read as probability ``c`` on its outcome and
+``(1 - c) / 2`` on the other two (the same reading as
+``EnsemblePredictor.observe_result``), so the blended distribution always sums
+to one.
+
+Usage:
+    python -m ml_pipeline.ensemble_tuner --log evaluation_log.csv --step 0.05
+"""
+
+import argparse
+import json
+import logging
+import sys
+from itertools import combinations
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .ensemble_predictor import OUTCOMES, EnsemblePredictor
+
+logger = logging.getLogger(__name__)
+
+# Default conflict thresholds evaluated for every weight vector
+DEFAULT_THRESHOLDS = (0.025, 0.05, 0.075, 0.1, 0.125, 0.15, 0.2)
+
+# Upper bound on (candidates x fixtures) cells scored at once
+DEFAULT_MAX_CELLS = 2_000_000
+
+# Probability floor used by the log-loss
+LOG_LOSS_EPS = 1e-15
+
+METRICS = ("accuracy", "log_loss", "confident_accuracy")
+
+
+def simplex_grid(n_models: int, step: float = 0.05) -> np.ndarray:
+    """Enumerate weight vectors on the probability simplex.
+
+    Args:
+        n_models: Number of sub-models (vector length)
+        step: Grid resolution; 1/step must be a whole number
+
+    Returns:
+        (candidates, n_models) array of non-negative weights summing to 1
+
+    Raises:
+        ValueError: If step does not divide 1 evenly or n_models < 1
+    """
+    if n_models < 1:
+        raise ValueError("At least one sub-model is required")
+    parts = int(round(1.0 / step))
+    if parts < 1 or not np.isclose(parts * step, 1.0):
+        raise ValueError(f"1/step must be a whole number, got step={step}")
+
+    # Stars and bars: choose n_models - 1 dividers among parts + n_models - 1 slots
+    rows = []
+    for dividers in combinations(range(parts + n_models - 1), n_models - 1):
+        bounds = (-1,) + dividers + (parts + n_models - 1,)
+        rows.append([bounds[i + 1] - bounds[i] - 1 for i in range(n_models)])
+    return np.array(rows, dtype=np.float64) / parts
+
+
+def evaluate_candidates(
+    predictor: EnsemblePredictor,
+    data: Any,
+    weight_grid: np.ndarray,
+    thresholds: Sequence[float] = DEFAULT_THRESHOLDS,
+    actual_column: str = "actual_outcome",
+    max_cells: int = DEFAULT_MAX_CELLS,
+) -> pd.DataFrame:
+    """Score every (weight vector, conflict threshold) pair on settled fixtures.
+
+    Args:
+        predictor: Predictor whose sub-model registry defines the input columns
+        data: DataFrame (or mapping of columns) with ``<name>_prediction``,
+                ``<name>_confidence`` and the actual outcome per fixture
+        weight_grid: (candidates, k) weights in the predictor's sub-model order
+        thresholds: Conflict thresholds evaluated for every weight vector
+        actual_column: Column holding the actual outcome (HOME/home_win/...)
+        max_cells: Upper bound on candidates x fixtures scored at once
+
+    Returns:
+        DataFrame with one row per (weights, threshold) pair: ``weight_<key>``
+        columns, conflict_threshold, accuracy, log_loss, conflict_rate and
+        confident_accuracy (NaN when every fixture is a conflict)
+
+    Raises:
+        ValueError: If inputs are invalid or no fixture can be scored
+    """
+    weight_grid = np.atleast_2d(np.asarray(weight_grid, dtype=np.float64))
+    weight_keys = [key for _, key in predictor.get_sub_models()]
+    if weight_grid.shape[1] != len(weight_keys):
+        raise ValueError(f"Weight grid must have {len(weight_keys)} columns, got {weight_grid.shape[1]}")
+    if (weight_grid < 0).any():
+        raise ValueError("All weights must be non-negative")
+    if actual_column not in data:
+        raise ValueError(f"Missing actual outcome column: {actual_column}")
+
+    # Only settled fixtures with at least one sub-model vote can be scored
+    actual, settled = predictor.encode_outcomes(data[actual_column])
+    columns = {}
+    for name, _ in predictor.get_sub_models():
+        for column in (f"{name}_prediction", f"{name}_confidence"):
+            if column in data:
+                columns[column] = np.asarray(data[column])[settled]
+    if not columns:
+        raise ValueError("No settled fixtures with sub-model predictions to evaluate")
+    codes, confidences, present = predictor.encode_batch(require_votes=False, **columns)
+    scorable = present.any(axis=1)
+    if not scorable.any():
+        raise ValueError("No settled fixtures with sub-model predictions to evaluate")
+    n_skipped = len(settled) - int(scorable.sum())
+    if n_skipped:
+        logger.info(f"Skipping {n_skipped} unsettled or unscored fixtures")
+    codes, confidences, present = codes[scorable], confidences[scorable], present[scorable]
+    actual = actual[settled][scorable]
+
+    n_rows, n_models = present.shape
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+
+    # Per-model vote matrices: weighted-vote contributions and full distributions
+    one_hot = np.eye(len(OUTCOMES), dtype=bool)[codes]
+    votes = np.where(one_hot, confidences[:, :, None], 0.0) * present[:, :, None]
+    remainder = ((1.0 - confidences) / 2.0)[:, :, None]
+    spread = np.where(one_hot, confidences[:, :, None], remainder) * present[:, :, None]
+    rows = np.arange(n_rows)
+
+    chunk_size = max(1, max_cells // max(n_rows, 1))
+    metrics = []
+    for start in range(0, len(weight_grid), chunk_size):
+        weights = weight_grid[start:start + chunk_size]
+
+        # Total active weight, accumulated in sub-model order like the predictor
+        total = np.zeros((len(weights), n_rows), dtype=np.float64)
+        for col in range(n_models):
+            total += weights[:, col, None] * present[None, :, col]
+        abstain = total == 0
+        safe_total = np.where(abstain, 1.0, total)
+
+        scores = np.zeros((len(weights), n_rows, len(OUTCOMES)), dtype=np.float64)
+        blended = np.zeros_like(scores)
+        for col in range(n_models):
+            normalized = (weights[:, col, None] / safe_total)[:, :, None]
+            scores += normalized * votes[None, :, col]
+            blended += normalized * spread[None, :, col]
+
+        # Candidates that zero out every active model abstain (wrong, uniform, conflict)
+        blended[abstain] = 1.0 / len(OUTCOMES)
+        winner = np.where(abstain, -1, np.argmax(scores, axis=2))
+        correct = winner == actual[None, :]
+        p_actual = np.clip(blended[:, rows, actual], LOG_LOSS_EPS, 1.0)
+        sorted_scores = np.sort(scores, axis=2)
+        margin = np.where(abstain, 0.0, sorted_scores[:, :, -1] - sorted_scores[:, :, -2])
+
+        accuracy = correct.mean(axis=1)
+        log_loss = -np.log(p_actual).mean(axis=1)
+        for threshold in thresholds:
+            conflict = margin < threshold
+            confident = ~conflict
+            n_confident = confident.sum(axis=1)
+            confident_correct = (correct & confident).sum(axis=1)
+            confident_accuracy = np.divide(
+                confident_correct,
+                n_confident,
+                out=np.full(len(weights), np.nan),
+                where=n_confident > 0,
+            )
+            metrics.append(pd.DataFrame({
+                **{f"weight_{key}": weights[:, col] for col, key in enumerate(weight_keys)},
+                "conflict_threshold": threshold,
+                "accuracy": accuracy,
+                "log_loss": log_loss,
+                "conflict_rate": conflict.mean(axis=1),
+                "confident_accuracy": confident_accuracy,
+            }))
+
+    logger.info(f"Evaluated {len(weight_grid)} weight vectors x {len(thresholds)} thresholds on {n_rows} fixtures")
+    sort_keys = [f"weight_{key}" for key in weight_keys] + ["conflict_threshold"]
+    return pd.concat(metrics, ignore_index=True).sort_values(sort_keys, kind="mergesort", ignore_index=True)
+
+
+def tune_ensemble(
+    data: Any,
+    predictor: Optional[EnsemblePredictor] = None,
+    step: float = 0.05,
+    thresholds: Sequence[float] = DEFAULT_THRESHOLDS,
+    metric: str = "log_loss",
+    max_conflict_rate: Optional[float] = None,
+    actual_column: str = "actual_outcome",
+    max_cells: int = DEFAULT_MAX_CELLS,
+    apply: bool = False,
+) -> Dict[str, Any]:
+    """Find the best weights and conflict threshold on the evaluation log.
+
+    Candidates are ranked by ``metric`` (accuracy and confident_accuracy are
+    maximized, log_loss minimized); ties are broken by accuracy, log-loss,
+    confident accuracy and finally the lower conflict rate. Accuracy and
+    log-loss do not depend on the threshold, so the threshold of the best
+    weights is the one with the most accurate non-conflict predictions within
+    the ``max_conflict_rate`` budget.
+
+    Args:
+        data: Evaluation log with sub-model columns and the actual outcome
+        predictor: Predictor defining the sub-model registry (default: FT/HT/PT)
+        step: Simplex grid resolution for the weights
+        thresholds: Conflict thresholds to evaluate
+        metric: Ranking metric ('accuracy', 'log_loss' or 'confident_accuracy')
+        max_conflict_rate: Optional upper bound on the conflict rate
+        actual_column: Column holding the actual outcome
+        max_cells: Upper bound on candidates x fixtures scored at once
+        apply: Install the best weights and conflict threshold on ``predictor``
+
+    Returns:
+        Dict containing:
+            - best: weights and conflict_threshold (the arguments of
+              ``update_config``) and the metrics of the best candidate
+            - candidates: DataFrame with the metrics of every candidate
+
+    Raises:
+        ValueError: If the metric is unknown or no candidate meets the constraints
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric: {metric}. Valid options: {', '.join(METRICS)}")
+
+    predictor = predictor or EnsemblePredictor()
+    weight_keys = [key for _, key in predictor.get_sub_models()]
+    candidates = evaluate_candidates(
+        predictor,
+        data,
+        simplex_grid(len(weight_keys), step),
+        thresholds=thresholds,
+        actual_column=actual_column,
+        max_cells=max_cells,
+    )
+
+    eligible = candidates.dropna(subset=[metric])
+    if max_conflict_rate is not None:
+        eligible = eligible[eligible["conflict_rate"] <= max_conflict_rate]
+    if eligible.empty:
+        raise ValueError("No candidate satisfies the constraints")
+
+    best = _rank(eligible, metric).iloc[0]
+
+    result = {
+        "best": {
+            "weights": {key: float(best[f"weight_{key}"]) for key in weight_keys},
+            "conflict_threshold": float(best["conflict_threshold"]),
+            "accuracy": float(best["accuracy"]),
+            "log_loss": float(best["log_loss"]),
+            "conflict_rate": float(best["conflict_rate"]),
+            "confident_accuracy": float(best["confident_accuracy"]),
+        },
+        "candidates": candidates,
+    }
+    logger.info(f"Best ensemble config by {metric}: {result['best']}")
+    if apply:
+        predictor.update_config(result["best"]["weights"], conflict_threshold=result["best"]["conflict_threshold"])
+    return result
+
+
+def _rank(candidates: pd.DataFrame, metric: str) -> pd.DataFrame:
+    """Sort candidates best first by ``metric`` and the tie-breakers."""
+    order = [metric] + [
+        key for key in ("accuracy", "log_loss", "confident_accuracy", "conflict_rate") if key != metric
+    ]
+    ascending = [key in ("log_loss", "conflict_rate") for key in order]
+    return candidates.sort_values(order, ascending=ascending, kind="mergesort")
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Tune ensemble weights on the evaluation log")
+    parser.add_argument("--log", type=str, required=True, help="Path to the evaluation log CSV")
+    parser.add_argument("--step", type=float, default=0.05, help="Weight grid resolution")
+    parser.add_argument(
+        "--thresholds",
+        type=float,
+        nargs="+",
+        default=list(DEFAULT_THRESHOLDS),
+        help="Conflict thresholds to evaluate",
+    )
+    parser.add_argument("--metric", type=str, default="log_loss", choices=METRICS, help="Ranking metric")
+    parser.add_argument("--max_conflict_rate", type=float, default=None, help="Upper bound on conflict rate")
+    parser.add_argument("--actual_column", type=str, default="actual_outcome", help="Actual outcome column")
+    parser.add_argument("--top", type=int, default=0, help="Also print the top N candidates")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Tune the ensemble and print the best config as JSON."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    args = parse_arguments()
+
+    try:
+        result = tune_ensemble(
+            pd.read_csv(args.log),
+            step=args.step,
+            thresholds=args.thresholds,
+            metric=args.metric,
+            max_conflict_rate=args.max_conflict_rate,
+            actual_column=args.actual_column,
+        )
+    except (OSError, ValueError) as e:
+        logger.error(f"Tuning failed: {e}")
+        return 1
+
+    output = {"best": result["best"]}
+    if args.top:
+        output["top"] = _rank(result["candidates"], args.metric).head(args.top).to_dict(orient="records")
+    print(json.dumps(output, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
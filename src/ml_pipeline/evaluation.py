@@ -0,0 +1,304 @@
+"""
+Classification evaluation from a single confusion matrix, with bootstrap confidence intervals
+
+Every label-based metric is derived from one confusion matrix instead of
+re-scanning the labels per metric: accuracy, weighted and macro
+precision/recall/F1 and a per-class report. The metric functions accept a
+stack of matrices, which makes the bootstrap cheap: resampling n rows with
+replacement is the same as drawing the n cell counts of the confusion matrix
+from a multinomial over its observed cell frequencies, so B bootstrap
+replicates cost one ``(B, k, k)`` draw and one vectorized metric pass,
+independent of n. Log-loss and the Brier score are computed from
+``predict_proba`` when the model has it.
+
+The model config may tune the intervals with an ``evaluation`` block:
+
+    evaluation:
+      n_bootstrap: 1000         # 0 disables the intervals
+      confidence: 0.95
+"""
+
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_BOOTSTRAP_SAMPLES = 1000
+DEFAULT_CONFIDENCE = 0.95
+
+# Metrics reported for every model (weighted averages over the classes)
+WEIGHTED_METRICS = ("accuracy", "precision", "recall", "f1_score")
+MACRO_METRICS = ("precision_macro", "recall_macro", "f1_macro")
+
+_PROBABILITY_EPS = 1e-15
+
+
+def confusion_matrix(y_true: Any, y_pred: Any, labels: Optional[Sequence] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Count label pairs in one pass.
+
+    Args:
+        y_true: True labels
+        y_pred: Predicted labels
+        labels: Labels indexing the matrix (default: every label in y_true
+            or y_pred); sorted before use
+
+    Returns:
+        Tuple of (sorted labels, confusion matrix with true labels as rows
+        and predictions as columns)
+
+    Raises:
+        ValueError: If the inputs differ in length or contain labels
+            outside ``labels``
+    """
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    if y_true.shape != y_pred.shape:
+        raise ValueError(f"y_true and y_pred differ in length: {len(y_true)} != {len(y_pred)}")
+
+    labels = np.unique(np.concatenate([y_true, y_pred]) if labels is None else np.asarray(labels))
+    n_labels = len(labels)
+    true_index = np.searchsorted(labels, y_true).clip(max=max(n_labels - 1, 0))
+    pred_index = np.searchsorted(labels, y_pred).clip(max=max(n_labels - 1, 0))
+    if len(y_true) and not ((labels[true_index] == y_true).all() and (labels[pred_index] == y_pred).all()):
+        raise ValueError("y_true or y_pred contains labels that are not in labels")
+
+    confusion = np.bincount(true_index * n_labels + pred_index, minlength=n_labels * n_labels)
+    return labels, confusion.reshape(n_labels, n_labels)
+
+
+def _class_scores(confusion: np.ndarray) -> Dict[str, np.ndarray]:
+    """Per-class precision, recall, F1 and support of (a stack of) confusion matrices."""
+    confusion = np.asarray(confusion, dtype=np.float64)
+    true_positives = np.diagonal(confusion, axis1=-2, axis2=-1)
+    support = confusion.sum(axis=-1)
+    predicted = confusion.sum(axis=-2)
+
+    # Undefined ratios count as 0, like sklearn's zero_division=0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(predicted > 0, true_positives / predicted, 0.0)
+        recall = np.where(support > 0, true_positives / support, 0.0)
+        f1 = np.where(support + predicted > 0, 2 * true_positives / (support + predicted), 0.0)
+
+    return {"precision": precision, "recall": recall, "f1_score": f1, "support": support, "predicted": predicted}
+
+
+def confusion_metrics(confusion: np.ndarray) -> Dict[str, Any]:
+    """
+    Accuracy and weighted and macro averages from confusion matrices.
+
+    Matches sklearn's metrics with ``zero_division=0``; macro averages run
+    over the classes that occur as a true or predicted label.
+
+    Args:
+        confusion: Matrix of shape (k, k), or a stack of shape (..., k, k)
+
+    Returns:
+        Dictionary of the WEIGHTED_METRICS and MACRO_METRICS, as floats for
+        one matrix and arrays over the leading axes for a stack
+    """
+    scores = _class_scores(confusion)
+    support = scores["support"]
+    total = support.sum(axis=-1)
+    present = (support + scores["predicted"]) > 0
+    n_present = present.sum(axis=-1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weights = np.where(total[..., None] > 0, support / total[..., None], 0.0)
+        accuracy = np.where(total > 0, np.diagonal(np.asarray(confusion), axis1=-2, axis2=-1).sum(axis=-1) / total, 0.0)
+        metrics = {"accuracy": accuracy}
+        for name in ("precision", "recall", "f1_score"):
+            metrics[name] = (weights * scores[name]).sum(axis=-1)
+        for name, macro_name in zip(("precision", "recall", "f1_score"), MACRO_METRICS):
+            metrics[macro_name] = np.where(n_present > 0, (scores[name] * present).sum(axis=-1) / n_present, 0.0)
+
+    if np.ndim(confusion) == 2:
+        return {name: float(value) for name, value in metrics.items()}
+    return metrics
+
+
+def metrics_from_confusion(confusion: np.ndarray) -> Dict[str, float]:
+    """
+    Weighted classification metrics from a confusion matrix.
+
+    Args:
+        confusion: Counts with true labels as rows and predictions as columns
+
+    Returns:
+        Dictionary with accuracy, precision, recall and f1_score
+    """
+    metrics = confusion_metrics(confusion)
+    return {name: metrics[name] for name in WEIGHTED_METRICS}
+
+
+def per_class_report(confusion: np.ndarray, labels: Sequence) -> Dict[str, Dict[str, float]]:
+    """
+    Precision, recall, F1 and support of every class.
+
+    Args:
+        confusion: Confusion matrix indexed by ``labels``
+        labels: Class labels
+
+    Returns:
+        Dictionary keyed by the label as a string
+    """
+    scores = _class_scores(confusion)
+    return {
+        str(label): {
+            "precision": float(scores["precision"][index]),
+            "recall": float(scores["recall"][index]),
+            "f1_score": float(scores["f1_score"][index]),
+            "support": int(scores["support"][index]),
+        }
+        for index, label in enumerate(labels)
+    }
+
+
+def bootstrap_intervals(
+    confusion: np.ndarray,
+    n_bootstrap: int = DEFAULT_BOOTSTRAP_SAMPLES,
+    confidence: float = DEFAULT_CONFIDENCE,
+    random_seed: int = 42,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Percentile bootstrap confidence intervals of the confusion metrics.
+
+    Each replicate redraws the n evaluated rows with replacement, which only
+    changes the cell counts: they are drawn from a multinomial over the
+    observed cell frequencies, all replicates at once.
+
+    Args:
+        confusion: Confusion matrix of the evaluated rows
+        n_bootstrap: Number of bootstrap replicates
+        confidence: Coverage of the intervals, in (0, 1)
+        random_seed: Seed of the resampling
+
+    Returns:
+        Dictionary mapping every metric of ``confusion_metrics`` to its
+        ``low`` and ``high`` bounds (empty when there are no rows)
+
+    Raises:
+        ValueError: If n_bootstrap is not positive or confidence is not in (0, 1)
+    """
+    if n_bootstrap < 1:
+        raise ValueError(f"n_bootstrap must be positive, got {n_bootstrap}")
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be between 0 and 1, got {confidence}")
+
+    confusion = np.asarray(confusion, dtype=np.int64)
+    n_rows = int(confusion.sum())
+    if n_rows == 0:
+        return {}
+
+    rng = np.random.default_rng(random_seed)
+    samples = rng.multinomial(n_rows, confusion.ravel() / n_rows, size=n_bootstrap).reshape(-1, *confusion.shape)
+    replicates = confusion_metrics(samples)
+
+    alpha = (1 - confidence) / 2
+    return {
+        name: dict(zip(("low", "high"), np.quantile(values, [alpha, 1 - alpha]).tolist()))
+        for name, values in replicates.items()
+    }
+
+
+def probability_metrics(y_true: Any, probabilities: np.ndarray, classes: Sequence) -> Dict[str, float]:
+    """
+    Log-loss and multi-class Brier score of predicted probabilities.
+
+    Args:
+        y_true: True labels
+        probabilities: ``predict_proba`` output, one column per class
+        classes: Labels of the probability columns (the model's ``classes_``)
+
+    Returns:
+        Dictionary with log_loss and brier_score (mean squared distance to
+        the one-hot label, summed over classes; labels the model never saw
+        get probability 0)
+    """
+    y_true = np.asarray(y_true)
+    probabilities = np.asarray(probabilities, dtype=np.float64)
+    classes = np.asarray(classes)
+
+    order = np.argsort(classes)
+    position = np.searchsorted(classes[order], y_true).clip(max=len(classes) - 1)
+    column = order[position]
+    known = classes[column] == y_true
+    p_true = np.where(known, probabilities[np.arange(len(y_true)), column], 0.0)
+
+    return {
+        "log_loss": float(-np.log(np.clip(p_true, _PROBABILITY_EPS, 1.0)).mean()),
+        "brier_score": float(((probabilities ** 2).sum(axis=1) - 2 * p_true + 1).mean()),
+    }
+
+
+def evaluate_confusion(
+    confusion: np.ndarray,
+    labels: Sequence,
+    n_bootstrap: int = DEFAULT_BOOTSTRAP_SAMPLES,
+    confidence: float = DEFAULT_CONFIDENCE,
+    random_seed: int = 42,
+) -> Dict[str, Any]:
+    """
+    Full evaluation report of a confusion matrix.
+
+    Args:
+        confusion: Confusion matrix indexed by ``labels``
+        labels: Class labels (sorted)
+        n_bootstrap: Bootstrap replicates for the intervals (0 disables them)
+        confidence: Coverage of the intervals
+        random_seed: Seed of the resampling
+
+    Returns:
+        Dictionary with metrics, confidence_intervals (None when disabled),
+        confidence, n_bootstrap, per_class, labels and confusion_matrix
+    """
+    confusion = np.asarray(confusion, dtype=np.int64)
+    labels = np.asarray(labels)
+    intervals = bootstrap_intervals(confusion, n_bootstrap, confidence, random_seed) if n_bootstrap else None
+    return {
+        "metrics": confusion_metrics(confusion),
+        "confidence_intervals": intervals,
+        "confidence": confidence,
+        "n_bootstrap": n_bootstrap,
+        "per_class": per_class_report(confusion, labels),
+        "labels": labels.tolist(),
+        "confusion_matrix": confusion.tolist(),
+    }
+
+
+def evaluate(
+    y_true: Any,
+    y_pred: Any,
+    probabilities: Optional[np.ndarray] = None,
+    classes: Optional[Sequence] = None,
+    n_bootstrap: int = DEFAULT_BOOTSTRAP_SAMPLES,
+    confidence: float = DEFAULT_CONFIDENCE,
+    random_seed: int = 42,
+) -> Dict[str, Any]:
+    """
+    Evaluate predictions from a single confusion matrix.
+
+    Args:
+        y_true: True labels
+        y_pred: Predicted labels
+        probabilities: Optional ``predict_proba`` output for log-loss and Brier score
+        classes: Labels of the probability columns (required with probabilities)
+        n_bootstrap: Bootstrap replicates for the intervals (0 disables them)
+        confidence: Coverage of the intervals
+        random_seed: Seed of the resampling
+
+    Returns:
+        ``evaluate_confusion`` report plus probability_metrics (None without
+        probabilities)
+
+    Raises:
+        ValueError: If probabilities are given without classes
+    """
+    labels, confusion = confusion_matrix(y_true, y_pred)
+    report = evaluate_confusion(confusion, labels, n_bootstrap, confidence, random_seed)
+
+    report["probability_metrics"] = None
+    if probabilities is not None:
+        if classes is None:
+            raise ValueError("classes are required to evaluate probabilities")
+        report["probability_metrics"] = probability_metrics(y_true, probabilities, classes)
+    return report
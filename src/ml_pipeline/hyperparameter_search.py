@@ -0,0 +1,203 @@
+"""
+Hyperparameter search for ModelTrainer - grid or random candidates evaluated in parallel
+
+The model config may declare a ``search`` block next to ``hyperparameters``:
+
+    search:
+      strategy: random          # or grid (default)
+      n_iter: 20                # random only
+      metric: f1_score          # accuracy, precision, recall, f1_score or a macro average
+                                # (precision_macro, recall_macro, f1_macro)
+      param_grid:               # grid: lists of values
+        C: [0.1, 1.0, 10.0]
+      param_distributions:      # random: lists or distributions
+        C: {distribution: loguniform, low: 0.001, high: 100}
+        max_iter: [100, 200]
+
+Candidates are fanned out over a process pool. The train/test split is
+shared read-only with the workers through memory-mapped files (see
+``shared_arrays``) instead of being pickled into every task.
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy import stats
+from sklearn.model_selection import ParameterGrid, ParameterSampler
+
+from .evaluation import MACRO_METRICS, WEIGHTED_METRICS
+from .shared_arrays import (
+    cap_estimator_threads,
+    float_matrix,
+    get_shared_arrays,
+    resolve_workers,
+    shared_array_executor,
+)
+from .train_model import build_model, compute_metrics
+
+logger = logging.getLogger(__name__)
+
+SEARCH_METRICS = WEIGHTED_METRICS + MACRO_METRICS
+SEARCH_STRATEGIES = ("grid", "random")
+
+# Supported ``distribution`` names for random search
+DISTRIBUTIONS = {
+    "uniform": lambda low, high: stats.uniform(low, high - low),
+    "loguniform": lambda low, high: stats.loguniform(low, high),
+    "randint": lambda low, high: stats.randint(low, high),
+}
+
+
+def _parse_distribution(name: str, spec: Any) -> Any:
+    """Turn a YAML parameter spec into a list of values or a scipy distribution."""
+    if isinstance(spec, list):
+        return spec
+    if isinstance(spec, dict) and "distribution" in spec:
+        factory = DISTRIBUTIONS.get(spec["distribution"])
+        if factory is None:
+            raise ValueError(
+                f"Unknown distribution for {name}: {spec['distribution']}. "
+                f"Valid options: {', '.join(DISTRIBUTIONS)}"
+            )
+        return factory(spec["low"], spec["high"])
+    raise ValueError(f"Search parameter {name} must be a list of values or a distribution")
+
+
+def _to_builtin(value: Any) -> Any:
+    """Convert NumPy scalars to plain Python values for JSON output."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def build_candidates(search_config: Dict[str, Any], random_seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    Expand the search block of a model config into candidate hyperparameters.
+
+    Args:
+        search_config: The ``search`` block of the model config
+        random_seed: Seed for sampling random-search candidates
+
+    Returns:
+        List of hyperparameter dicts, one per candidate
+
+    Raises:
+        ValueError: If the strategy or a parameter spec is invalid
+    """
+    strategy = search_config.get("strategy", "grid")
+    if strategy == "grid":
+        grid = search_config.get("param_grid")
+        if not grid:
+            raise ValueError("Grid search requires a non-empty param_grid")
+        for name, values in grid.items():
+            if not isinstance(values, list):
+                raise ValueError(f"param_grid.{name} must be a list of values")
+        candidates = list(ParameterGrid(grid))
+    elif strategy == "random":
+        spec = search_config.get("param_distributions")
+        if not spec:
+            raise ValueError("Random search requires non-empty param_distributions")
+        distributions = {name: _parse_distribution(name, value) for name, value in spec.items()}
+        candidates = list(
+            ParameterSampler(distributions, n_iter=int(search_config.get("n_iter", 10)), random_state=random_seed)
+        )
+    else:
+        raise ValueError(f"Unknown search strategy: {strategy}. Valid options: {', '.join(SEARCH_STRATEGIES)}")
+
+    return [{name: _to_builtin(value) for name, value in params.items()} for params in candidates]
+
+
+def _evaluate_candidate(task: Tuple[int, str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Fit one candidate on the shared training split and score it on the test split."""
+    index, model_type, hyperparameters = task
+    shared = get_shared_arrays()
+    start = time.perf_counter()
+    try:
+        model = cap_estimator_threads(build_model(model_type, hyperparameters))
+        model.fit(shared["X_train"], shared["y_train"])
+        metrics = compute_metrics(shared["y_test"], model.predict(shared["X_test"]))
+        error = None
+    except Exception as e:
+        metrics = None
+        error = f"{type(e).__name__}: {e}"
+    return {
+        "candidate": index,
+        "metrics": metrics,
+        "fit_seconds": round(time.perf_counter() - start, 4),
+        "error": error,
+    }
+
+
+def run_search(
+    model_type: str,
+    base_hyperparameters: Dict[str, Any],
+    candidates: List[Dict[str, Any]],
+    X_train: Any,
+    X_test: Any,
+    y_train: Any,
+    y_test: Any,
+    metric: str = "f1_score",
+    n_jobs: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Evaluate candidate hyperparameters in parallel and rank them.
+
+    Args:
+        model_type: Config model type of every candidate
+        base_hyperparameters: Hyperparameters shared by all candidates
+        candidates: Per-candidate hyperparameters overriding the base ones
+        X_train: Training features
+        X_test: Test features
+        y_train: Training labels
+        y_test: Test labels
+        metric: Ranking metric (higher is better)
+        n_jobs: Worker processes (default: all cores; 1 runs in-process)
+
+    Returns:
+        Leaderboard, best first: rank, params, metrics, fit_seconds and error
+        (failed candidates are ranked last with metrics set to None)
+
+    Raises:
+        ValueError: If the metric is unknown
+    """
+    if metric not in SEARCH_METRICS:
+        raise ValueError(f"Unknown search metric: {metric}. Valid options: {', '.join(SEARCH_METRICS)}")
+
+    # Labels are stored as integer codes so the arrays can be memory-mapped
+    classes, y_codes = np.unique(np.concatenate([np.asarray(y_train), np.asarray(y_test)]), return_inverse=True)
+    arrays = {
+        "X_train": float_matrix(X_train),
+        "X_test": float_matrix(X_test),
+        "y_train": y_codes[:len(y_train)],
+        "y_test": y_codes[len(y_train):],
+    }
+    tasks = [
+        (index, model_type, {**base_hyperparameters, **params})
+        for index, params in enumerate(candidates)
+    ]
+    n_workers = resolve_workers(n_jobs, len(tasks))
+
+    logger.info(f"Evaluating {len(tasks)} {model_type} candidates on {n_workers} worker(s), ranking by {metric}")
+    with shared_array_executor(arrays, n_workers) as executor:
+        results = list(executor.map(_evaluate_candidate, tasks))
+
+    for result in results:
+        result["params"] = candidates[result["candidate"]]
+        if result["error"]:
+            logger.warning(f"Candidate {result['params']} failed: {result['error']}")
+
+    results.sort(key=lambda result: -result["metrics"][metric] if result["metrics"] else float("inf"))
+    leaderboard = [
+        {
+            "rank": rank,
+            "params": result["params"],
+            "metrics": result["metrics"],
+            "fit_seconds": result["fit_seconds"],
+            "error": result["error"],
+        }
+        for rank, result in enumerate(results, start=1)
+    ]
+
+    if leaderboard[0]["metrics"]:
+        logger.info(f"Best candidate: {leaderboard[0]['params']} ({metric}={leaderboard[0]['metrics'][metric]:.4f})")
+    return leaderboard
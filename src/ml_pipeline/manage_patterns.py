@@ -7,25 +7,18 @@ This module provides command-line tools for:
 - Listing active patterns
 - Manually triggering pattern discovery
 - Syncing patterns to database
+
+Only the standard library is imported at startup; asyncio, aiohttp and the
+pattern finder (pandas) are imported by the commands that use them, so
+``info`` runs without loading them.
 """
 
 import json
 import sys
-import asyncio
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-try:
-    import aiohttp
-except ImportError:
-    aiohttp = None
-
-try:
-    import pandas as pd
-except ImportError:
-    pd = None
-
 
 class PatternManager:
     """Manage rare patterns lifecycle and database operations."""
@@ -54,7 +47,11 @@ class PatternManager:
         :return: Response from edge function
         :raises Exception: If sync fails
         """
-        if not aiohttp:
+        import asyncio
+
+        try:
+            import aiohttp
+        except ImportError:
             raise ImportError(
                 "aiohttp required for sync. Install: pip install aiohttp"
             )
@@ -208,6 +205,8 @@ def main():
 
             manager = PatternManager(args.supabase_url, args.service_role_key)
 
+            import asyncio
+
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             result = loop.run_until_complete(manager.sync_patterns(patterns))
@@ -0,0 +1,166 @@
+"""
+Per-phase wall time and memory instrumentation for the training pipeline
+
+``PhaseProfiler.phase(name)`` times a block and samples the process's current
+resident set size (``/proc/self/statm``, Linux only) before and after it, so
+each phase reports the RSS it left behind and how much it added or released.
+The process-lifetime peak RSS (``ru_maxrss``) is reported once for the whole
+run: it never decreases, so it cannot be attributed to a phase. With ``trace_memory``
+it also records the peak Python allocation of the block through
+``tracemalloc``, which slows allocation-heavy code noticeably and is therefore
+opt-in. Phases may nest and may repeat; repeated phases are accumulated.
+"""
+
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+_MB = 1024 * 1024
+
+_STATM = "/proc/self/statm"
+
+
+def current_rss_mb() -> Optional[float]:
+    """Current resident set size of this process in MB (None off Linux)."""
+    try:
+        with open(_STATM) as f:
+            resident_pages = int(f.read().split()[1])
+    except OSError:
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / _MB
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Process-lifetime peak resident set size in MB (None if unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / _MB if sys.platform == "darwin" else peak / 1024
+
+
+class PhaseProfiler:
+    """Collects wall time and memory usage per named phase."""
+
+    def __init__(self, trace_memory: bool = False):
+        """
+        Initialize the profiler.
+
+        Args:
+            trace_memory: Also record peak Python allocations with tracemalloc
+        """
+        self.trace_memory = trace_memory
+        self.phases: Dict[str, Dict[str, Any]] = {}
+        self._started_tracing = False
+        self._stack: List[Dict[str, float]] = []
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time and sample the memory of a block.
+
+        Args:
+            name: Phase name; repeated phases are accumulated
+        """
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+
+        frame = {"alloc_start": 0.0, "alloc_peak": 0.0}
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                # Keep the enclosing phase's peak before resetting it for this one
+                self._stack[-1]["alloc_peak"] = max(self._stack[-1]["alloc_peak"], peak)
+            tracemalloc.reset_peak()
+            frame["alloc_start"] = current
+        self._stack.append(frame)
+        rss_start = current_rss_mb()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            rss_end = current_rss_mb()
+            self._stack.pop()
+
+            alloc_peak_mb = None
+            if tracing and tracemalloc.is_tracing():
+                peak = max(frame["alloc_peak"], tracemalloc.get_traced_memory()[1])
+                if self._stack:
+                    self._stack[-1]["alloc_peak"] = max(self._stack[-1]["alloc_peak"], peak)
+                tracemalloc.reset_peak()
+                alloc_peak_mb = (peak - frame["alloc_start"]) / _MB
+
+            self._record(name, seconds, rss_start, rss_end, alloc_peak_mb)
+
+    def _record(
+        self,
+        name: str,
+        seconds: float,
+        rss_start: Optional[float],
+        rss_end: Optional[float],
+        alloc_peak_mb: Optional[float],
+    ) -> None:
+        """Accumulate one run of a phase."""
+        record = self.phases.setdefault(name, {"seconds": 0.0, "calls": 0, "rss_mb": None, "rss_change_mb": None})
+        record["seconds"] += seconds
+        record["calls"] += 1
+        if rss_end is not None:
+            record["rss_mb"] = rss_end
+            record["rss_change_mb"] = (record["rss_change_mb"] or 0.0) + rss_end - rss_start
+        if alloc_peak_mb is not None:
+            record["alloc_peak_mb"] = max(record.get("alloc_peak_mb", 0.0), alloc_peak_mb)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Summarize all phases for JSON output.
+
+        Returns:
+            Dictionary with total_seconds since the profiler was created,
+            the current rss_mb, the process_peak_rss_mb over the process's
+            lifetime and per-phase seconds, calls, rss_mb (current RSS after
+            the latest run), rss_change_mb (summed over runs) and (when
+            tracing) alloc_peak_mb
+        """
+        rss = current_rss_mb()
+        peak = peak_rss_mb()
+        return {
+            "total_seconds": round(time.perf_counter() - self._start, 4),
+            "rss_mb": None if rss is None else round(rss, 2),
+            "process_peak_rss_mb": None if peak is None else round(peak, 2),
+            "trace_memory": self.trace_memory,
+            "phases": {
+                name: {key: round(value, 4) if isinstance(value, float) else value for key, value in record.items()}
+                for name, record in self.phases.items()
+            },
+        }
+
+    def log_summary(self) -> None:
+        """Log one line per phase."""
+        for name, record in self.phases.items():
+            memory = ""
+            if record["rss_mb"] is not None:
+                memory = f", rss {record['rss_mb']:.1f} MB ({record['rss_change_mb']:+.1f} MB)"
+            if "alloc_peak_mb" in record:
+                memory += f", alloc peak {record['alloc_peak_mb']:.1f} MB"
+            logger.info(f"Phase {name}: {record['seconds']:.3f}s over {record['calls']} call(s){memory}")
+
+    def close(self) -> None:
+        """Stop tracemalloc if this profiler started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
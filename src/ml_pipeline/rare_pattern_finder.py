@@ -20,12 +20,6 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta, timezone
 
-try:
-    import pandas as pd
-except ImportError:
-    print("ERROR: pandas is required. Install via: pip install pandas")
-    sys.exit(1)
-
 
 def find_rare_patterns(
     evaluation_log_path: str,
@@ -43,7 +37,14 @@ def find_rare_patterns(
     :return: List of high-value pattern dictionaries
     :raises FileNotFoundError: If evaluation log file doesn't exist
     :raises ValueError: If data is invalid or missing required columns
+    :raises ImportError: If pandas is not installed
     """
+    # Imported here so the CLI's argument handling starts without pandas
+    try:
+        import pandas as pd
+    except ImportError:
+        raise ImportError("pandas is required. Install via: pip install pandas")
+
     # Validate input file
     log_path = Path(evaluation_log_path)
     if not log_path.exists():
@@ -0,0 +1,168 @@
+"""
+Process pools that share read-only NumPy arrays with their workers
+
+Arrays are written once as ``.npy`` files in a temporary directory and every
+worker opens them with ``mmap_mode='r'``, so all workers read the same
+page-cached copy instead of receiving a pickle of X/y with every task. Task
+functions read them with ``get_shared_arrays()``.
+
+Pool workers split the machine's cores between them: each caps its native
+(OpenMP/BLAS) thread pools at its share, and tasks apply the same share to
+multi-threaded estimators with ``cap_estimator_threads``. Work the parent
+process runs next to a pool (such as the cross-validation refit) takes the
+same share with ``limit_threads``.
+"""
+
+import os
+import tempfile
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+# Arrays opened by the current process (see ``_open_arrays``)
+_arrays: Dict[str, np.ndarray] = {}
+# Threads available to one pool worker (None outside pools and in-process)
+_worker_threads: Optional[int] = None
+
+
+def get_shared_arrays() -> Dict[str, np.ndarray]:
+    """Return the read-only arrays shared with the current worker."""
+    return _arrays
+
+
+def _open_arrays(data_dir: str, names: tuple, n_threads: Optional[int] = None) -> None:
+    """Memory-map the shared arrays in a worker process and apply its thread budget."""
+    global _worker_threads
+
+    for name in names:
+        _arrays[name] = np.load(Path(data_dir) / f"{name}.npy", mmap_mode="r")
+    if n_threads is not None:
+        from threadpoolctl import threadpool_limits
+
+        # Kept for the lifetime of the worker process
+        threadpool_limits(limits=n_threads)
+        _worker_threads = n_threads
+
+
+def worker_threads(n_workers: int) -> int:
+    """Threads available to each of ``n_workers`` processes sharing the machine."""
+    return max(1, (os.cpu_count() or 1) // n_workers)
+
+
+def thread_budget() -> Optional[int]:
+    """Thread budget of the current process (None when it may use all cores)."""
+    return _worker_threads
+
+
+@contextmanager
+def limit_threads(n_threads: int, estimator: Any = None) -> Iterator[None]:
+    """
+    Run a block in the calling process under a thread budget.
+
+    Native thread pools are capped with threadpoolctl, ``thread_budget()``
+    returns ``n_threads`` and the ``n_jobs`` of ``estimator`` is capped for
+    the duration of the block, then restored so a saved model keeps its
+    configured value.
+
+    Args:
+        n_threads: Threads available to the block
+        estimator: Optional scikit-learn estimator fitted in the block
+    """
+    global _worker_threads
+    from threadpoolctl import threadpool_limits
+
+    previous = _worker_threads
+    has_n_jobs = estimator is not None and "n_jobs" in estimator.get_params()
+    n_jobs = estimator.get_params()["n_jobs"] if has_n_jobs else None
+    _worker_threads = n_threads
+    try:
+        with threadpool_limits(limits=n_threads):
+            if has_n_jobs:
+                cap_estimator_threads(estimator)
+            yield
+    finally:
+        _worker_threads = previous
+        if has_n_jobs:
+            estimator.set_params(n_jobs=n_jobs)
+
+
+def cap_estimator_threads(estimator: Any) -> Any:
+    """
+    Limit a multi-threaded estimator to the current worker's thread budget.
+
+    Args:
+        estimator: scikit-learn estimator; updated in place
+
+    Returns:
+        The estimator (unchanged outside pool workers or without ``n_jobs``)
+    """
+    if _worker_threads is not None and "n_jobs" in estimator.get_params():
+        estimator.set_params(n_jobs=_worker_threads)
+    return estimator
+
+
+class _InlineExecutor(Executor):
+    """Runs tasks immediately in the calling process (single worker)."""
+
+    def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+def float_matrix(X: Any) -> np.ndarray:
+    """
+    Return X as a floating-point array, keeping float32 input in single precision.
+
+    Categorical DataFrame columns are replaced by their category codes (NaN
+    for missing values), which estimators with native categorical support
+    treat as categories when told which columns they are.
+    """
+    if isinstance(X, pd.DataFrame):
+        categorical = [col for col, dtype in X.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)]
+        if categorical:
+            X = X.assign(**{col: X[col].cat.codes.replace(-1, np.nan).astype(np.float64) for col in categorical})
+    array = np.asarray(X)
+    return array if array.dtype in (np.float32, np.float64) else array.astype(np.float64)
+
+
+def resolve_workers(n_jobs: Optional[int], n_tasks: int) -> int:
+    """Number of worker processes for ``n_tasks`` (default: all cores)."""
+    return max(1, min(n_jobs or os.cpu_count() or 1, n_tasks))
+
+
+@contextmanager
+def shared_array_executor(arrays: Dict[str, np.ndarray], n_workers: int) -> Iterator[Executor]:
+    """
+    Executor whose workers can read ``arrays`` through ``get_shared_arrays()``.
+
+    Args:
+        arrays: Numeric arrays to share (object arrays cannot be memory-mapped)
+        n_workers: Worker processes; 1 runs tasks in the calling process
+
+    Yields:
+        Executor for submitting module-level task functions
+    """
+    with tempfile.TemporaryDirectory(prefix="ml_pipeline_shared_") as data_dir:
+        for name, array in arrays.items():
+            np.save(Path(data_dir) / f"{name}.npy", np.ascontiguousarray(array))
+        names = tuple(arrays)
+
+        if n_workers <= 1:
+            _open_arrays(data_dir, names)
+            try:
+                yield _InlineExecutor()
+            finally:
+                _arrays.clear()
+        else:
+            with ProcessPoolExecutor(
+                max_workers=n_workers, initializer=_open_arrays, initargs=(data_dir, names, worker_threads(n_workers))
+            ) as executor:
+                yield executor
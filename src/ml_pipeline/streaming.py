@@ -0,0 +1,181 @@
+"""
+Out-of-core training for ModelTrainer - datasets streamed in chunks through partial_fit
+
+The dataset is never held in memory as a whole: every pass reads it again in
+chunks of ``chunk_size`` rows (projected to the configured columns). Rows are
+assigned to the holdout by a hash of their position and the random seed, so
+the split is reproducible and independent of the chunk size without a
+shuffle. Metrics are computed from a confusion matrix accumulated over the
+holdout chunks, so peak memory is bounded by the chunk size.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .evaluation import metrics_from_confusion
+from .train_model import iter_dataset
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 100_000
+HOLDOUT_FRACTION = 0.2
+
+
+def iter_dataset_chunks(
+    data_path: str,
+    columns: List[str],
+    dtypes: Optional[Dict[str, str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """
+    Read the given columns of a CSV, Parquet or Feather dataset in chunks.
+
+    Args:
+        data_path: Path to the dataset; the format is chosen by file suffix
+        columns: Columns to read (columns absent from the file are skipped
+            so the caller can report them)
+        dtypes: Optional dtypes by column, e.g. ``float32`` or ``category``
+        chunk_size: Maximum rows per chunk
+
+    Yields:
+        DataFrames of at most ``chunk_size`` rows, in file order
+
+    Raises:
+        FileNotFoundError: If the dataset does not exist
+        ImportError: If pyarrow is missing for Parquet/Feather input
+        ValueError: If chunk_size is not positive
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    yield from iter_dataset(data_path, columns, dtypes, chunk_size)
+
+
+def holdout_mask(start: int, n_rows: int, random_seed: int, fraction: float = HOLDOUT_FRACTION) -> np.ndarray:
+    """
+    Select holdout rows by a hash of their position in the dataset.
+
+    Args:
+        start: Position of the first row
+        n_rows: Number of rows
+        random_seed: Seed mixed into the hash
+        fraction: Expected fraction of holdout rows
+
+    Returns:
+        Boolean mask, True for holdout rows
+    """
+    # splitmix64 of (position, seed): uniform, stateless and cheap to vectorize
+    with np.errstate(over="ignore"):
+        z = np.arange(start, start + n_rows, dtype=np.uint64) + np.uint64(random_seed) * np.uint64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        z ^= z >> np.uint64(31)
+    return (z >> np.uint64(11)) * 2.0 ** -53 < fraction
+
+
+def stream_classes(chunks: Iterator[pd.DataFrame], target_column: str) -> np.ndarray:
+    """Collect the sorted distinct target values over all chunks."""
+    classes: set = set()
+    for chunk in chunks:
+        classes.update(pd.unique(chunk[target_column].dropna()))
+    return np.array(sorted(classes))
+
+
+def fit_streaming(
+    model: Any,
+    chunks: Callable[[], Iterator[pd.DataFrame]],
+    input_features: Sequence[str],
+    target_column: str,
+    classes: np.ndarray,
+    random_seed: int = 42,
+    epochs: int = 1,
+) -> Dict[str, int]:
+    """
+    Train a ``partial_fit`` estimator on the non-holdout rows of streamed chunks.
+
+    Args:
+        model: Estimator with ``partial_fit``; updated in place
+        chunks: Callable returning a fresh iterator of dataset chunks
+        input_features: Feature columns
+        target_column: Target column
+        classes: All classes of the model (sorted); rows with other labels are skipped
+        random_seed: Seed of the holdout assignment
+        epochs: Number of passes over the training rows
+
+    Returns:
+        Dictionary with the rows, train_rows and chunks of one pass
+
+    Raises:
+        ValueError: If the estimator has no partial_fit, epochs is not
+            positive or no row can be used for training
+    """
+    if not hasattr(model, "partial_fit"):
+        raise ValueError(f"Streaming training requires an estimator with partial_fit, got {type(model).__name__}")
+    if epochs < 1:
+        raise ValueError(f"epochs must be positive, got {epochs}")
+
+    features = list(input_features)
+    stats = {"rows": 0, "train_rows": 0, "chunks": 0}
+    for epoch in range(epochs):
+        start = 0
+        for chunk in chunks():
+            n_rows = len(chunk)
+            y = chunk[target_column].to_numpy()
+            train = ~holdout_mask(start, n_rows, random_seed) & np.isin(y, classes)
+            start += n_rows
+            if epoch == 0:
+                stats["rows"] += n_rows
+                stats["train_rows"] += int(train.sum())
+                stats["chunks"] += 1
+            if train.any():
+                model.partial_fit(chunk.loc[train, features], y[train], classes=classes)
+        if stats["train_rows"] == 0:
+            raise ValueError("No training rows with a known class in the dataset")
+        logger.info(f"Streaming epoch {epoch + 1}/{epochs} complete ({stats['train_rows']} training rows)")
+
+    return stats
+
+
+def evaluate_streaming(
+    model: Any,
+    chunks: Callable[[], Iterator[pd.DataFrame]],
+    input_features: Sequence[str],
+    target_column: str,
+    classes: np.ndarray,
+    random_seed: int = 42,
+) -> Dict[str, Any]:
+    """
+    Evaluate a fitted estimator on the holdout rows of streamed chunks.
+
+    Args:
+        model: Fitted estimator
+        chunks: Callable returning a fresh iterator of dataset chunks
+        input_features: Feature columns
+        target_column: Target column
+        classes: Classes of the model (sorted); rows with other labels are skipped
+        random_seed: Seed of the holdout assignment (as used for fitting)
+
+    Returns:
+        Dictionary with the holdout ``metrics``, the ``confusion_matrix``
+        (true classes as rows) and ``holdout_rows``
+    """
+    features = list(input_features)
+    confusion = np.zeros((len(classes), len(classes)), dtype=np.int64)
+    start = 0
+    for chunk in chunks():
+        n_rows = len(chunk)
+        y = chunk[target_column].to_numpy()
+        holdout = holdout_mask(start, n_rows, random_seed) & np.isin(y, classes)
+        start += n_rows
+        if holdout.any():
+            true_index = np.searchsorted(classes, y[holdout])
+            pred_index = np.searchsorted(classes, model.predict(chunk.loc[holdout, features]))
+            np.add.at(confusion, (true_index, pred_index), 1)
+
+    return {
+        "metrics": metrics_from_confusion(confusion),
+        "confusion_matrix": confusion.tolist(),
+        "holdout_rows": int(confusion.sum()),
+    }
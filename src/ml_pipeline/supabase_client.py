@@ -3,11 +3,11 @@ Supabase client for ML Pipeline
 """
 
 import logging
-from typing import Optional
+from pathlib import Path
+from typing import Iterator, Optional
+from urllib.parse import quote
 
-from supabase import create_client
-
-from .config import SUPABASE_SERVICE_KEY, SUPABASE_URL
+from .config import DOWNLOAD_CHUNK_SIZE, SUPABASE_SERVICE_KEY, SUPABASE_URL
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +18,9 @@ def get_supabase_client():
     """
     Get or create Supabase client singleton
     
+    The Supabase SDK is imported here rather than at module import, so
+    entry points that never reach the database do not pay for loading it.
+    
     Returns:
         Supabase client instance
     """
@@ -29,6 +32,8 @@ def get_supabase_client():
                 "SUPABASE_URL and SUPABASE_SERVICE_KEY environment variables are required"
             )
         
+        from supabase import create_client
+        
         _supabase_client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
         logger.info("Supabase client initialized")
     
@@ -39,6 +44,9 @@ def download_file_from_storage(bucket: str, path: str, local_path: str) -> str:
     """
     Download file from Supabase Storage
     
+    The file is streamed to disk in chunks; a partial file is removed if
+    the download fails.
+    
     Args:
         bucket: Storage bucket name
         path: Path to file in bucket
@@ -47,20 +55,123 @@ def download_file_from_storage(bucket: str, path: str, local_path: str) -> str:
     Returns:
         Path to downloaded file
     """
-    client = get_supabase_client()
-    
     try:
-        data = client.storage.from_(bucket).download(path)
-        
         with open(local_path, "wb") as f:
-            f.write(data)
+            for chunk in stream_file_from_storage(bucket, path):
+                f.write(chunk)
+    except BaseException:
+        Path(local_path).unlink(missing_ok=True)
+        raise
+    
+    logger.info(f"Downloaded {path} from {bucket} to {local_path}")
+    return local_path
+
+
+def stream_file_from_storage(
+    bucket: str,
+    path: str,
+    start: int = 0,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Stream a file from Supabase Storage in chunks as they arrive
+    
+    Args:
+        bucket: Storage bucket name
+        path: Path to file in bucket
+        start: Offset of the first byte, requested with an HTTP Range header
+        chunk_size: Maximum bytes per chunk
         
-        logger.info(f"Downloaded {path} from {bucket} to {local_path}")
-        return local_path
+    Yields:
+        Consecutive chunks of the file from ``start`` (nothing if the file
+        is not longer)
+    """
+    if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
+        raise ValueError(
+            "SUPABASE_URL and SUPABASE_SERVICE_KEY environment variables are required"
+        )
+    
+    import httpx
+    
+    url = f"{SUPABASE_URL.rstrip('/')}/storage/v1/object/{quote(bucket, safe='')}/{quote(path)}"
+    headers = {
+        "apikey": SUPABASE_SERVICE_KEY,
+        "Authorization": f"Bearer {SUPABASE_SERVICE_KEY}",
+    }
+    if start:
+        headers["Range"] = f"bytes={start}-"
+    
+    try:
+        with httpx.stream("GET", url, headers=headers, timeout=60.0) as response:
+            if start and response.status_code == 416:
+                # Range not satisfiable: nothing past start
+                return
+            response.raise_for_status()
+            
+            skip = 0
+            if start and response.status_code != 206:
+                # The server ignored the range and sends the whole file
+                logger.warning(f"Range request for {path} returned the full file")
+                skip = start
+            for chunk in response.iter_bytes(chunk_size):
+                if skip:
+                    dropped = min(skip, len(chunk))
+                    chunk, skip = chunk[dropped:], skip - dropped
+                if chunk:
+                    yield chunk
+    except Exception as e:
+        logger.error(f"Failed to download {path} from {bucket} starting at byte {start}: {str(e)}")
+        raise
+
+
+def get_storage_file_info(bucket: str, path: str) -> Optional[dict]:
+    """
+    Get size and ETag of a file in Supabase Storage without downloading it
+
+    Args:
+        bucket: Storage bucket name
+        path: Path to file in bucket
+
+    Returns:
+        Dictionary with size (None if unknown), etag and updated_at, or None
+        if the file does not exist
+    """
+    client = get_supabase_client()
+    folder, _, name = path.rpartition("/")
+
+    try:
+        entries = client.storage.from_(bucket).list(folder, {"search": name})
     except Exception as e:
-        logger.error(f"Failed to download {path} from {bucket}: {str(e)}")
+        logger.error(f"Failed to get info of {path} in {bucket}: {str(e)}")
         raise
 
+    for entry in entries:
+        if entry.get("name") == name:
+            metadata = entry.get("metadata") or {}
+            return {
+                "size": int(metadata["size"]) if "size" in metadata else None,
+                "etag": metadata.get("eTag"),
+                "updated_at": entry.get("updated_at"),
+            }
+    return None
+
+
+def download_range_from_storage(bucket: str, path: str, start: int) -> bytes:
+    """
+    Download the tail of a file in Supabase Storage with an HTTP Range request
+
+    Args:
+        bucket: Storage bucket name
+        path: Path to file in bucket
+        start: Offset of the first byte to download
+
+    Returns:
+        Bytes from ``start`` to the end of the file (empty if the file is not longer)
+    """
+    data = b"".join(stream_file_from_storage(bucket, path, start))
+    logger.info(f"Downloaded {len(data)} bytes of {path} from {bucket} starting at byte {start}")
+    return data
+
 
 def upload_file_to_storage(bucket: str, path: str, file_path: str) -> str:
     """
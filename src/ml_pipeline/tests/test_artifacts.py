@@ -0,0 +1,137 @@
+"""Unit tests for artifacts module"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import SGDClassifier
+
+from ml_pipeline.artifacts import artifact_info, is_artifact, load_artifact, save_artifact
+from ml_pipeline.train_model import ModelTrainer, TrainingError
+
+
+class TestArtifacts(unittest.TestCase):
+    """Tests for saving and memory-mapping model artifacts"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "model.pkl"
+        rng = np.random.default_rng(0)
+        # Wide enough that the coefficients exceed the mapping threshold
+        self.X = rng.standard_normal((300, 2000))
+        self.y = np.where(self.X[:, 0] > 0, "home_win", "away_win")
+        self.model = SGDClassifier(random_state=0).fit(self.X, self.y)
+
+    def tearDown(self):
+        """Remove the artifacts"""
+        self.tmpdir.cleanup()
+
+    def test_round_trip_modes(self):
+        """Test that every mode restores the model and only "r" is read-only"""
+        info = save_artifact(self.model, self.path)
+
+        self.assertEqual(info["mapped_arrays"], 1)
+        self.assertEqual(info["mapped_bytes"], self.model.coef_.nbytes)
+        self.assertEqual(artifact_info(self.path)["size"], self.path.stat().st_size)
+        for mode, writeable in (("r", False), ("c", True), (None, True)):
+            loaded = load_artifact(self.path, mmap_mode=mode)
+            np.testing.assert_array_equal(loaded.predict(self.X), self.model.predict(self.X))
+            self.assertEqual(loaded.coef_.flags.writeable, writeable, mode)
+
+    def test_copy_on_write_leaves_file_unchanged(self):
+        """Test that updating a copy-on-write model does not write the artifact"""
+        save_artifact(self.model, self.path)
+        content = self.path.read_bytes()
+
+        loaded = load_artifact(self.path, mmap_mode="c")
+        loaded.partial_fit(self.X, self.y)
+
+        self.assertFalse(np.array_equal(loaded.coef_, self.model.coef_))
+        self.assertEqual(self.path.read_bytes(), content)
+        np.testing.assert_array_equal(load_artifact(self.path).coef_, self.model.coef_)
+
+    def test_tree_ensembles(self):
+        """Test that forests and gradient boosting round-trip"""
+        X, y = self.X[:, :5], self.y
+        for model in (
+            RandomForestClassifier(n_estimators=5, random_state=0),
+            HistGradientBoostingClassifier(max_iter=5),
+        ):
+            model.fit(X, y)
+            save_artifact(model, self.path)
+            np.testing.assert_array_equal(load_artifact(self.path).predict_proba(X), model.predict_proba(X))
+
+    def test_small_arrays_stay_in_the_pickle(self):
+        """Test the mapping threshold"""
+        self.assertEqual(save_artifact(self.model, self.path, mmap_threshold=10 ** 9)["mapped_arrays"], 0)
+        np.testing.assert_array_equal(load_artifact(self.path).coef_, self.model.coef_)
+
+    def test_overwrite_keeps_mapped_readers_consistent(self):
+        """Test that saving over a mapped artifact replaces the file instead of rewriting it"""
+        save_artifact(self.model, self.path)
+        mapped = load_artifact(self.path)
+        expected = mapped.coef_.copy()
+
+        save_artifact(SGDClassifier(random_state=1).fit(self.X[:, ::-1], self.y), self.path)
+
+        np.testing.assert_array_equal(mapped.coef_, expected)
+        self.assertEqual([path.name for path in self.path.parent.iterdir()], ["model.pkl"])
+
+    def test_joblib_files_still_load(self):
+        """Test that artifacts written with joblib load through the joblib fallback"""
+        joblib.dump(self.model, self.path)
+
+        self.assertFalse(is_artifact(self.path))
+        np.testing.assert_array_equal(load_artifact(self.path, mmap_mode=None).coef_, self.model.coef_)
+        with self.assertRaises(ValueError):
+            artifact_info(self.path)
+
+    def test_invalid_artifacts(self):
+        """Test unsupported modes and truncated files"""
+        save_artifact(self.model, self.path)
+        with self.assertRaises(ValueError):
+            load_artifact(self.path, mmap_mode="r+")
+
+        self.path.write_bytes(self.path.read_bytes()[:-100])
+        with self.assertRaises(ValueError):
+            load_artifact(self.path)
+        with self.assertRaises(FileNotFoundError):
+            load_artifact(self.path.with_name("missing.pkl"))
+
+
+class TestTrainerArtifacts(unittest.TestCase):
+    """Tests for ModelTrainer saving and fine-tuning artifacts"""
+
+    def test_fine_tune_saved_model(self):
+        """Test that a saved SGD model can be fine-tuned in place after loading"""
+        rng = np.random.default_rng(1)
+        X = pd.DataFrame(rng.standard_normal((400, 1200)), columns=[f"f{i}" for i in range(1200)])
+        y = pd.Series(np.where(X["f0"] > 0, "home_win", "away_win"))
+        trainer = ModelTrainer()
+        trainer.config = {"model_type": "SGDClassifier", "hyperparameters": {}}
+        trainer.create_model()
+        trainer.fit_model(X, y)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            model_path = trainer.save_model(tmpdir)
+            self.assertTrue(is_artifact(model_path))
+            saved = trainer.model.coef_.copy()
+
+            tuner = ModelTrainer()
+            tuner.config = trainer.config
+            tuner.load_existing_model(model_path)
+            tuner.fine_tune(X, y, epochs=2)
+
+            self.assertFalse(np.array_equal(tuner.model.coef_, saved))
+            np.testing.assert_array_equal(load_artifact(model_path).coef_, saved)
+            with self.assertRaises(TrainingError):
+                tuner.load_existing_model(str(Path(tmpdir) / "missing.pkl"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,232 @@
+"""Unit tests for auto_reinforcement module"""
+
+import functools
+import os
+import tempfile
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from ml_pipeline import auto_reinforcement, hyperparameter_search, train_model, training_cache
+from ml_pipeline.auto_reinforcement import run_auto_reinforcement, run_training
+from ml_pipeline.train_model import TrainingError, TrainingResult
+
+
+def _slow_train(**kwargs):
+    """Stand-in for train that never finishes in time."""
+    time.sleep(30)
+
+
+def _failing_train(**kwargs):
+    """Stand-in for train that fails."""
+    raise TrainingError("boom")
+
+
+def _pool_train(**kwargs):
+    """Stand-in for train that starts a worker pool and never finishes in time."""
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        worker_pid = pool.submit(os.getpid).result()
+        Path(kwargs["output_dir"], "worker.pid").write_text(str(worker_pid))
+        time.sleep(30)
+
+
+def _is_running(pid):
+    """Whether ``pid`` is a live (not zombie) process."""
+    try:
+        state = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()[0]
+    except (FileNotFoundError, ProcessLookupError):
+        return False
+    return state not in ("Z", "X")
+
+
+# Isolated tests patch module attributes, which only a forked child inherits
+requires_fork = unittest.skipUnless(
+    auto_reinforcement.ISOLATION_CONTEXT.get_start_method() == "fork",
+    "isolated runs do not fork on this platform",
+)
+
+
+class TestRunTraining(unittest.TestCase):
+    """Tests for in-process and isolated training runs"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.root = Path(tmpdir.name)
+
+        rng = np.random.default_rng(8)
+        self.dataset_path = str(self.root / "errors.csv")
+        pd.DataFrame({
+            "feature1": rng.standard_normal(80),
+            "target": rng.choice(["home_win", "away_win"], 80),
+        }).to_csv(self.dataset_path, index=False)
+        self.config_path = str(self.root / "model_config.yaml")
+        with open(self.config_path, "w") as f:
+            yaml.safe_dump({
+                "model_type": "SGDClassifier",
+                "input_features": ["feature1"],
+                "target_column": "target",
+                "hyperparameters": {"random_state": 0},
+            }, f)
+
+        for patcher in (
+            patch.object(train_model, "insert_system_log"),
+            patch.object(training_cache, "TRAINING_CACHE_DIR", self.root / "cache"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_in_process_returns_training_result(self):
+        """Test that training runs in-process and returns a TrainingResult"""
+        result = run_training(
+            self.dataset_path, str(self.root / "in_process"), fine_tune=False, config=self.config_path
+        )
+
+        self.assertIsInstance(result, TrainingResult)
+        self.assertTrue(Path(result.model_path).is_file())
+        self.assertEqual(result.dataset_size, 80)
+        self.assertFalse(result.cache_hit)
+
+    @requires_fork
+    def test_isolated_matches_in_process(self):
+        """Test that an isolated run returns the same result object contents"""
+        isolated = run_training(
+            self.dataset_path, str(self.root / "isolated"), fine_tune=False, config=self.config_path, isolate=True
+        )
+        in_process = run_training(
+            self.dataset_path, str(self.root / "in_process"), fine_tune=False, config=self.config_path
+        )
+
+        self.assertIsInstance(isolated, TrainingResult)
+        self.assertEqual(isolated.metrics, in_process.metrics)
+        # The isolated run populated the cache for the identical in-process run
+        self.assertTrue(in_process.cache_hit)
+        self.assertEqual(in_process.model_path, isolated.model_path)
+
+    @requires_fork
+    def test_isolated_run_can_start_worker_pools(self):
+        """Test that an isolated run may start the process pool of a hyperparameter search"""
+        with open(self.config_path) as f:
+            config = yaml.safe_load(f)
+        config["search"] = {"param_grid": {"alpha": [0.0001, 0.001]}}
+        with open(self.config_path, "w") as f:
+            yaml.safe_dump(config, f)
+
+        # Two pool workers even on a single core (the forked child inherits the patch)
+        with patch.object(hyperparameter_search, "resolve_workers", return_value=2):
+            result = run_training(
+                self.dataset_path, str(self.root / "search"), fine_tune=False, config=self.config_path, isolate=True
+            )
+
+        self.assertIsInstance(result, TrainingResult)
+        self.assertEqual(len(result.leaderboard), 2)
+
+    @requires_fork
+    def test_isolated_timeout(self):
+        """Test that an isolated run is killed after the timeout"""
+        with patch.object(auto_reinforcement, "train", _slow_train):
+            start = time.perf_counter()
+            result = run_training(self.dataset_path, str(self.root), isolate=True, timeout=0.5)
+
+        self.assertIsNone(result)
+        self.assertLess(time.perf_counter() - start, 10)
+
+    @requires_fork
+    @unittest.skipUnless(os.path.isdir("/proc") and hasattr(os, "killpg"), "needs /proc and process groups")
+    def test_isolated_timeout_stops_worker_pools(self):
+        """Test that pool workers started by a timed-out isolated run are stopped too"""
+        with patch.object(auto_reinforcement, "train", _pool_train):
+            self.assertIsNone(run_training(self.dataset_path, str(self.root), isolate=True, timeout=5))
+
+        worker_pid = int((self.root / "worker.pid").read_text())
+        deadline = time.monotonic() + 5
+        while _is_running(worker_pid) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertFalse(_is_running(worker_pid))
+
+    @requires_fork
+    def test_failure_returns_none(self):
+        """Test that training failures are reported as None in both modes"""
+        with patch.object(auto_reinforcement, "train", _failing_train):
+            self.assertIsNone(run_training(self.dataset_path, str(self.root)))
+            self.assertIsNone(run_training(self.dataset_path, str(self.root), isolate=True))
+
+
+class TestRunAutoReinforcement(unittest.TestCase):
+    """Tests for repeated reinforcement runs"""
+
+    def setUp(self):
+        """Set up a base model, an error dataset and patched Supabase calls"""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.root = Path(tmpdir.name)
+
+        rng = np.random.default_rng(9)
+        self.dataset_path = str(self.root / "errors.csv")
+        pd.DataFrame({
+            "feature1": rng.standard_normal(80),
+            "target": rng.choice(["home_win", "away_win"], 80),
+        }).to_csv(self.dataset_path, index=False)
+        config_path = str(self.root / "model_config.yaml")
+        with open(config_path, "w") as f:
+            yaml.safe_dump({
+                "model_type": "SGDClassifier",
+                "input_features": ["feature1"],
+                "target_column": "target",
+                "hyperparameters": {"random_state": 0},
+            }, f)
+
+        self.system_log = patch.object(auto_reinforcement, "insert_system_log").start()
+        for patcher in (
+            patch.object(train_model, "insert_system_log"),
+            patch.object(training_cache, "TRAINING_CACHE_DIR", self.root / "cache"),
+            patch.object(auto_reinforcement, "MODELS_DIR", self.root / "models"),
+            patch.object(auto_reinforcement, "RETRAINED_MODELS_DIR", self.root / "retrained"),
+            patch.object(auto_reinforcement, "insert_retraining_run"),
+            patch.object(auto_reinforcement, "update_retraining_run"),
+            patch.object(auto_reinforcement, "prepare_retraining_data", return_value=(self.dataset_path, 80)),
+            patch.object(auto_reinforcement, "run_training", functools.partial(run_training, config=config_path)),
+        ):
+            patcher.start()
+        self.addCleanup(patch.stopall)
+
+        train_model.train(self.dataset_path, config=config_path, output_dir=str(self.root / "models"))
+
+    def last_training_details(self):
+        """Details of the last training outcome logged by the loop."""
+        calls = [call for call in self.system_log.call_args_list if "cache_hit" in call.kwargs["details"]]
+        return calls[-1].kwargs["details"]
+
+    def test_unchanged_dataset_is_not_trained_again(self):
+        """Test that a second run on the same errors reuses the first run's model without fitting"""
+        self.assertTrue(run_auto_reinforcement(isolate_training=False))
+        first = self.last_training_details()
+
+        with patch.object(train_model.ModelTrainer, "fit_model") as fit_model:
+            self.assertTrue(run_auto_reinforcement(isolate_training=False))
+        second = self.last_training_details()
+
+        self.assertFalse(first["cache_hit"])
+        self.assertTrue(second["cache_hit"])
+        self.assertEqual(second["model_path"], first["model_path"])
+        self.assertEqual(second["metrics"], first["metrics"])
+        fit_model.assert_not_called()
+
+        # New error samples are trained on, continuing from the first run's model
+        with open(self.dataset_path, "a") as f:
+            f.write("0.5,home_win\n")
+        self.assertTrue(run_auto_reinforcement(isolate_training=False))
+        third = self.last_training_details()
+        self.assertFalse(third["cache_hit"])
+        self.assertNotEqual(third["model_path"], first["model_path"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Unit tests for the baseline scoreline model artifact"""
+
+import unittest
+
+import numpy as np
+
+from models.baseline_model_artifact import BaselineScorelineModel
+
+
+def _reference_proba(model, rows):
+    """Per-row, per-class scoring exactly as the original implementation."""
+    probabilities = []
+    for row in rows:
+        vector = [float(value) for value in row]
+        class_scores = [model._score(vector, idx) for idx in range(len(model.classes_))]
+        total = sum(class_scores)
+        probabilities.append([score / total for score in class_scores])
+    return probabilities
+
+
+class TestBaselineScorelineModel(unittest.TestCase):
+    """Tests for BaselineScorelineModel"""
+
+    def setUp(self):
+        self.model = BaselineScorelineModel()
+
+    def test_predict_proba_array_bit_identical(self):
+        """Test that vectorized scoring matches the per-row path exactly"""
+        rng = np.random.default_rng(5)
+        for n_features in (1, 3, 8, 13):
+            # Wide dynamic range exercises summation order and rounding
+            features = rng.standard_normal((500, n_features)) * 10.0 ** rng.integers(-6, 7, (500, n_features))
+
+            probabilities = self.model.predict_proba_array(features)
+
+            self.assertEqual(probabilities.shape, (500, len(self.model.classes_)))
+            np.testing.assert_array_equal(probabilities, np.array(_reference_proba(self.model, features.tolist())))
+
+    def test_predict_proba_list_input(self):
+        """Test that list input returns lists identical to the per-row path"""
+        rows = [[0.5, -1.25, 3.0], [2, 0, 1], [1e-9, 1e9, -7.5]]
+
+        self.assertEqual(self.model.predict_proba(rows), _reference_proba(self.model, rows))
+        self.assertEqual(self.model.predict(rows), list(self.model.predict_array(np.array(rows))))
+
+    def test_predict_proba_ragged_rows(self):
+        """Test that rows of different lengths still use the per-row path"""
+        rows = [[0.5, 1.0], [1.0, 2.0, 3.0]]
+
+        self.assertEqual(self.model.predict_proba(iter(rows)), _reference_proba(self.model, rows))
+
+    def test_predict_proba_array_invalid_shape(self):
+        """Test that non-matrix input is rejected"""
+        with self.assertRaises(ValueError):
+            self.model.predict_proba_array(np.zeros((3, 0)))
+        with self.assertRaises(ValueError):
+            self.model.predict_proba_array(np.zeros(3))
+
+    def test_iter_predict_proba_streams_in_chunks(self):
+        """Test that streaming pulls one chunk at a time and matches batch scoring"""
+        features = np.random.default_rng(9).standard_normal((25, 4))
+        pulled = []
+
+        def rows():
+            for row in features.tolist():
+                pulled.append(row)
+                yield row
+
+        blocks = self.model.iter_predict_proba(rows(), chunk_size=10)
+        first = next(blocks)
+        self.assertEqual(first.shape, (10, len(self.model.classes_)))
+        self.assertEqual(len(pulled), 10)
+
+        remaining = list(blocks)
+        self.assertEqual([len(block) for block in remaining], [10, 5])
+        np.testing.assert_array_equal(np.vstack([first] + remaining), self.model.predict_proba_array(features))
+
+    def test_iter_predict_labels_and_proba(self):
+        """Test label blocks, (labels, proba) pairs and ndarray input"""
+        features = np.random.default_rng(3).standard_normal((12, 3))
+        expected = self.model.predict(features.tolist())
+
+        labels = np.concatenate(list(self.model.iter_predict(features, chunk_size=5)))
+        self.assertEqual(labels.tolist(), expected)
+
+        pairs = list(self.model.iter_predict(iter(features.tolist()), chunk_size=5, with_proba=True))
+        self.assertEqual([len(block) for block, _ in pairs], [5, 5, 2])
+        np.testing.assert_array_equal(np.vstack([proba for _, proba in pairs]), self.model.predict_proba_array(features))
+
+    def test_iter_predict_proba_invalid_chunk_size(self):
+        """Test that non-positive chunk sizes are rejected"""
+        with self.assertRaises(ValueError):
+            next(self.model.iter_predict_proba([[1.0]], chunk_size=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""Unit tests for cross_validation module"""
+
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+from ml_pipeline import shared_arrays
+from ml_pipeline.cross_validation import cross_validate
+from ml_pipeline.train_model import ModelTrainer
+
+
+class TestCrossValidation(unittest.TestCase):
+    """Tests for parallel k-fold cross-validation"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        rng = np.random.default_rng(1)
+        features = rng.standard_normal((120, 2))
+        self.X = pd.DataFrame({"feature1": features[:, 0], "feature2": features[:, 1]})
+        self.y = pd.Series(np.where(features[:, 0] + 0.5 * rng.standard_normal(120) > 0, "home_win", "away_win"))
+
+    def test_parallel_matches_serial(self):
+        """Test that worker processes produce the same folds and metrics as in-process runs"""
+        model = DecisionTreeClassifier(max_depth=3, random_state=0)
+
+        serial = cross_validate(model, self.X, self.y, n_folds=4, n_jobs=1)
+        parallel = cross_validate(model, self.X, self.y, n_folds=4, n_jobs=2)
+
+        self.assertEqual(serial["n_folds"], 4)
+        self.assertEqual([fold["metrics"] for fold in serial["folds"]], [fold["metrics"] for fold in parallel["folds"]])
+        self.assertEqual(sum(fold["test_size"] for fold in serial["folds"]), len(self.y))
+        accuracies = [fold["metrics"]["accuracy"] for fold in serial["folds"]]
+        self.assertAlmostEqual(serial["mean"]["accuracy"], np.mean(accuracies))
+        self.assertAlmostEqual(serial["std"]["accuracy"], np.std(accuracies))
+        self.assertFalse(hasattr(model, "classes_"))
+
+    def test_invalid_folds(self):
+        """Test that fewer than two folds are rejected"""
+        with self.assertRaises(ValueError):
+            cross_validate(LogisticRegression(), self.X, self.y, n_folds=1)
+
+    def test_train_and_evaluate_refits_on_all_data(self):
+        """Test that k-fold mode reports mean/std and refits the final model once on all data"""
+        trainer = ModelTrainer()
+        trainer.model = LogisticRegression(max_iter=200)
+
+        metrics = trainer.train_and_evaluate(self.X, self.y, cv_folds=3, n_jobs=2)
+
+        names = ["accuracy", "precision", "recall", "f1_score", "precision_macro", "recall_macro", "f1_macro"]
+        self.assertEqual(set(metrics), set(names) | {f"{name}_std" for name in names})
+        self.assertEqual(len(trainer.cv_results["folds"]), 3)
+        self.assertEqual(metrics["f1_score"], trainer.cv_results["mean"]["f1_score"])
+        reference = LogisticRegression(max_iter=200).fit(self.X, self.y)
+        np.testing.assert_allclose(trainer.model.coef_, reference.coef_)
+
+    def test_refit_gets_one_worker_share_of_threads(self):
+        """Test that the parent's refit is capped like a fold worker and the model keeps its n_jobs"""
+        from threadpoolctl import threadpool_info
+
+        model = RandomForestClassifier(n_estimators=5, n_jobs=-1, random_state=0)
+        seen = {}
+
+        def refit():
+            seen["budget"] = shared_arrays.thread_budget()
+            seen["n_jobs"] = model.n_jobs
+            seen["native"] = {pool["num_threads"] for pool in threadpool_info()}
+            model.fit(self.X, self.y)
+
+        with patch.object(shared_arrays.os, "cpu_count", return_value=4):
+            cross_validate(model, self.X, self.y, n_folds=2, n_jobs=2, refit=refit)
+
+        self.assertEqual(seen["budget"], 2)
+        self.assertEqual(seen["n_jobs"], 2)
+        self.assertTrue(all(n_threads <= 2 for n_threads in seen["native"]))
+        self.assertEqual(model.n_jobs, -1)
+        self.assertIsNone(shared_arrays.thread_budget())
+
+        # A trainer's own n_jobs cannot raise the cap during the refit
+        trainer = ModelTrainer()
+        trainer.config = {"n_jobs": 8}
+        with shared_arrays.limit_threads(2), trainer.thread_limits():
+            self.assertTrue(all(pool["num_threads"] <= 2 for pool in threadpool_info()))
+
+    def test_fine_tune_folds_start_from_loaded_model(self):
+        """Test that folds fine-tune copies while the final model is fine-tuned once on all data"""
+        trainer = ModelTrainer()
+        trainer.model = SGDClassifier(loss="log_loss", random_state=0).fit(self.X, self.y)
+        seen = trainer.model.t_
+
+        trainer.train_and_evaluate(self.X, self.y, fine_tune=True, epochs=2, cv_folds=3, n_jobs=1)
+
+        self.assertEqual(trainer.model.t_, seen + 2 * len(self.X))
+        self.assertEqual(len(trainer.cv_results["folds"]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
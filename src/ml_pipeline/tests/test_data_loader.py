@@ -1,5 +1,8 @@
 """Unit tests for data_loader module"""
 
+import hashlib
+import json
+import tempfile
 import unittest
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -7,10 +10,14 @@ from unittest.mock import MagicMock, patch
 
 import pandas as pd
 
+from ml_pipeline import data_loader, supabase_client
 from ml_pipeline.data_loader import (
     create_finetuning_dataset,
     filter_errors_for_retraining,
     generate_dataset_filename,
+    load_evaluation_log,
+    read_csv_from_storage,
+    sync_evaluation_log,
 )
 
 
@@ -121,5 +128,187 @@ class TestDataLoader(unittest.TestCase):
         self.assertIn("_", filename)  # Should have timestamp separator
 
 
+class FakeStorage:
+    """In-memory evaluation log standing in for Supabase Storage"""
+
+    def __init__(self, content: bytes):
+        self.content = content
+        self.downloaded_bytes = 0
+        self.full_downloads = 0
+
+    def info(self, bucket, path):
+        etag = hashlib.md5(self.content).hexdigest()
+        return {"size": len(self.content), "etag": f'"{etag}"', "updated_at": None}
+
+    def stream(self, bucket, path, start=0, chunk_size=100):
+        if start == 0:
+            self.full_downloads += 1
+        for offset in range(start, len(self.content), chunk_size):
+            chunk = self.content[offset:offset + chunk_size]
+            self.downloaded_bytes += len(chunk)
+            yield chunk
+
+    def download_range(self, bucket, path, start):
+        self.downloaded_bytes += max(len(self.content) - start, 0)
+        return self.content[start:]
+
+
+class TestEvaluationLogSync(unittest.TestCase):
+    """Tests for the delta sync of the cached evaluation log"""
+
+    def setUp(self):
+        """Set up a fake storage and an empty cache"""
+        self.rows = [f"2025-01-{day:02d},win,loss,0.9{day}\n" for day in range(1, 29)]
+        self.storage = FakeStorage(("match_date,predicted_outcome,actual_outcome,confidence\n"
+                                    + "".join(self.rows[:20])).encode())
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.tmpdir.name)
+        patches = [
+            patch.object(data_loader, "get_storage_file_info", self.storage.info),
+            patch.object(data_loader, "stream_file_from_storage", self.storage.stream),
+            patch.object(data_loader, "download_range_from_storage", self.storage.download_range),
+            patch.object(data_loader, "SYNC_OVERLAP_BYTES", 64),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Remove the cache"""
+        self.tmpdir.cleanup()
+
+    def watermark(self) -> dict:
+        """Read the watermark of the cached log"""
+        return json.loads((self.cache_dir / "evaluation_log.csv.watermark.json").read_text())
+
+    def test_unchanged_log_is_not_downloaded(self):
+        """Test that a matching ETag skips the download"""
+        log_path = sync_evaluation_log(self.cache_dir)
+        self.storage.downloaded_bytes = 0
+
+        self.assertEqual(sync_evaluation_log(self.cache_dir), log_path)
+        self.assertEqual(self.storage.downloaded_bytes, 0)
+        self.assertEqual(log_path.read_bytes(), self.storage.content)
+        self.assertEqual(self.watermark()["lines"], 21)
+
+    def test_appended_rows_are_fetched_alone(self):
+        """Test that a grown log downloads only the new bytes plus the overlap"""
+        log_path = sync_evaluation_log(self.cache_dir)
+        new_rows = "".join(self.rows[20:]).encode()
+        self.storage.content += new_rows
+        self.storage.downloaded_bytes = 0
+
+        sync_evaluation_log(self.cache_dir)
+
+        self.assertEqual(log_path.read_bytes(), self.storage.content)
+        self.assertEqual(self.storage.downloaded_bytes, len(new_rows) + 64)
+        self.assertEqual(self.storage.full_downloads, 1)
+        self.assertEqual(self.watermark()["lines"], 29)
+        self.assertEqual(self.watermark()["etag"], self.storage.info(None, None)["etag"])
+        self.assertEqual(len(load_evaluation_log(cache_dir=self.cache_dir)), 28)
+
+    def test_rewritten_log_is_downloaded_again(self):
+        """Test that a changed tail, a shorter log or a stale watermark trigger a full download"""
+        log_path = sync_evaluation_log(self.cache_dir)
+
+        self.storage.content = self.storage.content.replace(b"0.920", b"0.999") + self.rows[20].encode()
+        sync_evaluation_log(self.cache_dir)
+        self.assertEqual(self.storage.full_downloads, 2)
+
+        self.storage.content = self.storage.content[:200]
+        sync_evaluation_log(self.cache_dir)
+        self.assertEqual(self.storage.full_downloads, 3)
+
+        with open(log_path, "ab") as f:
+            f.write(b"partial")
+        sync_evaluation_log(self.cache_dir)
+        self.assertEqual(self.storage.full_downloads, 4)
+        self.assertEqual(log_path.read_bytes(), self.storage.content)
+
+    def test_cached_copy_used_when_storage_fails(self):
+        """Test that a failed sync falls back to the last complete copy"""
+        failing = patch.object(data_loader, "get_storage_file_info", side_effect=ConnectionError("offline"))
+        with failing:
+            self.assertIsNone(load_evaluation_log(cache_dir=self.cache_dir))
+
+        sync_evaluation_log(self.cache_dir)
+        with failing:
+            df = load_evaluation_log(cache_dir=self.cache_dir)
+        self.assertEqual(len(df), 20)
+
+    def test_interrupted_download_leaves_no_partial_file(self):
+        """Test that a failed full download keeps the previous copy and removes the partial file"""
+        log_path = sync_evaluation_log(self.cache_dir)
+        previous = log_path.read_bytes()
+        self.storage.content = b"rewritten," + self.storage.content
+
+        def failing_stream(bucket, path, start=0):
+            yield self.storage.content[:50]
+            raise ConnectionError("connection reset")
+
+        with patch.object(data_loader, "stream_file_from_storage", failing_stream):
+            with self.assertRaises(ConnectionError):
+                sync_evaluation_log(self.cache_dir)
+
+        self.assertEqual(log_path.read_bytes(), previous)
+        self.assertFalse(log_path.with_name("evaluation_log.csv.part").exists())
+
+
+class TestReadCsvFromStorage(unittest.TestCase):
+    """Tests for parsing downloads without named temp files"""
+
+    def setUp(self):
+        """Set up a fake storage and an empty temp directory"""
+        self.storage = FakeStorage(b"a,b\n" + b"".join(b"%d,%d\n" % (i, i * i) for i in range(500)))
+        self.tmpdir = tempfile.TemporaryDirectory()
+        patches = [
+            patch.object(data_loader, "stream_file_from_storage", self.storage.stream),
+            patch.object(data_loader, "TEMP_DIR", Path(self.tmpdir.name)),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Remove the temp directory"""
+        self.tmpdir.cleanup()
+
+    def test_parses_in_memory_and_spilled(self):
+        """Test that small and spilled downloads parse the same and leave no files"""
+        in_memory = read_csv_from_storage("bucket", "log.csv")
+        with self.assertLogs(data_loader.logger, level="INFO"):
+            spilled = read_csv_from_storage("bucket", "log.csv", spill_threshold=256)
+
+        self.assertEqual(len(in_memory), 500)
+        pd.testing.assert_frame_equal(in_memory, spilled)
+        self.assertEqual(list(Path(self.tmpdir.name).iterdir()), [])
+
+    def test_load_without_cache(self):
+        """Test that a disabled cache reads the log straight from Storage"""
+        df = load_evaluation_log(cache_dir=None)
+
+        self.assertEqual(list(df.columns), ["a", "b"])
+        self.assertEqual(self.storage.full_downloads, 1)
+
+    def test_storage_url_is_quoted(self):
+        """Test that bucket and path are percent-encoded in the download URL"""
+        response = MagicMock(status_code=200)
+        response.iter_bytes.return_value = [b"a,b\n"]
+        stream = MagicMock()
+        stream.return_value.__enter__.return_value = response
+        with (
+            patch.object(supabase_client, "SUPABASE_URL", "https://project.supabase.co/"),
+            patch.object(supabase_client, "SUPABASE_SERVICE_KEY", "key"),
+            patch("httpx.stream", stream),
+        ):
+            chunks = list(supabase_client.stream_file_from_storage("my bucket", "logs/eval #1?.csv"))
+
+        self.assertEqual(chunks, [b"a,b\n"])
+        self.assertEqual(
+            stream.call_args.args[1],
+            "https://project.supabase.co/storage/v1/object/my%20bucket/logs/eval%20%231%3F.csv",
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,88 @@
+"""Unit tests for ensemble_orchestrator module"""
+
+import asyncio
+import time
+import unittest
+
+from ml_pipeline.ensemble_orchestrator import EnsembleOrchestrator
+from ml_pipeline.ensemble_predictor import EnsemblePredictor
+
+
+def _slow_model(vote, delay):
+    """Build a sub-model callable that sleeps before voting."""
+    def model(fixture_id):
+        time.sleep(delay)
+        return vote
+    return model
+
+
+class TestEnsembleOrchestrator(unittest.TestCase):
+    """Tests for EnsembleOrchestrator class"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.predictor = EnsemblePredictor()
+
+    def test_predict_runs_sub_models_concurrently(self):
+        """Test that latency is bounded by the slowest model, not the sum"""
+        sub_models = {
+            "full_time": _slow_model(("HOME", 0.8), 0.2),
+            "half_time": _slow_model(("DRAW", 0.6), 0.2),
+            "pattern": _slow_model(("HOME", 0.7), 0.2),
+        }
+        with EnsembleOrchestrator(self.predictor, sub_models, deadline=2.0) as orchestrator:
+            start = time.perf_counter()
+            result = orchestrator.predict("fixture-1")
+            elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(result["winner"], "home_win")
+        self.assertEqual(set(result["latency_ms"]), {"full_time", "half_time", "pattern"})
+        self.assertEqual(result["timed_out"], [])
+
+    def test_predict_treats_late_model_as_missing(self):
+        """Test that a model missing the deadline is re-weighted away"""
+        sub_models = {
+            "full_time": _slow_model(("HOME", 0.8), 0.0),
+            "half_time": _slow_model(("AWAY", 0.9), 1.0),
+        }
+        with EnsembleOrchestrator(self.predictor, sub_models, deadline=0.2) as orchestrator:
+            result = orchestrator.predict("fixture-1")
+
+        self.assertEqual(result["timed_out"], ["half_time"])
+        self.assertEqual(result["weights_used"]["ft"], 1.0)
+        self.assertEqual(result["winner"], "home_win")
+
+    def test_predict_treats_failed_model_as_missing(self):
+        """Test that a raising model is reported and skipped"""
+        def broken(fixture_id):
+            raise RuntimeError("feature store unavailable")
+
+        sub_models = {"full_time": broken, "pattern": _slow_model(("DRAW", 0.5), 0.0)}
+        with EnsembleOrchestrator(self.predictor, sub_models) as orchestrator:
+            result = orchestrator.predict("fixture-1")
+
+        self.assertEqual(result["failed"], ["full_time"])
+        self.assertEqual(result["winner"], "draw")
+
+    def test_apredict_awaits_coroutines(self):
+        """Test async fan-out with coroutine and plain sub-models"""
+        async def async_model(fixture_id):
+            await asyncio.sleep(0.01)
+            return ("AWAY", 0.9)
+
+        sub_models = {"full_time": async_model, "half_time": _slow_model(("AWAY", 0.4), 0.0)}
+        with EnsembleOrchestrator(self.predictor, sub_models) as orchestrator:
+            result = asyncio.run(orchestrator.apredict("fixture-1"))
+
+        self.assertEqual(result["winner"], "away_win")
+        self.assertEqual(set(result["latency_ms"]), {"full_time", "half_time"})
+
+    def test_unregistered_sub_model(self):
+        """Test that unknown sub-model names are rejected"""
+        with self.assertRaises(ValueError):
+            EnsembleOrchestrator(self.predictor, {"market_odds": lambda fixture_id: None})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,447 @@
+"""Unit tests for ensemble_predictor module"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from ml_pipeline.ensemble_predictor import EnsemblePredictor, OUTCOMES
+from ml_pipeline.ensemble_results import EnsembleBatchResult, EnsembleResult
+
+
+def _random_inputs(n_rows, seed=7, missing_rate=0.3):
+    """Build random sub-model columns with some missing entries."""
+    rng = np.random.default_rng(seed)
+    labels = np.array(["HOME", "DRAW", "AWAY", "home_win", "draw", "away_win"], dtype=object)
+    columns = {}
+    for model_name in ("full_time", "half_time", "pattern"):
+        predictions = labels[rng.integers(0, len(labels), n_rows)]
+        confidences = rng.random(n_rows)
+        missing = rng.random(n_rows) < missing_rate
+        predictions[missing] = None
+        columns[f"{model_name}_prediction"] = predictions
+        columns[f"{model_name}_confidence"] = confidences
+    # Every row needs at least one active sub-model
+    columns["full_time_prediction"][
+        pd.isna(columns["full_time_prediction"])
+        & pd.isna(columns["half_time_prediction"])
+        & pd.isna(columns["pattern_prediction"])
+    ] = "HOME"
+    return columns
+
+
+class TestEnsemblePredictor(unittest.TestCase):
+    """Tests for EnsemblePredictor class"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.predictor = EnsemblePredictor()
+
+    def _scalar_results(self, columns):
+        """Run the scalar path row by row."""
+        results = []
+        for i in range(len(columns["full_time_prediction"])):
+            kwargs = {}
+            for name, values in columns.items():
+                value = values[i]
+                kwargs[name] = None if value is None or (isinstance(value, float) and np.isnan(value)) else value
+            results.append(self.predictor.predict(**kwargs))
+        return results
+
+    def test_predict_basic(self):
+        """Test scalar prediction with all sub-models"""
+        result = self.predictor.predict(
+            full_time_prediction="HOME",
+            full_time_confidence=0.8,
+            half_time_prediction="DRAW",
+            half_time_confidence=0.6,
+            pattern_prediction="HOME",
+            pattern_confidence=0.7,
+        )
+
+        self.assertEqual(result["winner"], "home_win")
+        self.assertAlmostEqual(result["scores"]["HOME"], 0.8 * 0.5 + 0.7 * 0.2)
+        self.assertFalse(result["conflict_detected"])
+
+    def test_predict_batch_matches_scalar(self):
+        """Test batch output is identical to the scalar path"""
+        columns = _random_inputs(500)
+        batch = self.predictor.predict_batch(**columns)
+        scalar = self._scalar_results(columns)
+
+        for i, expected in enumerate(scalar):
+            self.assertEqual(batch["winner"][i], expected["winner"])
+            self.assertEqual(batch["final_confidence"][i], expected["final_confidence"])
+            self.assertEqual(batch["conflict_margin"][i], expected["conflict_margin"])
+            self.assertEqual(bool(batch["conflict_detected"][i]), expected["conflict_detected"])
+            for col, outcome in enumerate(OUTCOMES):
+                self.assertEqual(batch["scores"][i, col], expected["scores"][outcome])
+            for col, key in enumerate(("ft", "ht", "pt")):
+                self.assertEqual(batch["weights_used"][i, col], expected["weights_used"][key])
+
+    def test_predict_batch_dataframe_with_nan(self):
+        """Test batch prediction from a DataFrame using NaN for missing models"""
+        df = pd.DataFrame({
+            "full_time_prediction": ["HOME", np.nan, "AWAY"],
+            "full_time_confidence": [0.9, np.nan, 0.4],
+            "half_time_prediction": ["DRAW", "DRAW", "AWAY"],
+            "half_time_confidence": [0.5, 0.7, np.nan],
+        })
+
+        batch = self.predictor.predict_batch(df)
+
+        self.assertEqual(list(batch["winner"]), ["home_win", "draw", "away_win"])
+        # Only HT is active in row 1, so it carries the full weight
+        np.testing.assert_array_equal(batch["weights_used"][1], [0.0, 1.0, 0.0])
+        self.assertEqual(batch["final_confidence"][1], 0.7)
+
+    def test_predict_batch_requires_active_model(self):
+        """Test that rows without any sub-model raise ValueError"""
+        with self.assertRaises(ValueError):
+            self.predictor.predict_batch(
+                full_time_prediction=["HOME", None],
+                full_time_confidence=[0.6, 0.5],
+            )
+
+    def test_encode_batch_and_outcomes(self):
+        """Test the public encoders used by callers that score votes themselves"""
+        columns = {"full_time_prediction": ["HOME", None, "away_win"], "full_time_confidence": [0.6, 0.5, 0.7]}
+
+        with self.assertRaises(ValueError):
+            self.predictor.encode_batch(**columns)
+        codes, confidences, present = self.predictor.encode_batch(require_votes=False, **columns)
+        np.testing.assert_array_equal(codes[:, 0], [0, 0, 2])
+        np.testing.assert_array_equal(confidences[:, 0], [0.6, 0.0, 0.7])
+        np.testing.assert_array_equal(present.any(axis=1), [True, False, True])
+
+        actual, settled = self.predictor.encode_outcomes(pd.Series(["draw", np.nan, "AWAY"]))
+        np.testing.assert_array_equal(actual, [1, 0, 2])
+        np.testing.assert_array_equal(settled, [True, False, True])
+
+    def test_predict_batch_invalid_confidence(self):
+        """Test that out-of-range confidences raise ValueError"""
+        with self.assertRaises(ValueError):
+            self.predictor.predict_batch(
+                full_time_prediction=["HOME"],
+                full_time_confidence=[1.5],
+            )
+
+    def test_predict_batch_invalid_outcome(self):
+        """Test that unknown outcome labels raise ValueError"""
+        with self.assertRaises(ValueError):
+            self.predictor.predict_batch(
+                full_time_prediction=["HOME", "banana"],
+                full_time_confidence=[0.6, 0.5],
+            )
+
+    def test_predict_trusted_matches_predict(self):
+        """Test trusted integer-code path produces the same scores as predict"""
+        expected = self.predictor.predict(
+            full_time_prediction="AWAY",
+            full_time_confidence=0.55,
+            pattern_prediction="draw",
+            pattern_confidence=0.9,
+        )
+        result = self.predictor.predict_trusted(
+            codes=[OUTCOMES.index("AWAY"), None, OUTCOMES.index("DRAW")],
+            confidences=[0.55, None, 0.9],
+        )
+
+        self.assertEqual(result["scores"], expected["scores"])
+        self.assertEqual(result["weights_used"], expected["weights_used"])
+        self.assertEqual(result["winner"], expected["winner"])
+        self.assertEqual(result["conflict_margin"], expected["conflict_margin"])
+
+    def test_update_config_recompiles_weight_table(self):
+        """Test that updated weights are used by subsequent predictions"""
+        self.predictor.update_config({"ft": 0.0, "ht": 0.5, "pt": 0.5})
+
+        result = self.predictor.predict(
+            full_time_prediction="HOME",
+            full_time_confidence=0.9,
+            half_time_prediction="AWAY",
+            half_time_confidence=0.6,
+        )
+
+        self.assertEqual(result["weights_used"], {"ft": 0.0, "ht": 1.0, "pt": 0.0})
+        self.assertEqual(result["winner"], "away_win")
+
+        # FT alone now has zero total weight
+        with self.assertRaises(ValueError):
+            self.predictor.predict(full_time_prediction="HOME", full_time_confidence=0.9)
+
+    def test_register_sub_model(self):
+        """Test adding a fourth sub-model to the registry"""
+        self.predictor.register_sub_model("market_odds", "mo", 0.25)
+
+        result = self.predictor.predict_models({
+            "full_time": ("HOME", 0.6),
+            "market_odds": ("AWAY", 0.9),
+        })
+
+        self.assertEqual(set(result["weights_used"]), {"ft", "ht", "pt", "mo"})
+        self.assertAlmostEqual(result["weights_used"]["ft"], 0.5 / 0.75)
+        self.assertAlmostEqual(result["weights_used"]["mo"], 0.25 / 0.75)
+        self.assertEqual(result["winner"], "home_win")
+
+        # The legacy entry point leaves the new model inactive
+        legacy = self.predictor.predict(full_time_prediction="AWAY", full_time_confidence=0.5)
+        self.assertEqual(legacy["weights_used"]["mo"], 0.0)
+
+    def test_register_sub_model_duplicate(self):
+        """Test that duplicate sub-models are rejected"""
+        with self.assertRaises(ValueError):
+            self.predictor.register_sub_model("full_time", "ft2", 0.1)
+
+    def test_predict_models_unknown_name(self):
+        """Test that unknown sub-model names raise ValueError"""
+        with self.assertRaises(ValueError):
+            self.predictor.predict_models({"market_odds": ("HOME", 0.5)})
+
+    def test_predict_batch_registered_model_matches_scalar(self):
+        """Test batch parity when extra sub-models are registered"""
+        self.predictor.register_sub_model("market_odds", "mo", 0.4)
+        self.predictor.register_sub_model("temporal_decay", "td", 0.1)
+        columns = _random_inputs(200, seed=11)
+        rng = np.random.default_rng(5)
+        for model_name in ("market_odds", "temporal_decay"):
+            predictions = np.array(["HOME", "DRAW", "AWAY"], dtype=object)[rng.integers(0, 3, 200)]
+            confidences = rng.random(200)
+            confidences[rng.random(200) < 0.3] = np.nan
+            columns[f"{model_name}_prediction"] = predictions
+            columns[f"{model_name}_confidence"] = confidences
+
+        batch = self.predictor.predict_batch(columns)
+
+        for i in range(200):
+            votes = {}
+            for model_name, _ in self.predictor.get_sub_models():
+                prediction = columns[f"{model_name}_prediction"][i]
+                confidence = columns[f"{model_name}_confidence"][i]
+                if prediction is not None and not np.isnan(confidence):
+                    votes[model_name] = (prediction, confidence)
+            expected = self.predictor.predict_models(votes)
+            self.assertEqual(batch["winner"][i], expected["winner"])
+            self.assertEqual(batch["final_confidence"][i], expected["final_confidence"])
+            self.assertEqual(list(batch["weights_used"][i]), list(expected["weights_used"].values()))
+
+    def test_predict_proba_batch_blends_distributions(self):
+        """Test probability blending with missing rows and reordered classes"""
+        ft = np.array([[0.6, 0.3, 0.1], [0.2, 0.2, 0.6]])
+        ht = np.array([[0.5, 0.4, 0.1], [np.nan, np.nan, np.nan]])
+        # Pattern model columns follow sklearn's sorted classes_ order
+        pt = np.array([[0.1, 0.2, 0.7], [0.3, 0.3, 0.4]])
+
+        result = self.predictor.predict_proba_batch(
+            {"full_time": ft, "half_time": ht, "pattern": pt},
+            classes={"full_time": OUTCOMES, "half_time": OUTCOMES, "pattern": ["away_win", "draw", "home_win"]},
+        )
+
+        expected_row0 = 0.5 * ft[0] + 0.3 * ht[0] + 0.2 * pt[0][::-1]
+        np.testing.assert_allclose(result["probabilities"][0], expected_row0)
+        # HT is missing in row 1, so FT and PT are re-weighted to 0.5/0.7 and 0.2/0.7
+        expected_row1 = (0.5 * ft[1] + 0.2 * pt[1][::-1]) / 0.7
+        np.testing.assert_allclose(result["probabilities"][1], expected_row1)
+        np.testing.assert_allclose(result["probabilities"].sum(axis=1), 1.0)
+        self.assertEqual(list(result["winner"]), ["home_win", "away_win"])
+
+    def test_predict_proba_batch_sklearn_columns(self):
+        """Test that predict_proba output with the estimator's sorted classes_ keeps home and away apart"""
+        from sklearn.linear_model import LogisticRegression
+
+        rng = np.random.default_rng(0)
+        X = rng.standard_normal((300, 2))
+        y = np.where(X[:, 0] > 0.5, "home_win", np.where(X[:, 0] < -0.5, "away_win", "draw"))
+        estimator = LogisticRegression().fit(X, y)
+        self.assertEqual(list(estimator.classes_), ["away_win", "draw", "home_win"])
+
+        home_fixture = np.array([[3.0, 0.0]])
+        result = self.predictor.predict_proba_batch(
+            {"full_time": estimator.predict_proba(home_fixture)}, classes=estimator.classes_
+        )
+
+        self.assertEqual(list(result["winner"]), ["home_win"])
+        with self.assertRaises(ValueError):
+            self.predictor.predict_proba_batch({"full_time": estimator.predict_proba(home_fixture)}, classes=None)
+        with self.assertRaises(ValueError):
+            self.predictor.predict_proba_batch(
+                {"full_time": estimator.predict_proba(home_fixture)}, classes={"half_time": estimator.classes_}
+            )
+
+    def test_predict_proba_batch_invalid_rows(self):
+        """Test that rows not summing to one raise ValueError"""
+        with self.assertRaises(ValueError):
+            self.predictor.predict_proba_batch({"full_time": np.array([[0.5, 0.5, 0.5]])}, classes=OUTCOMES)
+
+    def test_observe_result_shifts_weight_to_correct_model(self):
+        """Test Hedge update rewards the model that picked the actual outcome"""
+        votes = {"full_time": ("AWAY", 0.8), "half_time": ("HOME", 0.7)}
+
+        for _ in range(20):
+            weights = self.predictor.observe_result("home_win", votes)
+
+        self.assertGreater(weights["ht"], 0.3)
+        self.assertLess(weights["ft"], 0.5)
+        # Active mass is preserved and the inactive pattern model is untouched
+        self.assertAlmostEqual(weights["ft"] + weights["ht"], 0.8)
+        self.assertEqual(weights["pt"], 0.2)
+        self.assertEqual(self.predictor.observations, 20)
+
+        # Predictions use the adapted weights
+        result = self.predictor.predict_models(votes)
+        self.assertAlmostEqual(result["weights_used"]["ht"], weights["ht"] / 0.8)
+
+    def test_conflict_threshold_is_configurable(self):
+        """Test that the conflict threshold can be set per predictor and updated with the weights"""
+        votes = {"full_time_prediction": "HOME", "full_time_confidence": 0.6,
+                 "half_time_prediction": "AWAY", "half_time_confidence": 0.6}
+        # Margin 0.6 * 0.5 / 0.8 - 0.6 * 0.3 / 0.8 = 0.15
+        self.assertFalse(self.predictor.predict(**votes)["conflict_detected"])
+
+        strict = EnsemblePredictor(conflict_threshold=0.2, cache_size=8)
+        self.assertTrue(strict.predict(**votes)["conflict_detected"])
+        batch = strict.predict_batch(**{name: [value] for name, value in votes.items()})
+        self.assertTrue(batch["conflict_detected"][0])
+
+        # Updating the threshold invalidates cached results
+        strict.update_config(strict.get_config(), conflict_threshold=0.05)
+        self.assertFalse(strict.predict(**votes)["conflict_detected"])
+        with self.assertRaises(ValueError):
+            strict.update_config(strict.get_config(), conflict_threshold=-0.1)
+        with self.assertRaises(ValueError):
+            EnsemblePredictor(conflict_threshold=-1)
+        self.assertEqual(strict.conflict_threshold, 0.05)
+
+    def test_state_round_trip(self):
+        """Test that online learner state can be saved and restored"""
+        self.predictor.observe_result("DRAW", {"pattern": ("DRAW", 0.9), "full_time": ("HOME", 0.6)})
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_path = os.path.join(tmp_dir, "ensemble_state.json")
+            self.predictor.save_state(state_path)
+
+            restored = EnsemblePredictor(conflict_threshold=0.3)
+            restored.load_state(state_path)
+
+        self.assertEqual(restored.get_config(), self.predictor.get_config())
+        self.assertEqual(restored.conflict_threshold, self.predictor.conflict_threshold)
+        self.assertEqual(restored.observations, 1)
+        self.assertEqual(restored.cumulative_loss, self.predictor.cumulative_loss)
+
+    def test_restore_state_mismatched_registry(self):
+        """Test restoring state into a different registry raises ValueError"""
+        state = self.predictor.get_state()
+        other = EnsemblePredictor()
+        other.register_sub_model("market_odds", "mo", 0.1)
+
+        with self.assertRaises(ValueError):
+            other.restore_state(state)
+
+    def test_cache_hits_and_invalidation(self):
+        """Test result cache counters and invalidation by update_config"""
+        predictor = EnsemblePredictor(cache_size=2)
+        votes = {"full_time": ("HOME", 0.8), "half_time": ("DRAW", 0.6)}
+
+        first = predictor.predict_models(votes)
+        first["scores"]["HOME"] = -1.0  # Mutating a result must not leak into the cache
+        second = predictor.predict_models(votes)
+
+        self.assertEqual(predictor.cache_info()["hits"], 1)
+        self.assertEqual(predictor.cache_info()["misses"], 1)
+        self.assertEqual(second["scores"]["HOME"], 0.8 * 0.625)
+
+        predictor.update_config({"ft": 0.2, "ht": 0.6, "pt": 0.2})
+        third = predictor.predict_models(votes)
+
+        self.assertEqual(predictor.cache_info()["misses"], 2)
+        self.assertEqual(third["winner"], "draw")
+
+    def test_cache_lru_eviction(self):
+        """Test that the least recently used entry is evicted"""
+        predictor = EnsemblePredictor(cache_size=2)
+        for confidence in (0.5, 0.6, 0.5, 0.7):
+            predictor.predict(full_time_prediction="HOME", full_time_confidence=confidence)
+
+        info = predictor.cache_info()
+        self.assertEqual(info["size"], 2)
+        self.assertEqual(info["evictions"], 1)
+        self.assertEqual(info["hits"], 1)
+
+        # 0.6 was least recently used and is gone; 0.5 is still cached
+        predictor.predict(full_time_prediction="HOME", full_time_confidence=0.5)
+        self.assertEqual(predictor.cache_info()["hits"], 2)
+
+    def test_cache_ttl_expiry(self):
+        """Test that expired entries are recomputed"""
+        predictor = EnsemblePredictor(cache_size=10, cache_ttl=30.0)
+        with patch("ml_pipeline.ensemble_predictor.time.monotonic", return_value=1000.0):
+            predictor.predict(full_time_prediction="AWAY", full_time_confidence=0.9)
+        with patch("ml_pipeline.ensemble_predictor.time.monotonic", return_value=1031.0):
+            predictor.predict(full_time_prediction="AWAY", full_time_confidence=0.9)
+
+        info = predictor.cache_info()
+        self.assertEqual(info["hits"], 0)
+        self.assertEqual(info["expirations"], 1)
+
+
+    def test_result_to_dict_shape(self):
+        """Test that scalar results keep the historical, JSON-serializable dict shape"""
+        predictor = EnsemblePredictor(cache_size=8)
+        result = predictor.predict("HOME", 0.8, None, None, "DRAW", 0.6)
+
+        self.assertIs(type(result), dict)
+        ft, pt = 0.5 / 0.7, 0.2 / 0.7
+        self.assertEqual(result, {
+            "weights_used": {"ft": ft, "ht": 0.0, "pt": pt},
+            "votes": {
+                "full_time": {"prediction": "HOME", "confidence": 0.8},
+                "pattern": {"prediction": "DRAW", "confidence": 0.6},
+            },
+            "scores": {"HOME": 0.8 * ft, "DRAW": 0.6 * pt, "AWAY": 0.0},
+            "winner": "home_win",
+            "final_confidence": round(0.8 * ft, 4),
+            "conflict_detected": False,
+            "conflict_margin": round(0.8 * ft - 0.6 * pt, 4),
+        })
+        self.assertEqual(json.loads(json.dumps(result)), result)
+        trusted = predictor.predict_trusted((0, None, 1), (0.8, None, 0.6))
+        self.assertEqual(json.loads(json.dumps(trusted)), result)
+
+        # The cache holds the compact slotted form and hands out fresh dicts
+        (_, cached), = predictor._cache.values()
+        self.assertIsInstance(cached, EnsembleResult)
+        self.assertFalse(hasattr(cached, "__dict__"))
+        self.assertEqual(cached.to_dict(), result)
+        result["winner"] = "draw"
+        self.assertEqual(predictor.predict("HOME", 0.8, None, None, "DRAW", 0.6)["winner"], "home_win")
+
+    def test_batch_result_rows_match_scalar(self):
+        """Test that batch rows expand to the same values as scalar results"""
+        predictor = EnsemblePredictor()
+        columns = _random_inputs(50, seed=3)
+        batch = predictor.predict_batch(**columns)
+
+        self.assertIsInstance(batch, EnsembleBatchResult)
+        self.assertEqual(batch.n_rows, 50)
+        for i, row in enumerate(batch.to_dicts()):
+            expected = predictor.predict(**{
+                name: (None if pd.isna(values[i]) else values[i]) if name.endswith("_prediction") else values[i]
+                for name, values in columns.items()
+            })
+            self.assertEqual(row["winner"], expected["winner"])
+            self.assertEqual(row["final_confidence"], expected["final_confidence"])
+            self.assertEqual(row["conflict_margin"], expected["conflict_margin"])
+            self.assertEqual(row["weights_used"], expected["weights_used"])
+
+        frame = batch.to_frame()
+        self.assertEqual(len(frame), 50)
+        self.assertEqual(list(frame["winner"]), list(batch["winner"]))
+        self.assertIn("score_home", frame.columns)
+        self.assertIn("weight_ft", frame.columns)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""Unit tests for ensemble_tuner module"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from ml_pipeline.ensemble_predictor import EnsemblePredictor
+from ml_pipeline.ensemble_tuner import evaluate_candidates, simplex_grid, tune_ensemble
+
+
+def _evaluation_log(n_rows, seed=11):
+    """Build an evaluation log where FT is the most accurate sub-model."""
+    rng = np.random.default_rng(seed)
+    labels = np.array(["HOME", "DRAW", "AWAY"], dtype=object)
+    actual = rng.integers(0, 3, n_rows)
+    data = {"actual_outcome": labels[actual]}
+    for model_name, accuracy in (("full_time", 0.8), ("half_time", 0.4), ("pattern", 0.35)):
+        correct = rng.random(n_rows) < accuracy
+        predictions = labels[np.where(correct, actual, rng.integers(0, 3, n_rows))]
+        predictions[rng.random(n_rows) < 0.2] = None
+        data[f"{model_name}_prediction"] = predictions
+        data[f"{model_name}_confidence"] = rng.uniform(0.4, 0.9, n_rows)
+    return pd.DataFrame(data)
+
+
+class TestEnsembleTuner(unittest.TestCase):
+    """Tests for the ensemble weight tuner"""
+
+    def test_simplex_grid(self):
+        """Test that the grid enumerates every weight vector on the simplex"""
+        grid = simplex_grid(3, 0.5)
+
+        self.assertEqual(grid.shape, (6, 3))
+        np.testing.assert_allclose(grid.sum(axis=1), 1.0)
+        self.assertEqual(len({tuple(row) for row in grid}), 6)
+        self.assertEqual(len(simplex_grid(3, 0.05)), 231)
+
+    def test_simplex_grid_invalid_step(self):
+        """Test that steps not dividing 1 are rejected"""
+        with self.assertRaises(ValueError):
+            simplex_grid(3, 0.3)
+
+    def test_matches_predict_batch(self):
+        """Test that candidate metrics match predict_batch for the same weights"""
+        predictor = EnsemblePredictor()
+        data = _evaluation_log(500)
+        data = data[data[["full_time_prediction", "half_time_prediction", "pattern_prediction"]].notna().any(axis=1)]
+
+        candidates = evaluate_candidates(
+            predictor, data, np.array([[0.5, 0.3, 0.2]]), thresholds=[predictor.CONFLICT_THRESHOLD]
+        )
+        batch = predictor.predict_batch(data)
+        actual = data["actual_outcome"].str.lower().map({"home": "home_win", "draw": "draw", "away": "away_win"})
+
+        self.assertEqual(len(candidates), 1)
+        self.assertAlmostEqual(candidates["accuracy"][0], np.mean(batch["winner"] == actual.to_numpy()))
+        self.assertAlmostEqual(candidates["conflict_rate"][0], np.mean(batch["conflict_detected"]))
+
+    def test_skips_unsettled_fixtures(self):
+        """Test that fixtures without an actual outcome or any vote are skipped"""
+        predictor = EnsemblePredictor()
+        data = _evaluation_log(200)
+        full = evaluate_candidates(predictor, data, np.array([[0.5, 0.3, 0.2]]))
+
+        padded = pd.concat([data, data.head(20).assign(actual_outcome=None)], ignore_index=True)
+        padded.loc[len(padded)] = {"actual_outcome": "HOME"}
+        padded_result = evaluate_candidates(predictor, padded, np.array([[0.5, 0.3, 0.2]]))
+
+        pd.testing.assert_frame_equal(full, padded_result)
+
+    def test_zero_weight_candidates_abstain(self):
+        """Test that candidates ignoring every active model count as wrong"""
+        predictor = EnsemblePredictor()
+        data = pd.DataFrame({
+            "full_time_prediction": ["HOME", "AWAY"],
+            "full_time_confidence": [0.9, 0.9],
+            "actual_outcome": ["home_win", "away_win"],
+        })
+
+        candidates = evaluate_candidates(predictor, data, np.array([[0.0, 0.5, 0.5], [1.0, 0.0, 0.0]]), thresholds=[0.1])
+
+        zero, full = candidates.sort_values("weight_ft")["accuracy"]
+        self.assertEqual(zero, 0.0)
+        self.assertEqual(full, 1.0)
+
+    def test_tune_prefers_accurate_model(self):
+        """Test that tuning shifts weight to the most accurate sub-model"""
+        result = tune_ensemble(_evaluation_log(2000), step=0.1, metric="accuracy", max_conflict_rate=0.2)
+
+        best = result["best"]
+        self.assertEqual(max(best["weights"], key=best["weights"].get), "ft")
+        self.assertLessEqual(best["conflict_rate"], 0.2)
+        self.assertAlmostEqual(sum(best["weights"].values()), 1.0)
+        self.assertEqual(len(result["candidates"]), len(simplex_grid(3, 0.1)) * 7)
+
+        # The tuned weights and threshold are installed on the predictor
+        predictor = EnsemblePredictor()
+        tune_ensemble(
+            _evaluation_log(2000), predictor=predictor, step=0.1, metric="accuracy", max_conflict_rate=0.2, apply=True
+        )
+        self.assertEqual(predictor.get_config(), best["weights"])
+        self.assertEqual(predictor.conflict_threshold, best["conflict_threshold"])
+
+    def test_tune_invalid_inputs(self):
+        """Test errors for unknown metrics and unreachable constraints"""
+        data = _evaluation_log(100)
+        with self.assertRaises(ValueError):
+            tune_ensemble(data, metric="f1")
+        with self.assertRaises(ValueError):
+            tune_ensemble(data, step=0.5, thresholds=[1.0], max_conflict_rate=0.0)
+        with self.assertRaises(ValueError):
+            tune_ensemble(data.drop(columns=["actual_outcome"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
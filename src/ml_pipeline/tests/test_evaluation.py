@@ -0,0 +1,161 @@
+"""Unit tests for evaluation module"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+from sklearn import metrics as sklearn_metrics
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+
+from ml_pipeline.evaluation import (
+    bootstrap_intervals,
+    confusion_matrix,
+    confusion_metrics,
+    evaluate,
+    per_class_report,
+    probability_metrics,
+)
+from ml_pipeline.train_model import ModelTrainer
+
+
+class TestEvaluation(unittest.TestCase):
+    """Tests for confusion-matrix metrics and bootstrap intervals"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        rng = np.random.default_rng(0)
+        self.y_true = rng.choice(["away_win", "draw", "home_win"], 600)
+        # "void" is predicted but never true
+        self.y_pred = np.where(rng.random(600) < 0.6, self.y_true, rng.choice(["away_win", "home_win", "void"], 600))
+
+    def test_confusion_matrix_matches_sklearn(self):
+        """Test that the single-pass confusion matrix equals sklearn's"""
+        labels, confusion = confusion_matrix(self.y_true, self.y_pred)
+
+        self.assertEqual(labels.tolist(), ["away_win", "draw", "home_win", "void"])
+        np.testing.assert_array_equal(
+            confusion, sklearn_metrics.confusion_matrix(self.y_true, self.y_pred, labels=labels)
+        )
+        with self.assertRaises(ValueError):
+            confusion_matrix(self.y_true, self.y_pred, labels=["away_win", "draw", "home_win"])
+
+    def test_metrics_match_sklearn(self):
+        """Test weighted and macro averages against sklearn with zero_division=0"""
+        _, confusion = confusion_matrix(self.y_true, self.y_pred)
+        metrics = confusion_metrics(confusion)
+
+        self.assertAlmostEqual(metrics["accuracy"], sklearn_metrics.accuracy_score(self.y_true, self.y_pred))
+        for average, suffix in (("weighted", ""), ("macro", "_macro")):
+            expected = {
+                "precision": sklearn_metrics.precision_score(self.y_true, self.y_pred, average=average, zero_division=0),
+                "recall": sklearn_metrics.recall_score(self.y_true, self.y_pred, average=average, zero_division=0),
+                "f1": sklearn_metrics.f1_score(self.y_true, self.y_pred, average=average, zero_division=0),
+            }
+            for name, value in expected.items():
+                key = "f1_score" if name == "f1" and not suffix else f"{name}{suffix}"
+                self.assertAlmostEqual(metrics[key], value, places=12, msg=key)
+
+    def test_per_class_report_matches_sklearn(self):
+        """Test per-class scores against sklearn's classification report"""
+        labels, confusion = confusion_matrix(self.y_true, self.y_pred)
+        report = per_class_report(confusion, labels)
+        expected = sklearn_metrics.classification_report(
+            self.y_true, self.y_pred, labels=labels, output_dict=True, zero_division=0
+        )
+
+        for label in labels:
+            self.assertAlmostEqual(report[label]["precision"], expected[label]["precision"])
+            self.assertAlmostEqual(report[label]["recall"], expected[label]["recall"])
+            self.assertAlmostEqual(report[label]["f1_score"], expected[label]["f1-score"])
+            self.assertEqual(report[label]["support"], expected[label]["support"])
+
+    def test_probability_metrics_match_sklearn(self):
+        """Test log-loss and Brier score, with probability columns in model order"""
+        rng = np.random.default_rng(1)
+        X = rng.standard_normal((400, 2))
+        y = np.where(X[:, 0] > 0.5, "home_win", np.where(X[:, 1] > 0, "draw", "away_win"))
+        model = LogisticRegression().fit(X, y)
+        probabilities = model.predict_proba(X)
+
+        result = probability_metrics(y, probabilities, model.classes_)
+        onehot = (y[:, None] == model.classes_).astype(float)
+
+        self.assertAlmostEqual(result["log_loss"], sklearn_metrics.log_loss(y, probabilities), places=10)
+        self.assertAlmostEqual(result["brier_score"], ((probabilities - onehot) ** 2).sum(axis=1).mean(), places=12)
+
+        # Reordered columns with reordered classes give the same scores
+        reordered = probability_metrics(y, probabilities[:, ::-1], model.classes_[::-1])
+        self.assertAlmostEqual(reordered["log_loss"], result["log_loss"], places=12)
+
+    def test_bootstrap_intervals(self):
+        """Test that intervals are reproducible, cover the estimate and narrow with more rows"""
+        _, confusion = confusion_matrix(self.y_true, self.y_pred)
+        metrics = confusion_metrics(confusion)
+
+        intervals = bootstrap_intervals(confusion, n_bootstrap=500, random_seed=3)
+
+        self.assertEqual(intervals, bootstrap_intervals(confusion, n_bootstrap=500, random_seed=3))
+        self.assertEqual(set(intervals), set(metrics))
+        for name, bounds in intervals.items():
+            self.assertLessEqual(bounds["low"], metrics[name], name)
+            self.assertGreaterEqual(bounds["high"], metrics[name], name)
+
+        wide = bootstrap_intervals(confusion, n_bootstrap=500, random_seed=3)["accuracy"]
+        narrow = bootstrap_intervals(confusion * 100, n_bootstrap=500, random_seed=3)["accuracy"]
+        self.assertLess(narrow["high"] - narrow["low"], (wide["high"] - wide["low"]) / 5)
+
+        self.assertEqual(bootstrap_intervals(np.zeros((2, 2))), {})
+        with self.assertRaises(ValueError):
+            bootstrap_intervals(confusion, confidence=1.5)
+
+    def test_evaluate_report(self):
+        """Test the combined report and disabling the bootstrap"""
+        report = evaluate(self.y_true, self.y_pred, n_bootstrap=0)
+
+        self.assertIsNone(report["confidence_intervals"])
+        self.assertIsNone(report["probability_metrics"])
+        self.assertEqual(report["labels"], ["away_win", "draw", "home_win", "void"])
+        self.assertEqual(sum(map(sum, report["confusion_matrix"])), 600)
+        with self.assertRaises(ValueError):
+            evaluate(self.y_true, self.y_pred, probabilities=np.zeros((600, 3)))
+
+
+class TestTrainerEvaluation(unittest.TestCase):
+    """Tests for the evaluation report of ModelTrainer"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        rng = np.random.default_rng(2)
+        self.X = pd.DataFrame({"feature1": rng.standard_normal(300), "feature2": rng.standard_normal(300)})
+        self.y = pd.Series(np.where(self.X["feature1"] > 0, "home_win", "away_win"))
+
+    def test_train_and_evaluate_records_report(self):
+        """Test that the split evaluation keeps probabilities, per-class scores and intervals"""
+        trainer = ModelTrainer()
+        trainer.config = {"model_type": "LogisticRegression", "hyperparameters": {}, "evaluation": {"n_bootstrap": 200}}
+        trainer.create_model()
+
+        metrics = trainer.train_and_evaluate(self.X, self.y)
+
+        self.assertIn("f1_macro", metrics)
+        self.assertEqual(trainer.evaluation["n_bootstrap"], 200)
+        self.assertEqual(set(trainer.evaluation["per_class"]), {"away_win", "home_win"})
+        self.assertLess(trainer.evaluation["probability_metrics"]["log_loss"], 0.5)
+        low, high = trainer.evaluation["confidence_intervals"]["accuracy"].values()
+        self.assertTrue(low <= metrics["accuracy"] <= high)
+
+    def test_models_without_probabilities(self):
+        """Test that models without predict_proba skip the probability metrics"""
+        trainer = ModelTrainer()
+        trainer.config = {"model_type": "SGDClassifier", "hyperparameters": {"loss": "hinge"}}
+        trainer.create_model()
+
+        trainer.train_and_evaluate(self.X, self.y)
+
+        self.assertIsInstance(trainer.model, SGDClassifier)
+        self.assertIsNone(trainer.evaluation["probability_metrics"])
+        self.assertIsNotNone(trainer.evaluation["confidence_intervals"])
+
+
+if __name__ == "__main__":
+    unittest.main()
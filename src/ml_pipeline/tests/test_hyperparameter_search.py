@@ -0,0 +1,164 @@
+"""Unit tests for hyperparameter_search module"""
+
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from ml_pipeline.hyperparameter_search import build_candidates, run_search
+from ml_pipeline.train_model import ModelTrainer, TrainingResult
+
+
+class TestHyperparameterSearch(unittest.TestCase):
+    """Tests for the hyperparameter search mode"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        rng = np.random.default_rng(0)
+        features = rng.standard_normal((200, 2))
+        self.sample_data = pd.DataFrame({
+            "feature1": features[:, 0],
+            "feature2": features[:, 1],
+            "target": np.where(features[:, 0] + 0.3 * rng.standard_normal(200) > 0, "home_win", "away_win"),
+        })
+        self.X = self.sample_data[["feature1", "feature2"]]
+        self.y = self.sample_data["target"]
+
+    def test_build_candidates_grid(self):
+        """Test that a grid expands to every combination"""
+        candidates = build_candidates({"param_grid": {"max_depth": [1, 2, 3], "criterion": ["gini", "entropy"]}})
+
+        self.assertEqual(len(candidates), 6)
+        self.assertIn({"max_depth": 2, "criterion": "entropy"}, candidates)
+
+    def test_build_candidates_random(self):
+        """Test that random search samples reproducible plain-Python values"""
+        search_config = {
+            "strategy": "random",
+            "n_iter": 5,
+            "param_distributions": {
+                "C": {"distribution": "loguniform", "low": 0.001, "high": 10},
+                "max_iter": [100, 200],
+            },
+        }
+
+        candidates = build_candidates(search_config, random_seed=3)
+
+        self.assertEqual(len(candidates), 5)
+        self.assertEqual(candidates, build_candidates(search_config, random_seed=3))
+        for params in candidates:
+            self.assertIsInstance(params["C"], float)
+            self.assertTrue(0.001 <= params["C"] <= 10)
+        json.dumps(candidates)
+
+    def test_build_candidates_invalid(self):
+        """Test errors for unknown strategies and distributions"""
+        with self.assertRaises(ValueError):
+            build_candidates({"strategy": "bayesian", "param_grid": {"C": [1.0]}})
+        with self.assertRaises(ValueError):
+            build_candidates({"strategy": "random", "param_distributions": {"C": {"distribution": "beta"}}})
+        with self.assertRaises(ValueError):
+            build_candidates({"param_grid": {"C": 1.0}})
+
+    def test_run_search_parallel_matches_serial(self):
+        """Test that the process pool ranks candidates like in-process evaluation"""
+        candidates = [{"max_depth": depth} for depth in (1, 2, 4)]
+        X_train, X_test = self.X[:150], self.X[150:]
+        y_train, y_test = self.y[:150], self.y[150:]
+
+        serial = run_search("DecisionTree", {"random_state": 0}, candidates, X_train, X_test, y_train, y_test, n_jobs=1)
+        parallel = run_search("DecisionTree", {"random_state": 0}, candidates, X_train, X_test, y_train, y_test, n_jobs=2)
+
+        self.assertEqual([row["params"] for row in serial], [row["params"] for row in parallel])
+        self.assertEqual([row["metrics"] for row in serial], [row["metrics"] for row in parallel])
+        self.assertEqual([row["rank"] for row in serial], [1, 2, 3])
+        scores = [row["metrics"]["f1_score"] for row in serial]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_run_search_parallel_forest_with_categories(self):
+        """Test that workers search threaded and categorical models on category codes"""
+        rng = np.random.default_rng(3)
+        template = rng.choice(["A", "B", "C"], 200)
+        X = pd.DataFrame({"feature1": rng.random(200), "template": pd.Categorical(template)})
+        y = np.where(template == "B", "draw", "home_win")
+        hgb = {"categorical_features": [False, True], "random_state": 0}
+
+        leaderboard = run_search(
+            "HistGradientBoosting", hgb, [{"max_iter": 5}, {"max_iter": 10}], X[:150], X[150:], y[:150], y[150:], n_jobs=2
+        )
+        forests = run_search(
+            "RandomForest", {"n_jobs": -1, "random_state": 0}, [{"n_estimators": 5}, {"n_estimators": 10}],
+            X[["feature1"]][:150], X[["feature1"]][150:], y[:150], y[150:], n_jobs=2,
+        )
+
+        self.assertTrue(all(row["error"] is None for row in leaderboard + forests))
+        self.assertEqual(leaderboard[0]["metrics"]["accuracy"], 1.0)
+
+    def test_run_search_failed_candidate_ranked_last(self):
+        """Test that candidates raising during fit are reported, not fatal"""
+        candidates = [{"max_depth": -1}, {"max_depth": 2}]
+
+        leaderboard = run_search(
+            "DecisionTree", {}, candidates, self.X[:150], self.X[150:], self.y[:150], self.y[150:], n_jobs=1
+        )
+
+        self.assertEqual(leaderboard[0]["params"], {"max_depth": 2})
+        self.assertIsNone(leaderboard[1]["metrics"])
+        self.assertIn("max_depth", leaderboard[1]["error"])
+
+    def test_run_search_ranks_by_macro_metric(self):
+        """Test that candidates can be ranked by a macro average"""
+        candidates = [{"max_depth": depth} for depth in (1, 2, 4)]
+
+        leaderboard = run_search(
+            "DecisionTree", {"random_state": 0}, candidates, self.X[:150], self.X[150:], self.y[:150], self.y[150:],
+            metric="f1_macro", n_jobs=1,
+        )
+
+        scores = [row["metrics"]["f1_macro"] for row in leaderboard]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        with self.assertRaises(ValueError):
+            run_search("DecisionTree", {}, candidates, self.X, self.X, self.y, self.y, metric="roc_auc")
+
+    def test_trainer_search_creates_winner(self):
+        """Test that the trainer builds the winning model and saves the leaderboard"""
+        trainer = ModelTrainer()
+        trainer.config = {
+            "model_type": "LogisticRegression",
+            "input_features": ["feature1", "feature2"],
+            "target_column": "target",
+            "hyperparameters": {"max_iter": 200},
+            "search": {"metric": "accuracy", "param_grid": {"C": [0.001, 1.0]}},
+        }
+
+        leaderboard = trainer.search_hyperparameters(self.X, self.y, n_jobs=1)
+        metrics = trainer.train_and_evaluate(self.X, self.y)
+
+        self.assertEqual(trainer.model.C, leaderboard[0]["params"]["C"])
+        self.assertEqual(trainer.model.max_iter, 200)
+        self.assertEqual(metrics, leaderboard[0]["metrics"])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = trainer.save_leaderboard(os.path.join(tmpdir, "LogisticRegression_20250101_000000.pkl"))
+            with open(path) as f:
+                saved = json.load(f)
+        self.assertTrue(path.endswith("LogisticRegression_20250101_000000_leaderboard.json"))
+        self.assertEqual(saved["metric"], "accuracy")
+        self.assertEqual(len(saved["leaderboard"]), 2)
+
+    def test_leaderboard_in_training_result(self):
+        """Test that the leaderboard is part of the training output only when a search ran"""
+        result = TrainingResult(model_path="model.pkl", metrics={"accuracy": 0.8}, dataset_size=10)
+        self.assertNotIn("leaderboard", result.to_dict())
+
+        result.leaderboard = [{"rank": 1}]
+        output = result.to_dict()
+        self.assertEqual(output["leaderboard"], [{"rank": 1}])
+        self.assertEqual(TrainingResult.from_dict(output).leaderboard, [{"rank": 1}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""Unit tests for the import-time behaviour of the ml_pipeline package"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from ml_pipeline import config
+
+SRC_DIR = Path(__file__).resolve().parents[2]
+
+_PROBE = (
+    "import importlib, json, logging, sys\n"
+    "importlib.import_module(sys.argv[1])\n"
+    "print(json.dumps({\n"
+    "    'modules': [name for name in sys.argv[2:] if name in sys.modules],\n"
+    "    'root_handlers': len(logging.getLogger().handlers),\n"
+    "}))\n"
+)
+
+
+def import_in_fresh_interpreter(module: str, watched: tuple) -> dict:
+    """Import a module in a new interpreter and report what it loaded."""
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE, module, *watched],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout)
+
+
+class TestLazyImports(unittest.TestCase):
+    """Tests that entry points only load what they use"""
+
+    def test_package_import_is_light(self):
+        """Test that importing the package loads no third-party libraries"""
+        probe = import_in_fresh_interpreter("ml_pipeline", ("numpy", "pandas", "ml_pipeline.ensemble_predictor"))
+        self.assertEqual(probe["modules"], [])
+
+    def test_lazy_exports_resolve(self):
+        """Test that the package exports are importable on first access"""
+        import ml_pipeline
+        from ml_pipeline.ensemble_predictor import EnsemblePredictor
+
+        self.assertIs(ml_pipeline.EnsemblePredictor, EnsemblePredictor)
+        self.assertIn("EnsembleResult", dir(ml_pipeline))
+        with self.assertRaises(AttributeError):
+            ml_pipeline.missing_name
+
+    def test_pattern_clis_skip_pandas(self):
+        """Test that the pattern CLIs start without pandas or aiohttp"""
+        for module in ("ml_pipeline.manage_patterns", "ml_pipeline.rare_pattern_finder"):
+            probe = import_in_fresh_interpreter(module, ("numpy", "pandas", "aiohttp", "asyncio"))
+            self.assertEqual(probe["modules"], [], module)
+
+    def test_train_model_defers_sklearn_and_supabase(self):
+        """Test that training modules load sklearn, joblib and supabase on use"""
+        for module in ("ml_pipeline.train_model", "ml_pipeline.auto_reinforcement"):
+            probe = import_in_fresh_interpreter(module, ("sklearn", "joblib", "supabase"))
+            self.assertEqual(probe["modules"], [], module)
+
+    def test_import_does_not_configure_logging(self):
+        """Test that importing entry points leaves logging configuration to main()"""
+        for module in ("ml_pipeline.train_model", "ml_pipeline.auto_reinforcement"):
+            probe = import_in_fresh_interpreter(module, ())
+            self.assertEqual(probe["root_handlers"], 0, module)
+
+
+class TestEnsureDirectories(unittest.TestCase):
+    """Tests for on-demand directory creation"""
+
+    def test_creates_model_directories(self):
+        """Test that ensure_directories creates the model directories"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            models_dir = Path(tmpdir) / "models"
+            with patch.object(config, "MODELS_DIR", models_dir), \
+                    patch.object(config, "RETRAINED_MODELS_DIR", models_dir / "retrained"):
+                config.ensure_directories()
+                config.ensure_directories()
+
+            self.assertTrue((models_dir / "retrained").is_dir())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Unit tests for profiling module"""
+
+import io
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from ml_pipeline import train_model
+from ml_pipeline.profiling import PhaseProfiler, current_rss_mb
+
+
+class TestPhaseProfiler(unittest.TestCase):
+    """Tests for PhaseProfiler"""
+
+    def test_phases_accumulate_and_nest(self):
+        """Test that repeated phases add up and nested phases are recorded separately"""
+        profiler = PhaseProfiler()
+        for _ in range(2):
+            with profiler.phase("outer"):
+                with profiler.phase("inner"):
+                    time.sleep(0.01)
+
+        phases = profiler.to_dict()["phases"]
+        self.assertEqual(list(phases), ["inner", "outer"])
+        self.assertEqual(phases["outer"]["calls"], 2)
+        self.assertGreaterEqual(phases["inner"]["seconds"], 0.02)
+        self.assertGreaterEqual(phases["outer"]["seconds"], phases["inner"]["seconds"])
+        self.assertNotIn("alloc_peak_mb", phases["outer"])
+
+    def test_failed_phase_is_recorded(self):
+        """Test that a phase raising an exception is still timed"""
+        profiler = PhaseProfiler()
+        with self.assertRaises(RuntimeError):
+            with profiler.phase("fit"):
+                raise RuntimeError("boom")
+
+        self.assertEqual(profiler.phases["fit"]["calls"], 1)
+
+    @unittest.skipIf(current_rss_mb() is None, "current RSS needs /proc/self/statm")
+    def test_rss_change_per_phase(self):
+        """Test that phases report the RSS they add and release, not the process peak"""
+        profiler = PhaseProfiler()
+        with profiler.phase("allocate"):
+            buffer = np.ones(64 * 1024 * 1024 // 8)
+        with profiler.phase("release"):
+            del buffer
+
+        summary = profiler.to_dict()
+        phases = summary["phases"]
+        self.assertGreaterEqual(phases["allocate"]["rss_change_mb"], 50)
+        self.assertLessEqual(phases["release"]["rss_change_mb"], -50)
+        self.assertLess(phases["release"]["rss_mb"], phases["allocate"]["rss_mb"])
+        self.assertGreaterEqual(summary["process_peak_rss_mb"], phases["release"]["rss_mb"] + 50)
+
+    def test_trace_memory_attributes_peak_to_phase(self):
+        """Test that tracemalloc peaks are attributed to the allocating phase and its parents"""
+        profiler = PhaseProfiler(trace_memory=True)
+        try:
+            with profiler.phase("outer"):
+                with profiler.phase("allocate"):
+                    buffer = bytearray(20 * 1024 * 1024)
+                    del buffer
+                with profiler.phase("small"):
+                    pass
+        finally:
+            profiler.close()
+
+        phases = profiler.to_dict()["phases"]
+        self.assertGreaterEqual(phases["allocate"]["alloc_peak_mb"], 19)
+        self.assertGreaterEqual(phases["outer"]["alloc_peak_mb"], 19)
+        self.assertLess(phases["small"]["alloc_peak_mb"], 1)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_main_reports_profile(self):
+        """Test that the training CLI includes per-phase results in its output and system log"""
+        rng = np.random.default_rng(4)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            pd.DataFrame({
+                "feature1": rng.standard_normal(50),
+                "target": rng.choice(["home_win", "away_win"], 50),
+            }).to_csv(root / "dataset.csv", index=False)
+            with open(root / "model_config.yaml", "w") as f:
+                yaml.safe_dump({
+                    "model_type": "LogisticRegression",
+                    "input_features": ["feature1"],
+                    "target_column": "target",
+                    "hyperparameters": {},
+                }, f)
+
+            argv = [
+                "train_model.py", "--dataset", str(root / "dataset.csv"), "--config", str(root / "model_config.yaml"),
+                "--output_dir", str(root / "models"), "--use_cache", "false", "--trace_memory", "true",
+            ]
+            stdout = io.StringIO()
+            with patch.object(sys, "argv", argv), \
+                    patch.object(train_model, "insert_system_log") as mock_log, \
+                    redirect_stdout(stdout):
+                self.assertEqual(train_model.main(), 0)
+
+        profile = json.loads(stdout.getvalue())["profile"]
+        self.assertEqual(
+            list(profile["phases"]),
+            ["load_config", "parse", "validate", "split", "fit", "predict", "metrics", "save"],
+        )
+        self.assertTrue(all("alloc_peak_mb" in phase for phase in profile["phases"].values()))
+        self.assertEqual(mock_log.call_args_list[-1].kwargs["details"]["profile"]["phases"].keys(), profile["phases"].keys())
+        self.assertFalse(tracemalloc.is_tracing())
+
+
+if __name__ == "__main__":
+    unittest.main()
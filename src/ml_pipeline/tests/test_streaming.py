@@ -0,0 +1,168 @@
+"""Unit tests for streaming module"""
+
+import importlib.util
+import io
+import json
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import yaml
+from sklearn.linear_model import SGDClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+from ml_pipeline import train_model
+from ml_pipeline.streaming import (
+    evaluate_streaming,
+    fit_streaming,
+    holdout_mask,
+    iter_dataset_chunks,
+    metrics_from_confusion,
+)
+from ml_pipeline.train_model import ModelTrainer, compute_metrics
+
+
+class TestStreaming(unittest.TestCase):
+    """Tests for out-of-core training"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.root = Path(self.tmpdir.name)
+
+        rng = np.random.default_rng(6)
+        features = rng.standard_normal((500, 2))
+        self.data = pd.DataFrame({
+            "feature1": features[:, 0],
+            "feature2": features[:, 1],
+            "unused": rng.standard_normal(500),
+            "target": np.select(
+                [features[:, 0] > 0.5, features[:, 0] < -0.5], ["home_win", "away_win"], "draw"
+            ),
+        })
+        self.dataset_path = str(self.root / "dataset.csv")
+        self.data.to_csv(self.dataset_path, index=False)
+        self.config = {
+            "model_type": "SGDClassifier",
+            "input_features": ["feature1", "feature2"],
+            "target_column": "target",
+            "hyperparameters": {"random_state": 0},
+        }
+
+    def chunks(self, chunk_size=64):
+        """Return a callable streaming the fixture dataset."""
+        return lambda: iter_dataset_chunks(self.dataset_path, ["feature1", "feature2", "target"], chunk_size=chunk_size)
+
+    def test_holdout_mask_independent_of_chunking(self):
+        """Test that holdout assignment depends only on row position and seed"""
+        whole = holdout_mask(0, 10_000, random_seed=42)
+        pieces = np.concatenate([holdout_mask(start, 700, random_seed=42) for start in range(0, 10_000, 700)])
+
+        np.testing.assert_array_equal(whole, pieces[:10_000])
+        self.assertAlmostEqual(whole.mean(), 0.2, delta=0.02)
+        self.assertFalse(np.array_equal(whole, holdout_mask(0, 10_000, random_seed=7)))
+
+    def test_metrics_from_confusion_match_compute_metrics(self):
+        """Test that confusion-matrix metrics equal the weighted sklearn metrics"""
+        rng = np.random.default_rng(1)
+        y_true = rng.integers(0, 3, 300)
+        # Class 3 is predicted but never true, class 2 is never predicted
+        y_pred = np.where(rng.random(300) < 0.6, y_true, rng.choice([0, 1, 3], 300))
+        confusion = np.zeros((4, 4), dtype=np.int64)
+        np.add.at(confusion, (y_true, y_pred), 1)
+
+        expected = compute_metrics(y_true, y_pred)
+        for name, value in metrics_from_confusion(confusion).items():
+            self.assertAlmostEqual(value, expected[name], places=12)
+
+    def test_iter_dataset_chunks_projects_columns(self):
+        """Test chunk sizes, column projection and declared dtypes"""
+        chunks = list(iter_dataset_chunks(
+            self.dataset_path, ["feature1", "target"], {"feature1": "float32"}, chunk_size=200
+        ))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [200, 200, 100])
+        self.assertEqual(list(chunks[0].columns), ["feature1", "target"])
+        self.assertEqual(chunks[0]["feature1"].dtype, np.float32)
+        with self.assertRaises(ValueError):
+            next(iter_dataset_chunks(self.dataset_path, ["feature1"], chunk_size=0))
+
+    def test_streamed_metrics_match_in_memory_holdout(self):
+        """Test that streamed evaluation equals scoring the holdout rows in memory"""
+        model = SGDClassifier(random_state=0)
+        classes = np.array(["away_win", "draw", "home_win"])
+
+        stats = fit_streaming(model, self.chunks(), ["feature1", "feature2"], "target", classes, epochs=3)
+        evaluation = evaluate_streaming(model, self.chunks(), ["feature1", "feature2"], "target", classes)
+
+        holdout = holdout_mask(0, len(self.data), random_seed=42)
+        X_holdout = self.data.loc[holdout, ["feature1", "feature2"]]
+        expected = compute_metrics(self.data.loc[holdout, "target"], model.predict(X_holdout))
+        self.assertEqual(stats["rows"], 500)
+        self.assertEqual(stats["chunks"], 8)
+        self.assertEqual(stats["train_rows"] + evaluation["holdout_rows"], 500)
+        for name, value in evaluation["metrics"].items():
+            self.assertAlmostEqual(value, expected[name], places=12)
+
+    def test_fit_streaming_requires_partial_fit(self):
+        """Test that estimators without partial_fit are rejected"""
+        with self.assertRaises(ValueError):
+            fit_streaming(DecisionTreeClassifier(), self.chunks(), ["feature1"], "target", np.array(["draw"]))
+
+    def test_trainer_streaming_fine_tune_skips_unknown_classes(self):
+        """Test that a fitted model keeps its classes and unknown labels are skipped"""
+        trainer = ModelTrainer()
+        trainer.config = self.config
+        known = self.data["target"] != "draw"
+        trainer.model = SGDClassifier(random_state=0).fit(
+            self.data.loc[known, ["feature1", "feature2"]], self.data.loc[known, "target"]
+        )
+
+        metrics = trainer.train_streaming(self.dataset_path, chunk_size=100, epochs=1, learning_rate=0.01)
+
+        self.assertEqual(trainer.stream_stats["classes"], ["away_win", "home_win"])
+        self.assertEqual(trainer.model.eta0, 0.01)
+        self.assertEqual(trainer.stream_stats["skipped_rows"], int((~known).sum()))
+        self.assertIn("f1_score", metrics)
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_iter_dataset_chunks_columnar_formats(self):
+        """Test chunked Parquet and Feather reads"""
+        for name, write in (("dataset.parquet", self.data.to_parquet), ("dataset.feather", self.data.to_feather)):
+            path = str(self.root / name)
+            write(path)
+
+            chunks = list(iter_dataset_chunks(path, ["feature2", "target"], chunk_size=128))
+
+            self.assertEqual([len(chunk) for chunk in chunks], [128, 128, 128, 116])
+            self.assertEqual(list(chunks[0].columns), ["feature2", "target"])
+            self.assertEqual(pd.concat(chunks)["target"].tolist(), self.data["target"].tolist())
+
+    def test_main_streaming_output(self):
+        """Test that --chunk_size trains out of core and reports streaming stats"""
+        config_path = self.root / "model_config.yaml"
+        with open(config_path, "w") as f:
+            yaml.safe_dump(self.config, f)
+        argv = [
+            "train_model.py", "--dataset", self.dataset_path, "--config", str(config_path),
+            "--output_dir", str(self.root / "models"), "--chunk_size", "100", "--epochs", "2", "--use_cache", "false",
+        ]
+        stdout = io.StringIO()
+        with patch.object(sys, "argv", argv), patch.object(train_model, "insert_system_log"), redirect_stdout(stdout):
+            self.assertEqual(train_model.main(), 0)
+
+        output = json.loads(stdout.getvalue())
+        self.assertEqual(output["dataset_size"], 500)
+        self.assertEqual(output["streaming"]["chunks"], 5)
+        self.assertIn("fit", output["profile"]["phases"])
+        self.assertIn("evaluate", output["profile"]["phases"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,8 @@
 """Unit tests for train_model module"""
 
+import importlib.util
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 from pathlib import Path
@@ -7,7 +10,7 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 
-from ml_pipeline.train_model import ModelTrainer, MissingFeatureError
+from ml_pipeline.train_model import MODEL_TYPES, ModelTrainer, MissingFeatureError, TrainingError
 
 
 class TestModelTrainer(unittest.TestCase):
@@ -100,6 +103,281 @@ class TestModelTrainer(unittest.TestCase):
         for value in metrics.values():
             self.assertTrue(0 <= value <= 1)
 
+    def test_create_model_sgd_learning_rate(self):
+        """Test that the fine-tuning learning rate becomes the SGD step size"""
+        trainer = ModelTrainer()
+        trainer.config = {"model_type": "SGDClassifier", "hyperparameters": {}}
+
+        model = trainer.create_model(learning_rate=0.01)
+
+        self.assertEqual(model.loss, "log_loss")
+        self.assertEqual(model.learning_rate, "constant")
+        self.assertEqual(model.eta0, 0.01)
+
+    def test_create_model_logistic_regression_ignores_learning_rate(self):
+        """Test that the learning rate is no longer mapped onto C"""
+        trainer = ModelTrainer()
+        trainer.config = {"model_type": "LogisticRegression", "hyperparameters": {"C": 2.0}}
+
+        model = trainer.create_model(learning_rate=0.01)
+
+        self.assertEqual(model.C, 2.0)
+
+    def test_fine_tune_sgd_runs_exact_epochs(self):
+        """Test that partial_fit models make exactly one pass per epoch"""
+        trainer = ModelTrainer()
+        trainer.config = {"model_type": "SGDClassifier", "hyperparameters": {}}
+        trainer.create_model()
+        X = self.sample_data[["feature1", "feature2"]]
+        y = self.sample_data["target"]
+        trainer.model.fit(X, y)
+        seen_before = trainer.model.t_
+
+        new_samples = X.head(30)
+        trainer.fine_tune(new_samples, y.head(30), epochs=3, learning_rate=0.005)
+
+        # t_ counts weight updates: one per sample per pass
+        self.assertEqual(trainer.model.t_ - seen_before, 3 * 30)
+        self.assertEqual(trainer.model.eta0, 0.005)
+
+    def test_fine_tune_skips_unknown_classes(self):
+        """Test that samples with classes the model never saw are skipped"""
+        trainer = ModelTrainer()
+        trainer.config = {"model_type": "SGDClassifier", "hyperparameters": {}}
+        trainer.create_model()
+        X = self.sample_data[["feature1", "feature2"]]
+        y = self.sample_data["target"]
+        trainer.model.fit(X, y)
+        seen_before = trainer.model.t_
+
+        new_y = y.head(10).copy()
+        new_y.iloc[:4] = 2
+        trainer.fine_tune(X.head(10), new_y, epochs=2)
+
+        self.assertEqual(trainer.model.t_ - seen_before, 2 * 6)
+        self.assertEqual(list(trainer.model.classes_), [0, 1])
+
+    def test_fine_tune_logistic_regression_warm_start(self):
+        """Test that LogisticRegression resumes from its coefficients"""
+        trainer = ModelTrainer()
+        trainer.config = self.sample_config
+        trainer.create_model()
+        X = self.sample_data[["feature1", "feature2"]]
+        y = self.sample_data["target"]
+        trainer.model.fit(X, y)
+
+        with patch.object(trainer.model, "fit", wraps=trainer.model.fit) as mock_fit:
+            trainer.fine_tune(X.head(20), y.head(20), epochs=2)
+
+        mock_fit.assert_called_once()
+        self.assertLessEqual(trainer.model.n_iter_[0], 2)
+        # The resume settings are not persisted with the model
+        self.assertFalse(trainer.model.warm_start)
+        self.assertEqual(trainer.model.max_iter, 100)
+
+    def test_fine_tune_invalid_epochs(self):
+        """Test that non-positive epochs are rejected"""
+        trainer = ModelTrainer()
+        trainer.config = self.sample_config
+        trainer.create_model()
+
+        with self.assertRaises(ValueError):
+            trainer.fine_tune(self.sample_data[["feature1"]], self.sample_data["target"], epochs=0)
+
+    def test_train_and_evaluate_fine_tune(self):
+        """Test fine-tuning a loaded model through train_and_evaluate"""
+        trainer = ModelTrainer()
+        trainer.config = {"model_type": "SGDClassifier", "hyperparameters": {}}
+        trainer.create_model()
+        X = self.sample_data[["feature1", "feature2"]]
+        y = self.sample_data["target"]
+        trainer.model.fit(X, y)
+
+        with patch.object(trainer.model, "partial_fit", wraps=trainer.model.partial_fit) as mock_partial_fit:
+            metrics = trainer.train_and_evaluate(X, y, fine_tune=True, epochs=4, learning_rate=0.01)
+
+        self.assertEqual(mock_partial_fit.call_count, 4)
+        self.assertIn("accuracy", metrics)
+
+    def test_create_model_tree_ensembles(self):
+        """Test that forest models default to all cores and the run's seed"""
+        for model_type, class_name in (("RandomForest", "RandomForestClassifier"), ("ExtraTrees", "ExtraTreesClassifier")):
+            trainer = ModelTrainer(random_seed=7)
+            trainer.config = {"model_type": model_type, "input_features": ["feature1"], "hyperparameters": {}}
+
+            model = trainer.create_model()
+
+            self.assertEqual(type(model).__name__, class_name)
+            self.assertEqual(model.n_jobs, -1)
+            self.assertEqual(model.random_state, 7)
+
+    def test_create_model_thread_budget(self):
+        """Test that the config n_jobs sets the thread budget unless overridden"""
+        trainer = ModelTrainer()
+        trainer.config = {"model_type": "RandomForest", "input_features": ["feature1"], "n_jobs": 2, "hyperparameters": {}}
+        self.assertEqual(trainer.create_model().n_jobs, 2)
+
+        trainer.config["hyperparameters"] = {"n_jobs": 1}
+        self.assertEqual(trainer.create_model().n_jobs, 1)
+
+    def test_thread_limits_caps_native_threads(self):
+        """Test that fits run with native thread pools capped at n_jobs"""
+        from threadpoolctl import threadpool_info
+
+        trainer = ModelTrainer()
+        trainer.config = {"model_type": "HistGradientBoosting", "n_jobs": 1}
+        with trainer.thread_limits():
+            self.assertTrue(all(pool["num_threads"] == 1 for pool in threadpool_info()))
+
+    def test_categorical_features_hist_gradient_boosting(self):
+        """Test that categorical features are read as categories and split on natively"""
+        rng = np.random.default_rng(0)
+        template = rng.choice(["A", "B", "C", "D"], 400)
+        data = pd.DataFrame({
+            "feature1": rng.random(400),
+            "template": template,
+            "target": np.where(np.isin(template, ["A", "C"]), "home_win", "away_win"),
+        })
+        trainer = ModelTrainer()
+        trainer.config = {
+            "model_type": "HistGradientBoosting",
+            "input_features": ["feature1", "template"],
+            "categorical_features": ["template"],
+            "target_column": "target",
+            "hyperparameters": {"max_iter": 20},
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "data.csv")
+            data.to_csv(path, index=False)
+            X, y = trainer.load_data(path)
+
+        self.assertIsInstance(X["template"].dtype, pd.CategoricalDtype)
+        trainer.create_model()
+        metrics = trainer.train_and_evaluate(X, y)
+
+        self.assertEqual(list(trainer.model.is_categorical_), [False, True])
+        self.assertEqual(metrics["accuracy"], 1.0)
+
+        # Cross-validation workers receive category codes instead of strings
+        cv_metrics = trainer.train_and_evaluate(X, y, cv_folds=3, n_jobs=1)
+        self.assertEqual(cv_metrics["accuracy"], 1.0)
+
+    def test_categorical_features_require_native_support(self):
+        """Test that categorical features are rejected for models without native support"""
+        trainer = ModelTrainer()
+        trainer.config = {
+            "model_type": "RandomForest",
+            "input_features": ["feature1", "template"],
+            "categorical_features": ["template"],
+            "hyperparameters": {},
+        }
+
+        with self.assertRaises(TrainingError):
+            trainer.create_model()
+
+        trainer.config.update(model_type="HistGradientBoosting", categorical_features=["missing"])
+        with self.assertRaises(TrainingError):
+            trainer.create_model()
+
+    def test_fine_tune_tree_ensembles(self):
+        """Test that boosting adds iterations and forests are refit when fine-tuning"""
+        X = self.sample_data[["feature1", "feature2"]]
+        y = self.sample_data["target"]
+
+        trainer = ModelTrainer()
+        trainer.config = {
+            "model_type": "HistGradientBoosting",
+            "input_features": list(X.columns),
+            "hyperparameters": {"max_iter": 5, "early_stopping": False},
+        }
+        trainer.create_model()
+        trainer.model.fit(X, y)
+        trainer.fine_tune(X.head(40), y.head(40), epochs=3)
+
+        self.assertEqual(trainer.model.n_iter_, 8)
+        self.assertFalse(trainer.model.warm_start)
+        self.assertEqual(trainer.model.max_iter, 5)
+
+        trainer.config = {**trainer.config, "model_type": "RandomForest", "hyperparameters": {"n_estimators": 10}}
+        trainer.create_model()
+        trainer.model.fit(X, y)
+        with patch.object(trainer.model, "fit", wraps=trainer.model.fit) as mock_fit:
+            trainer.fine_tune(X.head(40), y.head(40), epochs=3)
+
+        self.assertEqual(len(mock_fit.call_args.args[0]), 40)
+        self.assertEqual(len(trainer.model.estimators_), 10)
+        self.assertFalse(trainer.model.warm_start)
+
+    def test_fine_tune_checks_model_against_config(self):
+        """Test that a model of another type or feature set is replaced by a new model"""
+        X = self.sample_data[["feature1", "feature2"]]
+        y = self.sample_data["target"]
+        trainer = ModelTrainer()
+        trainer.config = self.sample_config
+        trainer.create_model()
+        trainer.model.fit(X, y)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            model_path = trainer.save_model(tmpdir)
+
+            self.assertTrue(trainer.load_model_for_fine_tuning(model_path))
+            self.assertTrue(hasattr(trainer.model, "coef_"))
+
+            mismatches = (
+                {**self.sample_config, "model_type": "SGDClassifier"},
+                {**self.sample_config, "input_features": ["feature2", "feature1"]},
+            )
+            for config in mismatches:
+                trainer.config = config
+                with self.assertLogs("ml_pipeline.train_model", level="WARNING"):
+                    self.assertFalse(trainer.load_model_for_fine_tuning(model_path))
+                self.assertEqual(type(trainer.model).__name__, MODEL_TYPES[config["model_type"]].rpartition(":")[2])
+                self.assertFalse(hasattr(trainer.model, "classes_"))
+
+    def test_load_data_projects_columns_with_dtypes(self):
+        """Test that only configured columns are read, with declared dtypes"""
+        trainer = ModelTrainer()
+        trainer.config = {**self.sample_config, "feature_dtype": "float32", "dtypes": {"target": "category"}}
+        data = self.sample_data.assign(unused=np.arange(100), notes="x")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "dataset.csv")
+            data.to_csv(path, index=False)
+            X, y = trainer.load_data(path)
+
+        self.assertEqual(list(X.columns), ["feature1", "feature2"])
+        self.assertTrue((X.dtypes == np.float32).all())
+        self.assertIsInstance(y.dtype, pd.CategoricalDtype)
+        np.testing.assert_allclose(X["feature1"], data["feature1"], rtol=1e-6)
+
+    def test_load_data_missing_column_raises(self):
+        """Test that a dataset without a configured feature is rejected"""
+        trainer = ModelTrainer()
+        trainer.config = self.sample_config
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "dataset.csv")
+            self.sample_data[["feature1", "target"]].to_csv(path, index=False)
+            with self.assertRaises(TrainingError):
+                trainer.load_data(path)
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_load_data_columnar_formats(self):
+        """Test Parquet and Feather input with column projection"""
+        trainer = ModelTrainer()
+        trainer.config = {**self.sample_config, "dtypes": {"feature1": "float32"}}
+        data = self.sample_data.assign(unused=np.arange(100))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name, write in (("dataset.parquet", data.to_parquet), ("dataset.feather", data.to_feather)):
+                path = os.path.join(tmpdir, name)
+                write(path)
+                X, y = trainer.load_data(path)
+
+                self.assertEqual(list(X.columns), ["feature1", "feature2"])
+                self.assertEqual(X["feature1"].dtype, np.float32)
+                self.assertEqual(y.tolist(), data["target"].tolist())
+
     def test_parse_arguments_dataset_required(self):
         """Test that dataset argument is required"""
         from ml_pipeline.train_model import parse_arguments
@@ -0,0 +1,139 @@
+"""Unit tests for training_cache module"""
+
+import io
+import json
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from ml_pipeline import train_model, training_cache
+
+
+class TestTrainingCache(unittest.TestCase):
+    """Tests for the content-addressed training cache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.root = Path(self.tmpdir.name)
+        self.cache_dir = self.root / "cache"
+        self.runs = 0
+
+        rng = np.random.default_rng(2)
+        self.dataset_path = str(self.root / "dataset.csv")
+        pd.DataFrame({
+            "feature1": rng.standard_normal(60),
+            "feature2": rng.standard_normal(60),
+            "target": rng.choice(["home_win", "away_win"], 60),
+        }).to_csv(self.dataset_path, index=False)
+
+        self.config = {
+            "model_type": "SGDClassifier",
+            "input_features": ["feature1", "feature2"],
+            "target_column": "target",
+            "hyperparameters": {},
+        }
+        self.config_path = str(self.root / "model_config.yaml")
+        with open(self.config_path, "w") as f:
+            yaml.safe_dump(self.config, f)
+
+    def run_main(self, *extra_args):
+        """Run the training CLI and return its JSON output and system log calls."""
+        # A fresh output directory per run, as model filenames have one-second resolution
+        self.runs += 1
+        argv = [
+            "train_model.py", "--dataset", self.dataset_path, "--config", self.config_path,
+            "--output_dir", str(self.root / f"run{self.runs}"), *extra_args,
+        ]
+        stdout = io.StringIO()
+        with patch.object(sys, "argv", argv), \
+                patch.object(training_cache, "TRAINING_CACHE_DIR", self.cache_dir), \
+                patch.object(train_model, "insert_system_log") as mock_log, \
+                redirect_stdout(stdout):
+            self.assertEqual(train_model.main(), 0)
+        return json.loads(stdout.getvalue()), mock_log.call_args_list
+
+    def test_cache_key_tracks_inputs(self):
+        """Test that the key changes with the dataset contents, config, seed and options"""
+        key = training_cache.compute_cache_key(self.dataset_path, self.config, 42)
+
+        self.assertEqual(key, training_cache.compute_cache_key(self.dataset_path, dict(self.config), 42))
+        self.assertNotEqual(key, training_cache.compute_cache_key(self.dataset_path, self.config, 7))
+        self.assertNotEqual(key, training_cache.compute_cache_key(
+            self.dataset_path, {**self.config, "hyperparameters": {"alpha": 0.01}}, 42
+        ))
+        self.assertNotEqual(key, training_cache.compute_cache_key(self.dataset_path, self.config, 42, options={"epochs": 3}))
+
+        with open(self.dataset_path, "a") as f:
+            f.write("0.1,0.2,home_win\n")
+        self.assertNotEqual(key, training_cache.compute_cache_key(self.dataset_path, self.config, 42))
+
+    def test_lookup_ignores_deleted_artifacts(self):
+        """Test that entries are returned only while their model file is unchanged"""
+        model_path = self.root / "model.pkl"
+        model_path.write_bytes(b"model")
+        training_cache.store("abc", {"model_path": str(model_path), "metrics": {"accuracy": 0.5}}, self.cache_dir)
+
+        self.assertEqual(training_cache.lookup("abc", self.cache_dir)["metrics"], {"accuracy": 0.5})
+        self.assertIsNone(training_cache.lookup("missing", self.cache_dir))
+
+        model_path.write_bytes(b"another model")
+        self.assertIsNone(training_cache.lookup("abc", self.cache_dir))
+
+        model_path.unlink()
+        self.assertIsNone(training_cache.lookup("abc", self.cache_dir))
+
+    def test_main_reuses_artifact_for_identical_inputs(self):
+        """Test that a second identical run reuses the model and records the cache hit"""
+        first, _ = self.run_main()
+        second, log_calls = self.run_main()
+
+        self.assertFalse(first["cache_hit"])
+        self.assertTrue(second["cache_hit"])
+        self.assertEqual(second["model_path"], first["model_path"])
+        self.assertEqual(second["metrics"], first["metrics"])
+        self.assertFalse((self.root / "run2").exists())
+        self.assertTrue(log_calls[-1].kwargs["details"]["cache_hit"])
+
+        third, _ = self.run_main("--use_cache", "false")
+        self.assertFalse(third["cache_hit"])
+        self.assertIsNone(third["cache_key"])
+
+    def test_main_fine_tune_hits_only_identical_inputs(self):
+        """Test that only fine-tuning the same base model on the same data is a cache hit"""
+        base, _ = self.run_main()
+
+        tuned, _ = self.run_main("--fine_tune", "true", "--model_path", base["model_path"])
+        self.assertFalse(tuned["cache_hit"])
+
+        again, _ = self.run_main("--fine_tune", "true", "--model_path", base["model_path"])
+        self.assertTrue(again["cache_hit"])
+        self.assertEqual(again["model_path"], tuned["model_path"])
+
+        # A different base model is a different input, even if it was tuned on this data
+        chained, _ = self.run_main("--fine_tune", "true", "--model_path", tuned["model_path"])
+        self.assertFalse(chained["cache_hit"])
+
+    def test_main_streaming_epochs_are_part_of_the_key(self):
+        """Test that streaming runs differing only in epochs do not share a cache entry"""
+        one_pass, _ = self.run_main("--chunk_size", "16", "--epochs", "1")
+        more_passes, _ = self.run_main("--chunk_size", "16", "--epochs", "3")
+        again, _ = self.run_main("--chunk_size", "16", "--epochs", "3")
+
+        self.assertFalse(one_pass["cache_hit"])
+        self.assertFalse(more_passes["cache_hit"])
+        self.assertNotEqual(more_passes["model_path"], one_pass["model_path"])
+        self.assertTrue(again["cache_hit"])
+        self.assertEqual(again["model_path"], more_passes["model_path"])
+
+
+if __name__ == "__main__":
+    unittest.main()
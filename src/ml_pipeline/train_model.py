@@ -1,34 +1,52 @@
 #!/usr/bin/env python3
 """
 ML Pipeline train_model.py - CLI interface for model training with fine-tuning support
+
+scikit-learn is imported where it is first needed, so the CLI starts quickly
+and cache hits return without loading it. Models are stored as memory-mapped
+artifacts (see ``artifacts``).
 """
 
 import argparse
+import importlib
 import json
 import logging
 import sys
+from contextlib import nullcontext
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import numpy as np
 import pandas as pd
 import traceback
+import warnings
 import yaml
-from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import accuracy_score, classification_report, f1_score, precision_score, recall_score
-from sklearn.model_selection import train_test_split
-from sklearn.tree import DecisionTreeClassifier
-import joblib
 
-from .config import DEBUG, LOG_LEVEL, MODELS_DIR, RETRAINED_MODELS_DIR
+from .artifacts import load_artifact, save_artifact
+from .config import (
+    DEBUG,
+    DEFAULT_FINE_TUNE_EPOCHS,
+    DEFAULT_LEARNING_RATE,
+    LOG_LEVEL,
+    MODELS_DIR,
+    RETRAINED_MODELS_DIR,
+    ensure_directories,
+)
+from .evaluation import (
+    DEFAULT_BOOTSTRAP_SAMPLES,
+    DEFAULT_CONFIDENCE,
+    confusion_matrix,
+    confusion_metrics,
+    evaluate,
+    evaluate_confusion,
+)
+from .profiling import PhaseProfiler
+from .shared_arrays import thread_budget
 from .supabase_client import insert_system_log
+from . import training_cache
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
@@ -37,40 +55,266 @@ class MissingFeatureError(Exception):
     pass
 
 
+class TrainingError(Exception):
+    """Raised when a training run cannot be completed."""
+    pass
+
+
+@dataclass
+class TrainingResult:
+    """Outcome of a training run (see ``train``)."""
+
+    model_path: str
+    metrics: Dict[str, float]
+    dataset_size: int
+    cache_hit: bool = False
+    cache_key: Optional[str] = None
+    leaderboard: Optional[List[Dict[str, Any]]] = None
+    leaderboard_path: Optional[str] = None
+    cross_validation: Optional[Dict[str, Any]] = None
+    streaming: Optional[Dict[str, Any]] = None
+    evaluation: Optional[Dict[str, Any]] = None
+    profile: Optional[Dict[str, Any]] = None
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    # Sections that are omitted from the output when a run did not produce them
+    _OPTIONAL = ("leaderboard", "leaderboard_path", "cross_validation", "streaming", "evaluation")
+    # Fields describing one particular run rather than the trained model
+    _PER_RUN = ("cache_hit", "cache_key", "profile", "timestamp")
+
+    @classmethod
+    def from_dict(cls, output: Dict[str, Any], **overrides: Any) -> "TrainingResult":
+        """Build a result from ``to_dict`` output, ignoring unknown keys."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{**{key: value for key, value in output.items() if key in known}, **overrides})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-serializable form of the result (the CLI output).
+
+        Returns:
+            Dictionary with status, model_path, metrics, dataset_size,
+            timestamp, cache_hit, cache_key, profile and any optional sections
+        """
+        output = {
+            "status": "success",
+            "model_path": self.model_path,
+            "metrics": self.metrics,
+            "dataset_size": self.dataset_size,
+            "timestamp": self.timestamp,
+        }
+        for name in self._OPTIONAL:
+            value = getattr(self, name)
+            if value is not None:
+                output[name] = value
+        output.update(cache_hit=self.cache_hit, cache_key=self.cache_key, profile=self.profile)
+        return output
+
+    def cacheable_output(self) -> Dict[str, Any]:
+        """The parts of ``to_dict`` that hold for every run with the same inputs."""
+        return {key: value for key, value in self.to_dict().items() if key not in ("status",) + self._PER_RUN}
+
+
+# Estimator classes by config ``model_type``, as "module:Class" imported on use
+MODEL_TYPES = {
+    "LogisticRegression": "sklearn.linear_model:LogisticRegression",
+    "SGDClassifier": "sklearn.linear_model:SGDClassifier",
+    "DecisionTree": "sklearn.tree:DecisionTreeClassifier",
+    "RandomForest": "sklearn.ensemble:RandomForestClassifier",
+    "ExtraTrees": "sklearn.ensemble:ExtraTreesClassifier",
+    "HistGradientBoosting": "sklearn.ensemble:HistGradientBoostingClassifier",
+}
+
+# Model types that fit trees in parallel threads through their ``n_jobs``
+THREADED_MODEL_TYPES = ("RandomForest", "ExtraTrees")
+
+# Model types that split on categorical features natively
+CATEGORICAL_MODEL_TYPES = ("HistGradientBoosting",)
+
+
+def build_model(model_type: str, hyperparameters: Dict[str, Any]) -> Any:
+    """
+    Instantiate an estimator of a supported model type.
+
+    Args:
+        model_type: Config model type (see ``MODEL_TYPES``)
+        hyperparameters: Estimator keyword arguments
+
+    Returns:
+        Unfitted estimator
+
+    Raises:
+        ValueError: If the model type is not supported
+    """
+    if model_type not in MODEL_TYPES:
+        raise ValueError(f"Unsupported model type: {model_type}")
+    module_name, class_name = MODEL_TYPES[model_type].split(":")
+    return getattr(importlib.import_module(module_name), class_name)(**hyperparameters)
+
+
+# Columnar dataset formats by file suffix (anything else is read as CSV)
+PARQUET_SUFFIXES = (".parquet", ".pq")
+FEATHER_SUFFIXES = (".feather", ".arrow")
+
+
+def iter_dataset(
+    data_path: str,
+    columns: List[str],
+    dtypes: Optional[Dict[str, str]] = None,
+    chunk_size: Optional[int] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Read the given columns of a CSV, Parquet or Feather dataset, whole or in chunks.
+
+    Columns are projected while reading, so unused columns are never parsed
+    or held in memory. Parquet and Feather input requires ``pyarrow``.
+
+    Args:
+        data_path: Path to the dataset; the format is chosen by file suffix
+        columns: Columns to read (columns absent from the file are skipped
+            so the caller can report them)
+        dtypes: Optional dtypes by column, e.g. ``float32`` or ``category``
+        chunk_size: Maximum rows per chunk, or None to read the file at once
+
+    Yields:
+        DataFrames with the requested columns present in the file, in file
+        order (a single one when chunk_size is None)
+
+    Raises:
+        FileNotFoundError: If the dataset does not exist
+        ImportError: If pyarrow is missing for Parquet/Feather input
+    """
+    path = Path(data_path)
+    if not path.is_file():
+        raise FileNotFoundError(data_path)
+    dtypes = dtypes or {}
+    suffix = path.suffix.lower()
+
+    if suffix in PARQUET_SUFFIXES:
+        import pyarrow.parquet
+
+        with pyarrow.parquet.ParquetFile(path) as parquet_file:
+            present = [col for col in columns if col in parquet_file.schema_arrow.names]
+            if chunk_size is None:
+                frames = [parquet_file.read(columns=present)]
+            else:
+                frames = parquet_file.iter_batches(batch_size=chunk_size, columns=present)
+            for table in frames:
+                df = table.to_pandas()
+                yield df.astype({col: dtype for col, dtype in dtypes.items() if col in df.columns})
+        return
+
+    if suffix in FEATHER_SUFFIXES:
+        import pyarrow
+        import pyarrow.ipc
+
+        with pyarrow.ipc.open_file(pyarrow.memory_map(str(path))) as reader:
+            present = [col for col in columns if col in reader.schema.names]
+            if chunk_size is None:
+                frames = [reader.read_all().select(present)]
+            else:
+                frames = (
+                    batch.slice(offset, chunk_size)
+                    for batch in (reader.get_batch(index).select(present) for index in range(reader.num_record_batches))
+                    for offset in range(0, batch.num_rows, chunk_size)
+                )
+            for table in frames:
+                df = table.to_pandas()
+                yield df.astype({col: dtype for col, dtype in dtypes.items() if col in df.columns})
+        return
+
+    wanted = set(columns)
+    if chunk_size is None:
+        yield pd.read_csv(path, usecols=lambda col: col in wanted, dtype=dtypes)
+        return
+    with pd.read_csv(path, usecols=lambda col: col in wanted, dtype=dtypes, chunksize=chunk_size) as reader:
+        yield from reader
+
+
+def read_dataset(data_path: str, columns: List[str], dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Read only the given columns of a CSV, Parquet or Feather dataset.
+
+    Args:
+        data_path: Path to the dataset; the format is chosen by file suffix
+        columns: Columns to read (columns absent from the file are skipped
+            so the caller can report them)
+        dtypes: Optional dtypes by column, e.g. ``float32`` or ``category``
+
+    Returns:
+        DataFrame with the requested columns present in the file
+
+    Raises:
+        FileNotFoundError: If the dataset does not exist
+        ImportError: If pyarrow is missing for Parquet/Feather input
+    """
+    return next(iter_dataset(data_path, columns, dtypes))
+
+
+def compute_metrics(y_true: Any, y_pred: Any) -> Dict[str, float]:
+    """
+    Compute the classification metrics reported for every model.
+
+    Args:
+        y_true: True labels
+        y_pred: Predicted labels
+
+    Returns:
+        Dictionary with accuracy, the weighted precision, recall and
+        f1_score and their macro averages (see ``evaluation``)
+    """
+    _, confusion = confusion_matrix(y_true, y_pred)
+    return confusion_metrics(confusion)
+
+
 class ModelTrainer:
     """Handles model training, evaluation, and fine-tuning."""
 
-    def __init__(self, config_path: str = "model_config.yaml", random_seed: int = 42):
+    def __init__(
+        self,
+        config_path: str = "model_config.yaml",
+        random_seed: int = 42,
+        profiler: Optional[PhaseProfiler] = None,
+    ):
         """
         Initialize the model trainer.
 
         Args:
             config_path: Path to the YAML configuration file
             random_seed: Random seed for reproducibility
+            profiler: Records time and memory per phase (default: a new one)
         """
         self.config_path = config_path
         self.random_seed = random_seed
+        self.profiler = profiler or PhaseProfiler()
         self.config = None
         self.model = None
         self.metrics = {}
+        self.leaderboard = None
+        self.cv_results = None
+        self.stream_stats = None
+        self.evaluation = None
 
     def load_config(self) -> Dict[str, Any]:
-        """Load and parse the model configuration from YAML."""
+        """
+        Load and parse the model configuration from YAML.
+
+        Raises:
+            TrainingError: If the file is missing or not valid YAML
+        """
         try:
             config_path = Path(self.config_path)
             if not config_path.is_absolute():
                 config_path = Path(__file__).parent.parent / config_path
 
-            with open(config_path, "r") as f:
+            with self.profiler.phase("load_config"), open(config_path, "r") as f:
                 self.config = yaml.safe_load(f)
             logger.info(f"Configuration loaded from {config_path}")
             return self.config
-        except FileNotFoundError:
-            logger.error(f"Configuration file not found: {self.config_path}")
-            sys.exit(1)
+        except FileNotFoundError as e:
+            raise TrainingError(f"Configuration file not found: {self.config_path}") from e
         except yaml.YAMLError as e:
-            logger.error(f"Error parsing YAML configuration: {e}")
-            sys.exit(1)
+            raise TrainingError(f"Error parsing YAML configuration: {e}") from e
 
     def validate_data(self, df: pd.DataFrame) -> None:
         """
@@ -92,107 +336,631 @@ class ModelTrainer:
 
         logger.info(f"Data validation passed - {len(required_columns)} required columns present")
 
+    def column_dtypes(self) -> Dict[str, str]:
+        """
+        Dtypes declared for the dataset columns in the model config.
+
+        ``feature_dtype`` applies to every input feature, features listed in
+        ``categorical_features`` are read as ``category`` and ``dtypes`` sets
+        (or overrides) the dtype of individual columns, e.g.::
+
+            feature_dtype: float32
+            categorical_features: [template]
+            dtypes:
+              actual_outcome: category
+
+        Returns:
+            Dictionary of dtypes by column (empty to let pandas infer them)
+        """
+        feature_dtype = self.config.get("feature_dtype")
+        dtypes = {feature: feature_dtype for feature in self.config["input_features"]} if feature_dtype else {}
+        dtypes.update({feature: "category" for feature in self.config.get("categorical_features") or []})
+        dtypes.update(self.config.get("dtypes") or {})
+        return dtypes
+
+    def cache_key(
+        self,
+        data_path: str,
+        base_model_path: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Content hash identifying a training run on this trainer's config and seed.
+
+        Args:
+            data_path: Path to the training dataset
+            base_model_path: Model being fine-tuned, if any
+            options: Other options affecting the trained model
+
+        Returns:
+            Cache key (see ``training_cache.compute_cache_key``)
+        """
+        return training_cache.compute_cache_key(
+            data_path, self.config, self.random_seed, base_model_path=base_model_path, options=options
+        )
+
+    def output_cache_key(self, data_path: str, model_path: str, options: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Content hash recording that a fine-tuning run on a dataset produced a model.
+
+        Unlike ``cache_key`` it hashes the run's output rather than its base
+        model, so a later run that would continue from ``model_path`` on the
+        same data can tell the model is already up to date.
+
+        Args:
+            data_path: Path to the dataset the model was fine-tuned on
+            model_path: Model produced by the run
+            options: Options of the run (as passed to ``cache_key``)
+
+        Returns:
+            Cache key, distinct from every ``cache_key``
+        """
+        return self.cache_key(data_path, model_path, {**(options or {}), "output_of_run": True})
+
     def load_data(self, data_path: str) -> tuple:
         """
         Load and validate the training dataset.
 
+        Only the input features and target column are read, with the dtypes
+        declared in the config (see ``column_dtypes``).
+
         Args:
-            data_path: Path to the CSV file
+            data_path: Path to the CSV, Parquet or Feather file
 
         Returns:
             Tuple of (features DataFrame, target Series)
+
+        Raises:
+            TrainingError: If the dataset is missing, empty, lacks required
+                columns or cannot be parsed
         """
         try:
-            df = pd.read_csv(data_path)
-            logger.info(f"Dataset loaded from {data_path} ({len(df)} rows)")
+            required_columns = self.config["input_features"] + [self.config["target_column"]]
+            with self.profiler.phase("parse"):
+                df = read_dataset(data_path, required_columns, self.column_dtypes())
+            memory_mb = df.memory_usage(deep=True).sum() / 1024 ** 2
+            logger.info(f"Dataset loaded from {data_path} ({len(df)} rows, {len(df.columns)} columns, {memory_mb:.1f} MB)")
 
-            self.validate_data(df)
+            with self.profiler.phase("validate"):
+                self.validate_data(df)
 
             X = df[self.config["input_features"]]
             y = df[self.config["target_column"]]
 
             return X, y
-        except FileNotFoundError:
-            logger.error(f"Dataset file not found: {data_path}")
-            sys.exit(1)
-        except pd.errors.EmptyDataError:
-            logger.error(f"Dataset file is empty: {data_path}")
-            sys.exit(1)
+        except FileNotFoundError as e:
+            raise TrainingError(f"Dataset file not found: {data_path}") from e
+        except pd.errors.EmptyDataError as e:
+            raise TrainingError(f"Dataset file is empty: {data_path}") from e
         except MissingFeatureError as e:
-            logger.error(f"Data validation failed: {e}")
-            sys.exit(1)
+            raise TrainingError(f"Data validation failed: {e}") from e
+        except ImportError as e:
+            raise TrainingError(f"Reading {data_path} requires pyarrow: {e}") from e
+        except (TypeError, ValueError) as e:
+            raise TrainingError(f"Failed to parse dataset {data_path} with the configured dtypes: {e}") from e
 
-    def create_model(self, learning_rate: Optional[float] = None) -> Any:
+    def model_hyperparameters(self, learning_rate: Optional[float] = None) -> Dict[str, Any]:
         """
-        Create a model instance based on the configuration.
+        Resolve the estimator keyword arguments from the configuration.
 
         Args:
-            learning_rate: Optional learning rate for fine-tuning
+            learning_rate: Optional learning rate for fine-tuning (used as the
+                constant SGD step size; other model types have none)
+
+        The config's ``n_jobs`` (default -1, all cores) is the thread budget
+        of forest models, and ``categorical_features`` are passed to models
+        that split on categories natively.
 
         Returns:
-            Instantiated model object
+            Hyperparameters dict including model-type defaults
+
+        Raises:
+            ValueError: If categorical features are configured for a model
+                type without native categorical support, or are not inputs
         """
         model_type = self.config["model_type"]
         hyperparameters = self.config.get("hyperparameters", {}).copy()
 
         # Apply learning rate if fine-tuning
         if learning_rate is not None:
-            if model_type == "LogisticRegression":
-                # Adjust regularization based on learning rate
-                hyperparameters["C"] = learning_rate
-            logger.info(f"Fine-tuning with learning_rate={learning_rate}")
-
-        if model_type == "LogisticRegression":
-            self.model = LogisticRegression(**hyperparameters)
-        elif model_type == "DecisionTree":
-            self.model = DecisionTreeClassifier(**hyperparameters)
-        else:
-            logger.error(f"Unsupported model type: {model_type}")
-            sys.exit(1)
+            if model_type == "SGDClassifier":
+                hyperparameters["learning_rate"] = "constant"
+                hyperparameters["eta0"] = learning_rate
+                logger.info(f"Fine-tuning with learning_rate={learning_rate}")
+            else:
+                logger.info(f"{model_type} has no learning rate; ignoring learning_rate={learning_rate}")
+
+        if model_type == "SGDClassifier":
+            # SGD-based logistic regression, trainable incrementally with partial_fit
+            hyperparameters.setdefault("loss", "log_loss")
+            hyperparameters.setdefault("random_state", self.random_seed)
+
+        if model_type in THREADED_MODEL_TYPES + CATEGORICAL_MODEL_TYPES:
+            hyperparameters.setdefault("random_state", self.random_seed)
+        if model_type in THREADED_MODEL_TYPES:
+            hyperparameters.setdefault("n_jobs", self.config.get("n_jobs", -1))
+
+        categorical = self.config.get("categorical_features") or []
+        if categorical:
+            features = self.config["input_features"]
+            unknown = sorted(set(categorical) - set(features))
+            if unknown:
+                raise ValueError(f"categorical_features are not input features: {unknown}")
+            if model_type not in CATEGORICAL_MODEL_TYPES:
+                raise ValueError(
+                    f"{model_type} does not support categorical features. "
+                    f"Model types with native support: {', '.join(CATEGORICAL_MODEL_TYPES)}"
+                )
+            # A mask rather than names, so it also applies to the code matrices
+            # used by the search and cross-validation workers
+            hyperparameters.setdefault("categorical_features", [feature in categorical for feature in features])
+
+        return hyperparameters
+
+    def evaluation_options(self) -> Dict[str, Any]:
+        """
+        Bootstrap settings from the config's optional ``evaluation`` block.
+
+        Returns:
+            Keyword arguments n_bootstrap, confidence and random_seed for
+            ``evaluation.evaluate``
+        """
+        options = (self.config or {}).get("evaluation") or {}
+        return {
+            "n_bootstrap": int(options.get("n_bootstrap", DEFAULT_BOOTSTRAP_SAMPLES)),
+            "confidence": float(options.get("confidence", DEFAULT_CONFIDENCE)),
+            "random_seed": self.random_seed,
+        }
+
+    def thread_limits(self) -> Any:
+        """
+        Cap the native (OpenMP/BLAS) threads of fits and predictions.
+
+        Returns:
+            Context manager limiting threads to the config's ``n_jobs``, and
+            to the process's thread budget when it runs next to pool workers
+            (see ``shared_arrays.limit_threads``); a no-op when neither applies
+        """
+        n_jobs = (self.config or {}).get("n_jobs")
+        budget = thread_budget()
+        if budget is not None and (not n_jobs or n_jobs < 0 or n_jobs > budget):
+            n_jobs = budget
+        if not n_jobs or n_jobs < 0:
+            return nullcontext()
+        from threadpoolctl import threadpool_limits
+
+        return threadpool_limits(limits=n_jobs)
+
+    def create_model(
+        self,
+        learning_rate: Optional[float] = None,
+        overrides: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Create a model instance based on the configuration.
+
+        Args:
+            learning_rate: Optional learning rate for fine-tuning (used as the
+                constant SGD step size; other model types have none)
+            overrides: Optional hyperparameters taking precedence over the
+                config (e.g. the winner of a search)
+
+        Returns:
+            Instantiated model object
+
+        Raises:
+            TrainingError: If the model type is not supported or the config
+                is invalid for it
+        """
+        model_type = self.config["model_type"]
+
+        try:
+            hyperparameters = {**self.model_hyperparameters(learning_rate), **(overrides or {})}
+            self.model = build_model(model_type, hyperparameters)
+        except ValueError as e:
+            raise TrainingError(str(e)) from e
 
         logger.info(f"Model created: {model_type}")
         return self.model
 
-    def train_and_evaluate(self, X: pd.DataFrame, y: pd.Series) -> Dict[str, float]:
+    def split_data(self, X: pd.DataFrame, y: pd.Series) -> tuple:
+        """
+        Split the dataset into stratified 80/20 train and test sets.
+
+        Args:
+            X: Feature matrix
+            y: Target vector
+
+        Returns:
+            Tuple of (X_train, X_test, y_train, y_test)
+        """
+        from sklearn.model_selection import train_test_split
+
+        with self.profiler.phase("split"):
+            return train_test_split(X, y, test_size=0.2, random_state=self.random_seed, stratify=y)
+
+    def search_hyperparameters(
+        self,
+        X: pd.DataFrame,
+        y: pd.Series,
+        n_jobs: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search the config's ``search`` block and create the winning model.
+
+        Candidates are scored on the same split as ``train_and_evaluate``, in
+        parallel worker processes (see ``hyperparameter_search``).
+
+        Args:
+            X: Feature matrix
+            y: Target vector
+            n_jobs: Worker processes (default: all cores)
+
+        Returns:
+            Leaderboard of all candidates, best first
+
+        Raises:
+            ValueError: If the search config is invalid or every candidate failed
+        """
+        from .hyperparameter_search import build_candidates, run_search
+
+        search_config = self.config["search"]
+        metric = search_config.get("metric", "f1_score")
+        candidates = build_candidates(search_config, random_seed=self.random_seed)
+
+        X_train, X_test, y_train, y_test = self.split_data(X, y)
+        with self.profiler.phase("search"):
+            self.leaderboard = run_search(
+                self.config["model_type"],
+                self.model_hyperparameters(),
+                candidates,
+                X_train,
+                X_test,
+                y_train,
+                y_test,
+                metric=metric,
+                n_jobs=n_jobs,
+            )
+
+        best = self.leaderboard[0]
+        if best["metrics"] is None:
+            raise ValueError(f"All {len(candidates)} search candidates failed")
+        self.create_model(overrides=best["params"])
+        return self.leaderboard
+
+    def save_leaderboard(self, model_path: str) -> Optional[str]:
+        """
+        Write the search leaderboard as JSON next to the saved model.
+
+        Args:
+            model_path: Path of the saved model file
+
+        Returns:
+            Path to the leaderboard file, or None if no search was run
+        """
+        if self.leaderboard is None:
+            return None
+
+        leaderboard_path = Path(model_path).with_name(f"{Path(model_path).stem}_leaderboard.json")
+        with open(leaderboard_path, "w") as f:
+            json.dump(
+                {
+                    "metric": self.config["search"].get("metric", "f1_score"),
+                    "strategy": self.config["search"].get("strategy", "grid"),
+                    "leaderboard": self.leaderboard,
+                },
+                f,
+                indent=2,
+            )
+        logger.info(f"Leaderboard saved to {leaderboard_path}")
+        return str(leaderboard_path)
+
+    def fine_tune(
+        self,
+        X: pd.DataFrame,
+        y: pd.Series,
+        epochs: int = DEFAULT_FINE_TUNE_EPOCHS,
+        learning_rate: Optional[float] = None,
+    ) -> None:
+        """
+        Continue training the current model on new samples only.
+
+        Estimators with ``partial_fit`` (e.g. SGDClassifier) run exactly
+        ``epochs`` passes over the samples with a constant step size of
+        ``learning_rate``. Estimators with ``warm_start`` resume from their
+        current state: LogisticRegression for at most ``epochs`` solver
+        iterations and HistGradientBoosting with ``epochs`` more boosting
+        iterations; the warm-start settings are restored afterwards, so the
+        saved model keeps its configured values.
+        Unfitted models and estimators that cannot learn incrementally
+        (trees and forests, whose existing trees never see new samples) are
+        fit on the samples from scratch.
+
+        Args:
+            X: Feature matrix of the new samples
+            y: Target vector of the new samples
+            epochs: Fine-tuning epochs: passes over the samples for
+                ``partial_fit`` models, solver iterations (LogisticRegression)
+                or boosting iterations (HistGradientBoosting) for
+                ``warm_start`` models; ignored by models that are refit
+            learning_rate: Optional constant step size for SGD-based models
+
+        Raises:
+            ValueError: If epochs is not positive or no sample has a known class
+        """
+        if epochs < 1:
+            raise ValueError(f"epochs must be positive, got {epochs}")
+
+        model_name = type(self.model).__name__
+        params = self.model.get_params()
+
+        if hasattr(self.model, "partial_fit"):
+            if learning_rate is not None and "eta0" in params:
+                self.model.set_params(learning_rate="constant", eta0=learning_rate)
+
+            classes = getattr(self.model, "classes_", None)
+            if classes is None:
+                classes = np.unique(y)
+            else:
+                # partial_fit cannot add classes to an already fitted model
+                known = np.isin(y, classes)
+                if not known.all():
+                    logger.warning(f"Skipping {int((~known).sum())} samples with classes unknown to the model")
+                    X, y = X[known], y[known]
+                if len(y) == 0:
+                    raise ValueError("No fine-tuning samples with a class known to the model")
+
+            for epoch in range(epochs):
+                self.model.partial_fit(X, y, classes=classes)
+                logger.debug(f"Epoch {epoch + 1}/{epochs} complete")
+            logger.info(f"Fine-tuned {model_name} with {epochs} passes over {len(X)} samples")
+        elif not hasattr(self.model, "classes_"):
+            logger.info(f"No fitted {model_name} to resume; training from scratch on {len(X)} samples")
+            self.model.fit(X, y)
+        elif "warm_start" in params and "n_estimators" not in params:
+            if learning_rate is not None:
+                logger.info(f"{model_name} has no learning rate; ignoring learning_rate={learning_rate}")
+            from sklearn.exceptions import ConvergenceWarning
+
+            if hasattr(self.model, "n_trees_per_iteration_"):
+                # Histogram gradient boosting continues from its last iteration
+                resume, unit = {"max_iter": self.model.n_iter_ + epochs}, "more boosting iterations"
+            else:
+                resume, unit = {"max_iter": epochs}, "warm-start iterations"
+
+            restore = {name: params[name] for name in ("warm_start", *resume)}
+            self.model.set_params(warm_start=True, **resume)
+            try:
+                with warnings.catch_warnings():
+                    # The iteration cap is intentional when resuming
+                    warnings.simplefilter("ignore", ConvergenceWarning)
+                    self.model.fit(X, y)
+            finally:
+                self.model.set_params(**restore)
+            logger.info(f"Fine-tuned {model_name} with {epochs} {unit} over {len(X)} samples")
+        else:
+            logger.warning(f"{model_name} cannot be trained incrementally; refitting on {len(X)} samples")
+            self.model.fit(X, y)
+
+    def fit_model(
+        self,
+        X: pd.DataFrame,
+        y: pd.Series,
+        fine_tune: bool = False,
+        epochs: int = DEFAULT_FINE_TUNE_EPOCHS,
+        learning_rate: Optional[float] = None,
+    ) -> None:
+        """
+        Fit the current model from scratch or fine-tune it.
+
+        Args:
+            X: Feature matrix
+            y: Target vector
+            fine_tune: Continue training the current model (see ``fine_tune``)
+            epochs: Fine-tuning epochs; their meaning depends on the
+                estimator (see ``fine_tune``)
+            learning_rate: Optional step size when fine-tuning
+        """
+        with self.profiler.phase("fit"), self.thread_limits():
+            if fine_tune:
+                logger.info(f"Fine-tuning model for {epochs} epochs...")
+                self.fine_tune(X, y, epochs=epochs, learning_rate=learning_rate)
+            else:
+                logger.info("Training model...")
+                self.model.fit(X, y)
+        logger.info("Training complete")
+
+    def train_and_evaluate(
+        self,
+        X: pd.DataFrame,
+        y: pd.Series,
+        fine_tune: bool = False,
+        epochs: int = DEFAULT_FINE_TUNE_EPOCHS,
+        learning_rate: Optional[float] = None,
+        cv_folds: Optional[int] = None,
+        n_jobs: Optional[int] = None,
+    ) -> Dict[str, float]:
         """
         Train the model and evaluate its performance.
 
+        By default the model is evaluated on a stratified 80/20 split. With
+        ``cv_folds`` it is evaluated with stratified k-fold cross-validation,
+        the folds running in parallel worker processes (see
+        ``cross_validation``), and the final model is refit once on all data.
+
         Args:
             X: Feature matrix
             y: Target vector
+            fine_tune: Continue training the current model (see ``fine_tune``)
+                instead of fitting it from scratch
+            epochs: Fine-tuning epochs on the training split (see ``fine_tune``)
+            learning_rate: Optional step size when fine-tuning
+            cv_folds: Optional number of cross-validation folds (at least 2)
+            n_jobs: Worker processes for cross-validation (default: all cores)
 
         Returns:
-            Dictionary containing evaluation metrics
+            Dictionary containing evaluation metrics: weighted and macro
+            averages on the split (the full report with per-class scores,
+            probability metrics and bootstrap intervals is kept in
+            ``evaluation``), or the fold means plus ``<metric>_std`` keys
+            when cross-validating
         """
+        if cv_folds:
+            return self._cross_validate(X, y, cv_folds, fine_tune, epochs, learning_rate, n_jobs)
+
         # Split data with reproducible random seed
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=0.2, random_state=self.random_seed, stratify=y
-        )
+        X_train, X_test, y_train, y_test = self.split_data(X, y)
 
         logger.info(f"Data split: {len(X_train)} training, {len(X_test)} test samples")
 
         # Train the model
-        logger.info("Training model...")
-        self.model.fit(X_train, y_train)
-        logger.info("Training complete")
+        self.fit_model(X_train, y_train, fine_tune=fine_tune, epochs=epochs, learning_rate=learning_rate)
 
         # Make predictions
-        y_pred = self.model.predict(X_test)
-
-        # Calculate metrics
-        accuracy = accuracy_score(y_test, y_pred)
-        precision = precision_score(y_test, y_pred, average="weighted", zero_division=0)
-        recall = recall_score(y_test, y_pred, average="weighted", zero_division=0)
-        f1 = f1_score(y_test, y_pred, average="weighted", zero_division=0)
-
-        self.metrics = {
-            "accuracy": float(accuracy),
-            "precision": float(precision),
-            "recall": float(recall),
-            "f1_score": float(f1),
+        with self.profiler.phase("predict"), self.thread_limits():
+            y_pred = self.model.predict(X_test)
+            probabilities = self.model.predict_proba(X_test) if hasattr(self.model, "predict_proba") else None
+
+        # Every label metric and its bootstrap interval come from one confusion matrix
+        with self.profiler.phase("metrics"):
+            self.evaluation = evaluate(
+                y_test, y_pred, probabilities, getattr(self.model, "classes_", None), **self.evaluation_options()
+            )
+            self.metrics = self.evaluation.pop("metrics")
+
+        logger.info(
+            f"Metrics: accuracy={self.metrics['accuracy']:.4f}, precision={self.metrics['precision']:.4f}, "
+            f"recall={self.metrics['recall']:.4f}, f1={self.metrics['f1_score']:.4f}"
+        )
+        self._log_intervals()
+
+        return self.metrics
+
+    def train_streaming(
+        self,
+        data_path: str,
+        chunk_size: int,
+        epochs: int = 1,
+        learning_rate: Optional[float] = None,
+    ) -> Dict[str, float]:
+        """
+        Train the current model out of core on a dataset read in chunks.
+
+        The dataset is streamed once to find the classes (unless the model
+        already has them), ``epochs`` times through ``partial_fit`` and once
+        more to evaluate on a hashed holdout (see ``streaming``), so peak
+        memory depends on ``chunk_size`` rather than the dataset size.
+
+        Args:
+            data_path: Path to the CSV, Parquet or Feather file
+            chunk_size: Rows per chunk
+            epochs: Number of passes over the training rows
+            learning_rate: Optional constant step size for SGD-based models
+
+        Returns:
+            Dictionary containing evaluation metrics
+
+        Raises:
+            MissingFeatureError: If required columns are missing
+            ValueError: If the model has no partial_fit or the dataset is empty
+        """
+        from .streaming import evaluate_streaming, fit_streaming, iter_dataset_chunks, stream_classes
+
+        features = self.config["input_features"]
+        target_column = self.config["target_column"]
+        dtypes = self.column_dtypes()
+
+        def chunks():
+            return iter_dataset_chunks(data_path, features + [target_column], dtypes, chunk_size)
+
+        with self.profiler.phase("validate"):
+            head = chunks()
+            try:
+                self.validate_data(next(head))
+            except StopIteration:
+                raise ValueError(f"Dataset is empty: {data_path}")
+            finally:
+                head.close()
+
+        if learning_rate is not None and "eta0" in self.model.get_params():
+            self.model.set_params(learning_rate="constant", eta0=learning_rate)
+
+        classes = getattr(self.model, "classes_", None)
+        if classes is None:
+            with self.profiler.phase("scan_classes"):
+                classes = stream_classes(iter_dataset_chunks(data_path, [target_column], dtypes, chunk_size), target_column)
+
+        logger.info(f"Streaming {data_path} in chunks of {chunk_size} rows for {epochs} epochs")
+        with self.profiler.phase("fit"):
+            stats = fit_streaming(self.model, chunks, features, target_column, classes, self.random_seed, epochs)
+        with self.profiler.phase("evaluate"):
+            evaluation = evaluate_streaming(self.model, chunks, features, target_column, classes, self.random_seed)
+
+        self.stream_stats = {
+            **stats,
+            "holdout_rows": evaluation["holdout_rows"],
+            "skipped_rows": stats["rows"] - stats["train_rows"] - evaluation["holdout_rows"],
+            "chunk_size": chunk_size,
+            "classes": classes.tolist(),
+            "confusion_matrix": evaluation["confusion_matrix"],
         }
+        self.evaluation = evaluate_confusion(evaluation["confusion_matrix"], classes, **self.evaluation_options())
+        self.metrics = self.evaluation.pop("metrics")
 
-        logger.info(f"Metrics: accuracy={accuracy:.4f}, precision={precision:.4f}, recall={recall:.4f}, f1={f1:.4f}")
+        logger.info(
+            f"Streaming metrics ({evaluation['holdout_rows']} holdout rows): accuracy={self.metrics['accuracy']:.4f}, "
+            f"precision={self.metrics['precision']:.4f}, recall={self.metrics['recall']:.4f}, "
+            f"f1={self.metrics['f1_score']:.4f}"
+        )
+        self._log_intervals()
+
+        return self.metrics
+
+    def _log_intervals(self) -> None:
+        """Log the bootstrap intervals of the headline metrics, if computed."""
+        intervals = self.evaluation.get("confidence_intervals")
+        if not intervals:
+            return
+        bounds = ", ".join(
+            f"{name}=[{intervals[name]['low']:.4f}, {intervals[name]['high']:.4f}]" for name in ("accuracy", "f1_score")
+        )
+        logger.info(f"{self.evaluation['confidence']:.0%} bootstrap intervals ({self.evaluation['n_bootstrap']} resamples): {bounds}")
+
+    def _cross_validate(
+        self,
+        X: pd.DataFrame,
+        y: pd.Series,
+        cv_folds: int,
+        fine_tune: bool,
+        epochs: int,
+        learning_rate: Optional[float],
+        n_jobs: Optional[int],
+    ) -> Dict[str, float]:
+        """Cross-validate the model and refit it on all data (see ``train_and_evaluate``)."""
+        from .cross_validation import cross_validate
+
+        with self.profiler.phase("cross_validate"):
+            self.cv_results = cross_validate(
+                self.model,
+                X,
+                y,
+                n_folds=cv_folds,
+                random_seed=self.random_seed,
+                fine_tune=fine_tune,
+                epochs=epochs,
+                learning_rate=learning_rate,
+                n_jobs=n_jobs,
+                refit=lambda: self.fit_model(X, y, fine_tune=fine_tune, epochs=epochs, learning_rate=learning_rate),
+            )
+
+        mean, std = self.cv_results["mean"], self.cv_results["std"]
+        self.metrics = {**mean, **{f"{name}_std": value for name, value in std.items()}}
+
+        logger.info(
+            f"{cv_folds}-fold metrics: accuracy={mean['accuracy']:.4f}±{std['accuracy']:.4f}, "
+            f"precision={mean['precision']:.4f}±{std['precision']:.4f}, "
+            f"recall={mean['recall']:.4f}±{std['recall']:.4f}, f1={mean['f1_score']:.4f}±{std['f1_score']:.4f}"
+        )
 
         return self.metrics
 
@@ -219,8 +987,9 @@ class ModelTrainer:
         filepath = output_path / filename
 
         logger.info(f"Saving model to {filepath}...")
-        joblib.dump(self.model, filepath)
-        logger.info("Model saved successfully")
+        with self.profiler.phase("save"):
+            info = save_artifact(self.model, filepath)
+        logger.info(f"Model saved successfully ({info['mapped_arrays']} memory-mapped arrays)")
 
         return str(filepath)
 
@@ -228,18 +997,71 @@ class ModelTrainer:
         """
         Load an existing model for fine-tuning.
 
+        The artifact is mapped copy-on-write: fine-tuning updates its arrays
+        in place, which a read-only mapping would not allow.
+
         Args:
             model_path: Path to the existing model file
+
+        Raises:
+            TrainingError: If the model cannot be loaded
         """
         try:
-            self.model = joblib.load(model_path)
+            with self.profiler.phase("load_model"):
+                self.model = load_artifact(model_path, mmap_mode="c")
             logger.info(f"Loaded existing model from {model_path}")
-        except FileNotFoundError:
-            logger.error(f"Model file not found: {model_path}")
-            sys.exit(1)
+        except FileNotFoundError as e:
+            raise TrainingError(f"Model file not found: {model_path}") from e
         except Exception as e:
-            logger.error(f"Failed to load model: {e}")
-            sys.exit(1)
+            raise TrainingError(f"Failed to load model: {e}") from e
+
+    def config_mismatch(self, model: Any) -> Optional[str]:
+        """
+        Check that a fitted model can be fine-tuned under the current config.
+
+        Args:
+            model: Loaded estimator
+
+        Returns:
+            Why the model does not match the configured model type and input
+            features, or None if it matches
+        """
+        model_type = self.config["model_type"]
+        expected_class = MODEL_TYPES.get(model_type, "").rpartition(":")[2]
+        if type(model).__name__ != expected_class:
+            return f"it is a {type(model).__name__}, but the config trains {model_type}"
+
+        features = list(self.config.get("input_features", []))
+        names = getattr(model, "feature_names_in_", None)
+        if names is not None and list(names) != features:
+            return f"it was trained on features {list(names)}, but the config has {features}"
+        n_features = getattr(model, "n_features_in_", None)
+        if n_features is not None and n_features != len(features):
+            return f"it was trained on {n_features} features, but the config has {len(features)}"
+        return None
+
+    def load_model_for_fine_tuning(self, model_path: str, learning_rate: Optional[float] = None) -> bool:
+        """
+        Load a model to fine-tune, or create a new one if it does not match the config.
+
+        Args:
+            model_path: Path to the existing model file
+            learning_rate: Learning rate passed to ``create_model`` when falling back
+
+        Returns:
+            True if the existing model was loaded, False if a new model was created
+
+        Raises:
+            TrainingError: If the model cannot be loaded
+        """
+        self.load_existing_model(model_path)
+        mismatch = self.config_mismatch(self.model)
+        if mismatch is None:
+            return True
+
+        logger.warning(f"Not fine-tuning {model_path}: {mismatch}; training a new model instead")
+        self.create_model(learning_rate=learning_rate)
+        return False
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -252,7 +1074,7 @@ def parse_arguments() -> argparse.Namespace:
         "--dataset",
         type=str,
         required=True,
-        help="Path to training dataset (CSV file)",
+        help="Path to training dataset (CSV, Parquet or Feather file)",
     )
 
     parser.add_argument(
@@ -294,7 +1116,47 @@ def parse_arguments() -> argparse.Namespace:
         "--epochs",
         type=int,
         default=5,
-        help="Number of training epochs (default: 5)",
+        help=(
+            "Fine-tuning epochs, whose meaning depends on the model: passes over the new "
+            "samples for SGDClassifier (and over the data with --chunk_size), at most this many "
+            "solver iterations for LogisticRegression (not passes), more boosting iterations "
+            "for HistGradientBoosting; ignored by trees and forests, which are refit (default: 5)"
+        ),
+    )
+
+    parser.add_argument(
+        "--n_jobs",
+        type=int,
+        default=None,
+        help="Worker processes for hyperparameter search and cross-validation (default: all cores)",
+    )
+
+    parser.add_argument(
+        "--cv_folds",
+        type=int,
+        default=None,
+        help="Evaluate with stratified k-fold cross-validation instead of an 80/20 split (k >= 2)",
+    )
+
+    parser.add_argument(
+        "--chunk_size",
+        type=int,
+        default=None,
+        help="Stream the dataset in chunks of this many rows through partial_fit (out-of-core training)",
+    )
+
+    parser.add_argument(
+        "--use_cache",
+        type=lambda x: x.lower() in ("true", "1", "yes"),
+        default=True,
+        help="Reuse the model of an earlier run with identical inputs (default: True)",
+    )
+
+    parser.add_argument(
+        "--trace_memory",
+        type=lambda x: x.lower() in ("true", "1", "yes"),
+        default=False,
+        help="Record peak Python allocations per phase with tracemalloc (slower; default: False)",
     )
 
     parser.add_argument(
@@ -307,110 +1169,269 @@ def parse_arguments() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def main():
-    """Main execution function."""
-    args = parse_arguments()
-
+def train(
+    dataset: str,
+    config: str = "model_config.yaml",
+    output_dir: Optional[str] = None,
+    fine_tune: bool = False,
+    model_path: Optional[str] = None,
+    learning_rate: float = DEFAULT_LEARNING_RATE,
+    epochs: int = DEFAULT_FINE_TUNE_EPOCHS,
+    n_jobs: Optional[int] = None,
+    cv_folds: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    use_cache: bool = True,
+    skip_if_up_to_date: bool = False,
+    trace_memory: bool = False,
+    random_seed: int = 42,
+) -> TrainingResult:
+    """
+    Train, evaluate and save a model - the programmatic form of the CLI.
+
+    Args:
+        dataset: Path to the CSV, Parquet or Feather training dataset
+        config: Path to the model configuration YAML
+        output_dir: Directory for the model (default: models dir, or the
+            retrained models dir when fine-tuning)
+        fine_tune: Continue training the model at ``model_path``
+        model_path: Existing model to fine-tune
+        learning_rate: Step size when fine-tuning
+        epochs: Passes over the data when streaming; when fine-tuning, their
+            meaning depends on the estimator (see ``ModelTrainer.fine_tune``)
+        n_jobs: Worker processes for hyperparameter search and cross-validation
+        cv_folds: Evaluate with k-fold cross-validation instead of an 80/20 split
+        chunk_size: Stream the dataset in chunks (out-of-core training)
+        use_cache: Reuse the model of an earlier run with identical inputs
+        skip_if_up_to_date: When fine-tuning, also reuse ``model_path`` as is
+            if an earlier run with this flag produced it by fine-tuning on
+            identical data, config and options (repeated retraining on an
+            unchanged dataset); such runs record their output for this check
+        trace_memory: Record tracemalloc allocation peaks per phase
+        random_seed: Random seed for reproducibility
+
+    Returns:
+        TrainingResult of the run
+
+    Raises:
+        TrainingError: If the run fails (the failure is also recorded in system_logs)
+    """
     logger.info("="*60)
     logger.info("ML Pipeline Model Training")
     logger.info("="*60)
-    logger.info(f"Dataset: {args.dataset}")
-    logger.info(f"Config: {args.config}")
-    logger.info(f"Fine-tune: {args.fine_tune}")
-    if args.fine_tune and args.model_path:
-        logger.info(f"Model path: {args.model_path}")
-    logger.info(f"Learning rate: {args.learning_rate}")
-    logger.info(f"Epochs: {args.epochs}")
+    logger.info(f"Dataset: {dataset}")
+    logger.info(f"Config: {config}")
+    logger.info(f"Fine-tune: {fine_tune}")
+    if fine_tune and model_path:
+        logger.info(f"Model path: {model_path}")
+    logger.info(f"Learning rate: {learning_rate}")
+    logger.info(f"Epochs: {epochs}")
+    if cv_folds:
+        logger.info(f"Cross-validation folds: {cv_folds}")
+    if chunk_size:
+        logger.info(f"Streaming chunk size: {chunk_size}")
     logger.info("="*60)
 
     # Log training start
     insert_system_log(
         component="train_model",
         status="info",
-        message=f"Training started: {'fine-tune' if args.fine_tune else 'from scratch'}",
+        message=f"Training started: {'fine-tune' if fine_tune else 'from scratch'}",
         details={
-            "dataset": args.dataset,
-            "fine_tune": args.fine_tune,
-            "learning_rate": args.learning_rate,
-            "epochs": args.epochs,
+            "dataset": dataset,
+            "fine_tune": fine_tune,
+            "learning_rate": learning_rate,
+            "epochs": epochs,
+            "cv_folds": cv_folds,
+            "chunk_size": chunk_size,
         }
     )
 
+    profiler = PhaseProfiler(trace_memory=trace_memory)
+
     try:
         # Initialize trainer
-        trainer = ModelTrainer(config_path=args.config, random_seed=args.random_seed)
+        trainer = ModelTrainer(config_path=config, random_seed=random_seed, profiler=profiler)
 
         # Load configuration
         trainer.load_config()
 
-        # Load and validate data
-        X, y = trainer.load_data(args.dataset)
-        
-        # Log dataset prepared
-        insert_system_log(
-            component="train_model",
-            status="info",
-            message=f"Dataset prepared: {len(X)} samples",
-            details={"dataset_size": len(X), "features": len(X.columns)}
-        )
-
-        # Create or load model
-        if args.fine_tune and args.model_path:
-            trainer.load_existing_model(args.model_path)
+        # Identical dataset, config, seed and options reproduce the same model
+        base_model_path = model_path if fine_tune else None
+        cache_options = {
+            "fine_tune": fine_tune,
+            # Streaming runs make `epochs` passes even when training from scratch
+            "epochs": epochs if fine_tune or chunk_size else None,
+            "learning_rate": learning_rate if fine_tune else None,
+            "cv_folds": cv_folds,
+            "chunk_size": chunk_size,
+        }
+        cache_key = None
+        if use_cache:
+            with profiler.phase("cache_lookup"):
+                cache_key = trainer.cache_key(dataset, base_model_path, cache_options)
+                cached_output = training_cache.lookup(cache_key)
+                if cached_output is None and skip_if_up_to_date and base_model_path:
+                    # The base model may itself be the output of fine-tuning on this data
+                    cached_output = training_cache.lookup(
+                        trainer.output_cache_key(dataset, base_model_path, cache_options)
+                    )
+            if cached_output is not None:
+                logger.info(f"Cache hit {cache_key[:12]}: reusing {cached_output['model_path']}")
+                result = TrainingResult.from_dict(
+                    cached_output, cache_hit=True, cache_key=cache_key, profile=profiler.to_dict()
+                )
+                insert_system_log(
+                    component="train_model",
+                    status="info",
+                    message="Training skipped: reused cached model",
+                    details={
+                        "cache_hit": True,
+                        "cache_key": cache_key,
+                        "metrics": result.metrics,
+                        "model_path": result.model_path,
+                        "dataset_size": result.dataset_size,
+                        "profile": result.profile,
+                    }
+                )
+                return result
+
+        if chunk_size:
+            # Out-of-core: the dataset is streamed through partial_fit and never loaded whole
+            if cv_folds:
+                raise ValueError("cv_folds is not supported with chunk_size")
+            if fine_tune and model_path:
+                trainer.load_model_for_fine_tuning(model_path, learning_rate=learning_rate)
+            else:
+                if trainer.config.get("search"):
+                    logger.warning("Hyperparameter search is not supported with chunk_size; using the configured hyperparameters")
+                trainer.create_model(learning_rate=learning_rate if fine_tune else None)
+
+            metrics = trainer.train_streaming(
+                dataset,
+                chunk_size=chunk_size,
+                epochs=epochs,
+                learning_rate=learning_rate if fine_tune else None,
+            )
+            dataset_size = trainer.stream_stats["rows"]
         else:
-            trainer.create_model(learning_rate=args.learning_rate if args.fine_tune else None)
+            # Load and validate data
+            X, y = trainer.load_data(dataset)
+            dataset_size = len(X)
+
+            # Log dataset prepared
+            insert_system_log(
+                component="train_model",
+                status="info",
+                message=f"Dataset prepared: {len(X)} samples",
+                details={"dataset_size": len(X), "features": len(X.columns)}
+            )
 
-        # Train and evaluate
-        metrics = trainer.train_and_evaluate(X, y)
+            # Create or load model
+            if fine_tune and model_path:
+                trainer.load_model_for_fine_tuning(model_path, learning_rate=learning_rate)
+            elif trainer.config.get("search") and not fine_tune:
+                trainer.search_hyperparameters(X, y, n_jobs=n_jobs)
+            else:
+                trainer.create_model(learning_rate=learning_rate if fine_tune else None)
+
+            # Train and evaluate (fine-tuning runs exactly `epochs` passes over the new samples)
+            metrics = trainer.train_and_evaluate(
+                X,
+                y,
+                fine_tune=fine_tune,
+                epochs=epochs,
+                learning_rate=learning_rate if fine_tune else None,
+                cv_folds=cv_folds,
+                n_jobs=n_jobs,
+            )
 
         # Save model
-        output_dir = args.output_dir or (str(RETRAINED_MODELS_DIR) if args.fine_tune else str(MODELS_DIR))
-        model_path = trainer.save_model(output_dir)
+        if output_dir is None:
+            ensure_directories()
+            output_dir = str(RETRAINED_MODELS_DIR) if fine_tune else str(MODELS_DIR)
+        saved_model_path = trainer.save_model(output_dir)
+        leaderboard_path = trainer.save_leaderboard(saved_model_path)
+
+        result = TrainingResult(
+            model_path=saved_model_path,
+            metrics=metrics,
+            dataset_size=dataset_size,
+            cache_key=cache_key,
+            leaderboard=trainer.leaderboard,
+            leaderboard_path=leaderboard_path,
+            cross_validation=trainer.cv_results,
+            streaming=trainer.stream_stats,
+            evaluation=trainer.evaluation,
+        )
+
+        if cache_key is not None:
+            training_cache.store(cache_key, result.cacheable_output())
+            if skip_if_up_to_date and fine_tune:
+                training_cache.store(
+                    trainer.output_cache_key(dataset, saved_model_path, cache_options), result.cacheable_output()
+                )
 
         # Log training success
+        profiler.log_summary()
+        result.profile = profiler.to_dict()
         insert_system_log(
             component="train_model",
             status="info",
             message=f"Training completed successfully",
             details={
                 "metrics": metrics,
-                "model_path": model_path,
-                "dataset_size": len(X),
+                "model_path": saved_model_path,
+                "dataset_size": dataset_size,
+                "cache_hit": False,
+                "cache_key": cache_key,
+                "profile": result.profile,
             }
         )
-
-        # Output metrics as JSON for integration with auto_reinforcement.py
-        metrics_output = {
-            "status": "success",
-            "model_path": model_path,
-            "metrics": metrics,
-            "dataset_size": len(X),
-            "timestamp": datetime.now().isoformat(),
-        }
-
-        print(json.dumps(metrics_output, indent=2))
         logger.info("Training completed successfully")
 
-        return 0
-    
+        return result
+
     except Exception as e:
         # Log error with stack trace
         error_details = {
             "error": str(e),
             "error_type": type(e).__name__,
             "traceback": traceback.format_exc(),
+            "profile": profiler.to_dict(),
         }
-        
+
         insert_system_log(
             component="train_model",
             status="error",
             message=f"Training failed: {str(e)}",
             details=error_details
         )
-        
+
         logger.error(f"Training failed: {e}", exc_info=True)
+        if isinstance(e, TrainingError):
+            raise
+        raise TrainingError(str(e)) from e
+    finally:
+        profiler.close()
+
+
+def main():
+    """Main execution function."""
+    logging.basicConfig(
+        level=getattr(logging, LOG_LEVEL),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    args = parse_arguments()
+
+    try:
+        result = train(**vars(args))
+    except TrainingError:
         return 1
 
+    # Output metrics as JSON for integration with other tools
+    print(json.dumps(result.to_dict(), indent=2))
+    return 0
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+Content-addressed training cache - reuse model artifacts trained on identical inputs
+
+A training run is identified by the SHA-256 of everything that determines its
+output: the dataset file contents, the model config, the random seed, the
+training options and, when fine-tuning, the contents of the base model. The
+index maps each key to the saved artifact and its training output as one JSON
+file per key under ``TRAINING_CACHE_DIR``; entries whose artifact has been
+deleted or overwritten since are ignored.
+
+Fine-tuning runs that opt in (``train(skip_if_up_to_date=True)``, used by
+the reinforcement loop) also record their output model under a second key,
+so a later run continuing from that model on the same data reuses it.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .config import TRAINING_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: str) -> str:
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compute_cache_key(
+    dataset_path: str,
+    config: Dict[str, Any],
+    random_seed: int,
+    base_model_path: Optional[str] = None,
+    options: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Compute the cache key of a training run.
+
+    Args:
+        dataset_path: Path to the training dataset
+        config: Model configuration
+        random_seed: Random seed of the run
+        base_model_path: Model being fine-tuned, if any
+        options: Other options affecting the trained model (e.g. epochs)
+
+    Returns:
+        SHA-256 hex digest identifying the run's inputs
+    """
+    inputs = {
+        "dataset": hash_file(dataset_path),
+        "config": config,
+        "random_seed": random_seed,
+        "base_model": hash_file(base_model_path) if base_model_path else None,
+        "options": options or {},
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def lookup(key: str, cache_dir: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """
+    Find the cached training output for a key.
+
+    Args:
+        key: Cache key (see ``compute_cache_key``)
+        cache_dir: Index directory (default: TRAINING_CACHE_DIR)
+
+    Returns:
+        Cached training output, or None if there is no usable entry
+    """
+    entry_path = Path(cache_dir or TRAINING_CACHE_DIR) / f"{key}.json"
+    try:
+        with open(entry_path) as f:
+            entry = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cache entry {entry_path}: {e}")
+        return None
+
+    output = entry.get("output", {})
+    model_path = output.get("model_path")
+    if not model_path or not Path(model_path).is_file():
+        logger.info(f"Cached artifact for {key[:12]} no longer exists: {model_path}")
+        return None
+    if hash_file(model_path) != entry.get("model_sha256"):
+        logger.info(f"Cached artifact for {key[:12]} has changed since it was cached: {model_path}")
+        return None
+    return output
+
+
+def store(key: str, output: Dict[str, Any], cache_dir: Optional[Path] = None) -> Path:
+    """
+    Record the training output of a key.
+
+    Args:
+        key: Cache key (see ``compute_cache_key``)
+        output: Training output, including ``model_path`` and ``metrics``
+        cache_dir: Index directory (default: TRAINING_CACHE_DIR)
+
+    Returns:
+        Path to the index entry
+    """
+    cache_path = Path(cache_dir or TRAINING_CACHE_DIR)
+    cache_path.mkdir(parents=True, exist_ok=True)
+    entry_path = cache_path / f"{key}.json"
+
+    # Write then rename so concurrent readers never see a partial entry
+    temp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(temp_path, "w") as f:
+        json.dump(
+            {
+                "key": key,
+                "created_at": datetime.now().isoformat(),
+                "model_sha256": hash_file(output["model_path"]),
+                "output": output,
+            },
+            f,
+            indent=2,
+            default=str,
+        )
+    os.replace(temp_path, entry_path)
+    logger.info(f"Cached training output {key[:12]} -> {output.get('model_path')}")
+    return entry_path
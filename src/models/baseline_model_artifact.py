@@ -1,6 +1,38 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Sequence
+import sys
+from itertools import islice
+from typing import Iterable, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+# ``sum()`` over floats uses compensated (Neumaier) summation from Python 3.12
+_COMPENSATED_SUM = sys.version_info >= (3, 12)
+
+# Rows scored per block by the streaming API
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def _row_sum(matrix: np.ndarray) -> np.ndarray:
+    """Sum each row left to right exactly like the built-in ``sum`` would."""
+    total = np.zeros(matrix.shape[0], dtype=np.float64)
+    if not _COMPENSATED_SUM:
+        for col in range(matrix.shape[1]):
+            total += matrix[:, col]
+        return total
+
+    compensation = np.zeros_like(total)
+    with np.errstate(invalid="ignore", over="ignore"):
+        for col in range(matrix.shape[1]):
+            value = matrix[:, col]
+            updated = total + value
+            compensation += np.where(
+                np.abs(total) >= np.abs(value),
+                (total - updated) + value,
+                (value - updated) + total,
+            )
+            total = updated
+        return np.where(np.isfinite(compensation), total + compensation, total)
 
 
 class BaselineScorelineModel:
@@ -24,7 +56,49 @@ class BaselineScorelineModel:
         magnitude = sum(abs(value) for value in vector) + 1.0
         return abs(weight + rotational + (magnitude * 0.01 * (class_index + 1)))
 
-    def predict_proba(self, rows: Iterable[Sequence[float]]) -> List[List[float]]:
+    def predict_proba_array(self, features: np.ndarray) -> np.ndarray:
+        """Score an (n_rows, n_features) matrix and return (n_rows, n_classes) probabilities.
+
+        Computes the magnitude once per row and scores every class with
+        broadcasting. Results are bit-identical to the per-row ``_score`` path.
+        """
+        matrix = np.asarray(features, dtype=np.float64)
+        if matrix.ndim != 2 or matrix.shape[1] == 0:
+            raise ValueError(f"Expected a non-empty (n_rows, n_features) matrix, got shape {matrix.shape}")
+
+        n_classes = len(self.classes_)
+        multiplier = np.arange(1, n_classes + 1, dtype=np.float64)
+        magnitude = _row_sum(np.abs(matrix)) + 1.0
+
+        # Same operation order as ``_score``, evaluated in place to bound peak memory
+        class_scores = matrix[:, np.arange(n_classes) % matrix.shape[1]]
+        class_scores *= 0.03
+        class_scores += multiplier * 0.17
+        class_scores += magnitude[:, None] * 0.01 * multiplier
+        np.abs(class_scores, out=class_scores)
+
+        total = _row_sum(class_scores)
+        zero = total == 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            class_scores /= total[:, None]
+        class_scores[zero] = 1.0 / n_classes
+        return class_scores
+
+    def predict_array(self, features: np.ndarray) -> np.ndarray:
+        """Return the most likely class label for each row of a feature matrix."""
+        return np.asarray(self.classes_, dtype=object)[np.argmax(self.predict_proba_array(features), axis=1)]
+
+    def _proba_block(self, rows: List[Sequence[float]]) -> np.ndarray:
+        """Score a materialized block of rows, vectorized when they form a numeric matrix."""
+        try:
+            matrix = np.asarray(rows, dtype=np.float64)
+        except (TypeError, ValueError):
+            # Ragged or non-numeric rows take the per-row path below
+            matrix = None
+        # NaN may come from None, which the per-row path rejects like before
+        if matrix is not None and matrix.ndim == 2 and matrix.shape[1] > 0 and not np.isnan(matrix).any():
+            return self.predict_proba_array(matrix)
+
         probabilities: List[List[float]] = []
         for row in rows:
             safe_vector = [float(value) for value in row]
@@ -35,11 +109,55 @@ class BaselineScorelineModel:
             else:
                 normalized = [score / total for score in class_scores]
             probabilities.append(normalized)
-        return probabilities
+        return np.array(probabilities, dtype=np.float64).reshape(len(probabilities), len(self.classes_))
+
+    def iter_predict_proba(
+        self, rows: Iterable[Sequence[float]], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[np.ndarray]:
+        """Lazily score any iterable of rows in fixed-size chunks.
+
+        Only one chunk of rows is held at a time, so generators reading from
+        disk can be scored in constant memory.
+
+        Yields:
+            (chunk_rows, n_classes) probability blocks in input order
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        if isinstance(rows, np.ndarray) and rows.ndim == 2:
+            for start in range(0, len(rows), chunk_size):
+                yield self.predict_proba_array(rows[start:start + chunk_size])
+            return
+
+        iterator = iter(rows)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield self._proba_block(chunk)
+
+    def iter_predict(
+        self,
+        rows: Iterable[Sequence[float]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        with_proba: bool = False,
+    ) -> Iterator[Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]]:
+        """Lazily predict labels for any iterable of rows in fixed-size chunks.
+
+        Yields:
+            Object arrays of class labels per chunk, or (labels, probabilities)
+            pairs when ``with_proba`` is set
+        """
+        labels = np.asarray(self.classes_, dtype=object)
+        for probabilities in self.iter_predict_proba(rows, chunk_size):
+            block = labels[np.argmax(probabilities, axis=1)]
+            yield (block, probabilities) if with_proba else block
+
+    def predict_proba(self, rows: Iterable[Sequence[float]]) -> List[List[float]]:
+        return self._proba_block(list(rows)).tolist()
 
     def predict(self, rows: Iterable[Sequence[float]]) -> List[str]:
         results: List[str] = []
-        for probabilities in self.predict_proba(rows):
-            max_index = max(range(len(probabilities)), key=probabilities.__getitem__)
-            results.append(self.classes_[max_index])
+        for labels in self.iter_predict(rows):
+            results.extend(labels.tolist())
         return results
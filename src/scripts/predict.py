@@ -9,9 +9,12 @@ import yaml
 import pandas as pd
 from pathlib import Path
 from sklearn.linear_model import LogisticRegression
-import joblib
 import numpy as np
 
+# Model artifacts are written by ml_pipeline (one directory up)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from ml_pipeline.artifacts import load_artifact
+
 
 def load_config(config_path: str = "model_config.yaml") -> dict:
     """Load the ML configuration from YAML file."""
@@ -22,13 +25,14 @@ def load_config(config_path: str = "model_config.yaml") -> dict:
 def load_model(model_id: str, model_path: str = "models/") -> object:
     """
     Load a trained model from disk.
-    Note: In a real implementation, this would load the actual trained model.
-    For demo purposes, we'll create a mock model.
+    The artifact is memory-mapped read-only, so prediction processes serving
+    the same model share one page-cached copy of its arrays.
+    Note: For demo purposes, a mock model is created when the file is missing.
     """
     model_file = Path(model_path) / f"{model_id}.pkl"
     
     if model_file.exists():
-        return joblib.load(model_file)
+        return load_artifact(model_file, mmap_mode="r")
     else:
         # Create a mock model for demonstration
         print(f"⚠️  Mock model created for {model_id} (real model not found)")
@@ -87,10 +87,31 @@ def validate_training(training: Dict[str, Any]) -> None:
             raise ValueError(f"Missing required field in training: {field}")
     
     # Validate algorithm
-    valid_algorithms = ["LogisticRegression", "DecisionTree", "RandomForest"]
+    valid_algorithms = [
+        "LogisticRegression",
+        "SGDClassifier",
+        "DecisionTree",
+        "RandomForest",
+        "ExtraTrees",
+        "HistGradientBoosting",
+    ]
     if training["algorithm"] not in valid_algorithms:
         raise ValueError(f"training.algorithm must be one of {valid_algorithms}")
     
+    # Validate the optional thread budget (-1 = all cores)
+    if "n_jobs" in training:
+        n_jobs = training["n_jobs"]
+        if not isinstance(n_jobs, int) or isinstance(n_jobs, bool) or n_jobs == 0:
+            raise ValueError("training.n_jobs must be a non-zero integer (-1 for all cores)")
+    
+    # Validate the optional categorical features (native support only)
+    if "categorical_features" in training:
+        categorical = training["categorical_features"]
+        if not isinstance(categorical, list) or not all(isinstance(feature, str) and feature.strip() for feature in categorical):
+            raise ValueError("training.categorical_features must be a list of non-empty strings")
+        if categorical and training["algorithm"] != "HistGradientBoosting":
+            raise ValueError("training.categorical_features requires the HistGradientBoosting algorithm")
+    
     # Validate random_seed
     if not isinstance(training["random_seed"], int):
         raise ValueError("training.random_seed must be an integer")
@@ -126,6 +147,10 @@ def validate_config(config: Dict[str, Any]) -> None:
     validate_meta(config["meta"])
     validate_inference(config["inference"])
     validate_training(config["training"])
+    
+    unknown = set(config["training"].get("categorical_features", [])) - set(config["inference"]["input_features"])
+    if unknown:
+        raise ValueError(f"training.categorical_features are not input features: {sorted(unknown)}")
 
 
 def main():